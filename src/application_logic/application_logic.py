@@ -1,10 +1,13 @@
 """Application logic module for game flow control."""
 
+from typing import List, Optional
 from src.business_logic.i_business_logic import IBusinessLogic # noqa
 from src.application_logic.i_application_logic import IApplicationLogic
 from src.util.color_code import ColorCode
 from src.util.feedback_color_code import FeedbackColorCode
+from src.business_logic.game_state import MAX_ROUNDS, MAX_STRING_LENGTH
 from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.business_logic.save_info import SaveInfo # noqa
 
 
 class ApplicationLogic(IApplicationLogic):
@@ -65,6 +68,8 @@ class ApplicationLogic(IApplicationLogic):
         """
         if not player_name or len(player_name.strip()) == 0:
             return "invalid_configuration"
+        if len(player_name.encode("utf-8")) > MAX_STRING_LENGTH:
+            return "invalid_configuration"
 
         try:
             pos = int(positions)
@@ -75,7 +80,7 @@ class ApplicationLogic(IApplicationLogic):
                 return "invalid_configuration"
             if not (1 <= col <= 8):
                 return "invalid_configuration"
-            if att < 0:
+            if not (0 <= att <= MAX_ROUNDS):
                 return "invalid_configuration"
 
             return self.business_logic.configure_game(player_name, pos, col, att)
@@ -176,10 +181,10 @@ class ApplicationLogic(IApplicationLogic):
             2 -> ColorCode.GREEN
             etc.
         """
-        for color in ColorCode:
-            if color.value == number:
-                return color
-        raise ValueError(f"No ColorCode found for number {number}")
+        try:
+            return ColorCode.from_value(number)
+        except ValueError:
+            raise ValueError(f"No ColorCode found for number {number}") from None
 
     def handle_code_input(self: "ApplicationLogic", code_input: str) -> str:
         """Handle code input from the user.
@@ -270,14 +275,37 @@ class ApplicationLogic(IApplicationLogic):
         self.business_logic.save_game_state()
         return self.get_current_game_action()
 
-    def load_game(self: "ApplicationLogic") -> str:
-        """Load the saved game state."""
+    def load_game(self: "ApplicationLogic", choice: Optional[str] = None) -> str:
+        """Load a saved game state.
+
+        Args:
+            choice: Number of the game in the list of saved games, defaults
+                to the most recently saved game
+
+        Returns:
+            str: Current game action, 'error' if the game cannot be loaded
+        """
+        file_path = None
+        if choice is not None:
+            saves = self.get_saved_games()
+            if not choice.isdigit() or not 1 <= int(choice) <= len(saves):
+                return "error"
+            file_path = saves[int(choice) - 1].file_name
         try:
-            self.business_logic.load_game_state()
+            self.business_logic.load_game_state(file_path)
             return self.get_current_game_action()
-        except FileNotFoundError:
+        except (FileNotFoundError, ValueError):
             return "error"
 
+    def get_saved_games(self: "ApplicationLogic") -> List[SaveInfo]:
+        """Get the saved games that can be resumed.
+
+        Returns:
+            List[SaveInfo]: Metadata of every saved game, the most recent
+                first
+        """
+        return self.business_logic.list_saved_games()
+
     def process_game_action(self: "ApplicationLogic",
                             action: str, user_input: str = None) -> str:
         """Process the next game action."""
@@ -369,7 +397,8 @@ class ApplicationLogic(IApplicationLogic):
 
         # Handle spezifische Aktionen
         if action == "save_game":
-            if self.business_logic.has_saved_game():
+            # Only a game saved before overwrites its own save slot
+            if self.business_logic.get_save_slot() is not None:
                 return "confirm_save"
             self.business_logic.save_game_state()
             return "save_game"
@@ -1,8 +1,10 @@
 """Interface module for application logic layer."""
 
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from src.business_logic.game_state import GameState # noqa
+from src.business_logic.save_info import SaveInfo # noqa
 
 
 class IApplicationLogic(ABC):
@@ -173,16 +175,30 @@ class IApplicationLogic(ABC):
         pass
 
     @abstractmethod
-    def load_game(self: "IApplicationLogic") -> str:
+    def load_game(self: "IApplicationLogic", choice: Optional[str] = None) -> str:
         """Load a previously saved game state.
 
         Loads a saved game state using the persistence manager.
 
+        Args:
+            choice: Number of the game in the list of saved games, defaults
+                to the most recently saved game
+
         Returns:
             str: Load operation result status ('error' if no save exists)
         """
         pass
 
+    @abstractmethod
+    def get_saved_games(self: "IApplicationLogic") -> List[SaveInfo]:
+        """Get the saved games that can be resumed.
+
+        Returns:
+            List[SaveInfo]: Metadata of every saved game, the most recent
+                first
+        """
+        pass
+
     @abstractmethod
     def can_start_game(self: "IApplicationLogic", next_action: str) -> bool:
         """Check if a game can be started with the given action.
@@ -3,6 +3,8 @@
 This package manages the game flow and rules:
     - business_logic: Main implementation coordinating UI and game logic
     - IBusinessLogic: Interface defining core business logic behavior
+    - SaveInfo: Metadata of a saved game listed to the player
+    - simulation: Headless computer versus computer games for benchmarking
 
 The business logic layer:
     - Validates user input
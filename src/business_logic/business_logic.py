@@ -1,6 +1,7 @@
 """Module for core business logic implementation."""
 
-from typing import List
+import time
+from typing import List, Optional
 from src.business_logic.coder.computer_coder import ComputerCoder # noqa
 from src.business_logic.coder.player_coder import PlayerCoder # noqa
 from src.business_logic.game_state import GameState # noqa
@@ -8,6 +9,12 @@ from src.business_logic.game_turn import GameTurn # noqa
 from src.business_logic.guesser.computer_guesser import ComputerGuesser # noqa
 from src.business_logic.guesser.player_guesser import PlayerGuesser # noqa
 from src.business_logic.i_business_logic import IBusinessLogic # noqa
+from src.business_logic.save_info import SaveInfo # noqa
+from src.business_logic.solver.sampling_budget import SamplingBudget
+from src.business_logic.solver.strategies import (
+    DEFAULT_STRATEGY,
+    available_strategies,
+)
 from src.network.network_service import NetworkService # noqa
 from src.persistence.i_persistence_manager import IPersistenceManager # noqa
 from src.util.color_code import ColorCode # noqa
@@ -22,7 +29,8 @@ class BusinessLogic(IBusinessLogic):
         - Player/Computer moves
         - Win/loss conditions
         - network gameplay
-        - Game persistence
+        - Game persistence, journaling offline games of a guessing player
+        - Archiving finished games
 
     Attributes:
         player_guesser: Player instance for guessing role
@@ -36,6 +44,18 @@ class BusinessLogic(IBusinessLogic):
         colors: Number of available colors
         positions: Number of positions in the code
         persistence_manager: Manager for saving/loading games
+        save_slot: Save slot of the current game, None until it is saved or
+            if it was not loaded from a save
+        solver_workers: Number of processes for the computer guesser's search
+        solver_strategy: Default solver strategy of the computer guesser
+        solver_sampling: Budget of the computer guesser's approximate search,
+            None always searches exactly
+        solver_time_limit: Default seconds per computer guess, None for no
+            deadline
+        game_result: "game_won" or "game_lost" once the game is over, None
+            while it is played
+        move_times: Seconds each turn of the game took, None for turns
+            played before the game was loaded
     """
 
     def __init__(self: "BusinessLogic", persistence_manager: IPersistenceManager) \
@@ -56,32 +76,69 @@ class BusinessLogic(IBusinessLogic):
         self.colors = 8
         self.positions = 5
         self.persistence_manager = persistence_manager
+        self.save_slot = None
         self.current_mode = None
-
-    def startgame(self: "BusinessLogic", role: str) -> str:
+        self.solver_workers = 1
+        self.solver_strategy = DEFAULT_STRATEGY
+        self.solver_sampling = SamplingBudget()
+        self.solver_time_limit = None
+        self.game_result = None
+        self.move_times: List[Optional[float]] = []
+        self.move_started = time.perf_counter()
+
+    def startgame(
+        self: "BusinessLogic",
+        role: str,
+        strategy: Optional[str] = None,
+        time_limit: Optional[float] = None,
+    ) -> str:
         """Start a new game with the given role.
 
         Args:
             role: Role of the player ('guesser', 'coder', 'online_guesser',
             'online_computer_guesser')
+            strategy: Solver strategy of the computer guesser, defaults to
+                the configured strategy
+            time_limit: Seconds per computer guess, defaults to the
+                configured time limit
 
         Returns:
             str: Result status of starting the game
         """
+        strategy = strategy or self.solver_strategy
+        if time_limit is None:
+            time_limit = self.solver_time_limit
+        if strategy not in available_strategies():
+            return "invalid_strategy"
         self.current_mode = role
+        self.save_slot = None
         if role == "guesser":
             self.player_guesser = PlayerGuesser()
             self.computer_coder = ComputerCoder(self.positions, self.colors)
             return self.start_as_guesser()
         elif role == "coder":
             self.player_coder = PlayerCoder()
-            self.computer_guesser = ComputerGuesser(self.positions, self.colors)
+            self.computer_guesser = ComputerGuesser(
+                self.positions,
+                self.colors,
+                self.solver_workers,
+                strategy,
+                sampling=self.solver_sampling,
+                time_limit=time_limit,
+            )
             return self.start_as_coder()
         elif role == "online_guesser":
             self.player_guesser = PlayerGuesser()
             return "need_server_connection"
         elif role == "online_computer_guesser":
-            self.computer_guesser = ComputerGuesser(self.positions, self.colors)
+            self.computer_guesser = ComputerGuesser(
+                self.positions,
+                self.colors,
+                self.solver_workers,
+                strategy,
+                sampling=self.solver_sampling,
+                time_limit=time_limit,
+            )
             return "need_server_connection"
         return "invalid_role"
 
@@ -98,10 +155,10 @@ class BusinessLogic(IBusinessLogic):
             return "need_guess_input"
         self.player_guesser.set_guess(guess_list)
         guess = self.player_guesser.make_guess()
-        turn = GameTurn(guess_list, [])
-        self.game_state.add_turn(turn)
 
         if self.network_service:
+            self.game_state.add_turn(GameTurn(guess_list, None))
+            self.record_move_time()
             guess_str = "".join(str(color.value) for color in guess_list)
             feedback_str = self.network_service.make_move(guess_str)
             if feedback_str is None:
@@ -110,11 +167,13 @@ class BusinessLogic(IBusinessLogic):
                 FeedbackColorCode.BLACK if c == "8" else FeedbackColorCode.WHITE
                 for c in feedback_str
             ]
-            turn.feedback = feedback_list
+            self.game_state.set_feedback(feedback_list)
             return self.is_game_over(feedback_list)
         else:
+            # Add the complete turn, so it is journaled as one record
             feedback = self.computer_coder.give_feedback(guess)
-            turn.feedback = feedback
+            self.game_state.add_turn(GameTurn(guess_list, feedback))
+            self.record_move_time()
             return self.is_game_over(feedback)
 
     def is_game_over(self: "BusinessLogic", feedback_list: List[FeedbackColorCode]) \
@@ -131,19 +190,21 @@ class BusinessLogic(IBusinessLogic):
             [f == FeedbackColorCode.BLACK for f in feedback_list]
         ):
             if isinstance(self.game_state.current_guesser, PlayerGuesser):
-                return "game_won"  # Mensch gewinnt als Rater
+                self.game_result = "game_won"  # Mensch gewinnt als Rater
             elif self.network_service:
-                return "game_won"  # Computer gewinnt online als Rater
+                self.game_result = "game_won"  # Computer gewinnt online als Rater
             else:
-                return "game_lost"  # Computer verliert offline als Rater
+                self.game_result = "game_lost"  # Computer verliert offline als Rater
+            return self.game_result
 
         if len(self.game_state.get_turns()) >= self.max_round:
             if isinstance(self.game_state.current_guesser, PlayerGuesser):
-                return "game_lost"  # Mensch verliert als Rater
+                self.game_result = "game_lost"  # Mensch verliert als Rater
             elif self.network_service:
-                return "game_lost"  # Computer verliert online als Rater
+                self.game_result = "game_lost"  # Computer verliert online als Rater
             else:
-                return "game_won"  # Computer gewinnt offline als Rater
+                self.game_result = "game_won"  # Computer gewinnt offline als Rater
+            return self.game_result
 
         if isinstance(self.game_state.current_guesser, PlayerGuesser):
             return "need_guess_input"
@@ -161,8 +222,7 @@ class BusinessLogic(IBusinessLogic):
             str: Result status of the feedback
         """
         try:
-            current_turn = self.game_state.get_turns()[-1]
-            current_turn.feedback = feedback_list
+            self.game_state.set_feedback(feedback_list)
 
             if isinstance(self.game_state.current_guesser, ComputerGuesser):
                 self.game_state.current_guesser.process_feedback(feedback_list)
@@ -192,6 +252,7 @@ class BusinessLogic(IBusinessLogic):
                 self.player_name,
                 self.computer_guesser,
             )
+            self.start_move_clock()
             return "wait_for_computer_guess"
         except ValueError:
             return "need_code_input"
@@ -204,8 +265,8 @@ class BusinessLogic(IBusinessLogic):
         """
         try:
             guess = self.computer_guesser.make_guess()
-            turn = GameTurn(guess, [])
-            self.game_state.add_turn(turn)
+            self.game_state.add_turn(GameTurn(guess, None))
+            self.record_move_time()
 
             if self.network_service:
                 guess_str = "".join(str(color.value) for color in guess)
@@ -228,7 +289,7 @@ class BusinessLogic(IBusinessLogic):
                     FeedbackColorCode.BLACK if c == "8" else FeedbackColorCode.WHITE
                     for c in feedback_str
                 ]
-                turn.feedback = feedback_list
+                self.game_state.set_feedback(feedback_list)
 
                 self.computer_guesser.process_feedback(feedback_list)
                 return self.is_game_over(feedback_list)
@@ -238,6 +299,22 @@ class BusinessLogic(IBusinessLogic):
                 return "cheating_detected"
             return "error"
 
+    def start_move_clock(self: "BusinessLogic") -> None:
+        """Start timing the moves of a new or loaded game.
+
+        Turns the game already has are recorded as untimed.
+        """
+        self.game_result = None
+        turns = self.game_state.get_turns() if self.game_state else []
+        self.move_times = [None] * len(turns)
+        self.move_started = time.perf_counter()
+
+    def record_move_time(self: "BusinessLogic") -> None:
+        """Record the time since the previous move for the turn just added."""
+        now = time.perf_counter()
+        self.move_times.append(now - self.move_started)
+        self.move_started = now
+
     def get_game_state(self: "BusinessLogic") -> GameState:
         """Get the current game state.
 
@@ -252,16 +329,30 @@ class BusinessLogic(IBusinessLogic):
         Returns:
             str: Save operation result status
         """
-        self.persistence_manager.save_game_state(self.game_state)
+        if self.save_slot is None:
+            self.save_slot = self.persistence_manager.new_save_slot(
+                self.game_state.player_name
+            )
+        self.persistence_manager.save_game_state(self.game_state, self.save_slot)
         return "game_saved"
 
-    def load_game_state(self: "BusinessLogic") -> str:
+    def load_game_state(
+        self: "BusinessLogic", file_path: Optional[str] = None
+    ) -> str:
         """Load a previously saved game state through persistence layer.
 
+        Args:
+            file_path: Save slot of the game, defaults to the most recently
+                saved game
+
         Returns:
             str: Load operation result status
         """
-        self.game_state = self.persistence_manager.load_game_state()
+        if file_path is None:
+            saves = self.persistence_manager.list_saved_games()
+            file_path = saves[0].file_name if saves else None
+        self.game_state = self.persistence_manager.load_game_state(file_path)
+        self.save_slot = file_path
 
         # Only allow loading if player was guesser
         if not isinstance(self.game_state.current_guesser, PlayerGuesser):
@@ -285,12 +376,15 @@ class BusinessLogic(IBusinessLogic):
         # Restore computer coder state
         self.computer_coder.secret_code = self.game_state.secret_code
 
-        # Replay turns to restore game state
-        for turn in self.game_state.get_turns():
-            feedback = self.computer_coder.give_feedback(turn.guesses)
-            turn.feedback = feedback
-            self.player_guesser.set_guess(turn.guesses)
+        # The save's checksum vouches for the stored feedback, only the
+        # last guess has to be restored
+        turns = self.game_state.get_turns()
+        if turns:
+            self.player_guesser.set_guess(turns[-1].guesses)
 
+        self.persistence_manager.start_journal(self.game_state, self.save_slot)
+        self.current_mode = "guesser"
+        self.start_move_clock()
         return "game_loaded"
 
     def configure_game(
@@ -313,6 +407,36 @@ class BusinessLogic(IBusinessLogic):
         self.colors = colors
         self.max_round = max_attempts
 
+    def configure_solver(
+        self: "BusinessLogic", workers: int, strategy: Optional[str] = None
+    ) -> None:
+        """Configure the search of the computer guesser.
+
+        Args:
+            workers: Number of processes for the minimax search, 1 disables
+                the process pool
+            strategy: Default solver strategy, unchanged if not given
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        if strategy is not None and strategy not in available_strategies():
+            raise ValueError(f"Unknown solver strategy: {strategy}")
+        self.solver_workers = max(1, workers)
+        if strategy is not None:
+            self.solver_strategy = strategy
+
+    def get_solver_statistics(self: "BusinessLogic") -> dict:
+        """Get the guess count, move timings and coverage of the computer guesser.
+
+        Returns:
+            dict: Statistics of the current computer guesser, empty if the
+                computer does not guess
+        """
+        if self.computer_guesser is None:
+            return {}
+        return self.computer_guesser.get_statistics()
+
     def has_saved_game(self: "BusinessLogic") -> bool:
         """Check if saved game exists through persistence layer.
 
@@ -321,6 +445,24 @@ class BusinessLogic(IBusinessLogic):
         """
         return self.persistence_manager.has_saved_game()
 
+    def list_saved_games(self: "BusinessLogic") -> List[SaveInfo]:
+        """List the saved games through persistence layer.
+
+        Returns:
+            List[SaveInfo]: Metadata of every saved game, the most recent
+                first
+        """
+        return self.persistence_manager.list_saved_games()
+
+    def get_save_slot(self: "BusinessLogic") -> Optional[str]:
+        """Get the save slot of the current game.
+
+        Returns:
+            Optional[str]: Save slot the game is saved to, None until it is
+                saved or loaded
+        """
+        return self.save_slot
+
     def start_as_coder(self: "BusinessLogic") -> str:
         """Start a new game with player as code maker.
 
@@ -335,7 +477,8 @@ class BusinessLogic(IBusinessLogic):
         """Start a new game with player as code guesser.
 
         Private helper method called by startgame().
-        Creates new game state with computer generated secret code.
+        Creates new game state with computer generated secret code and
+        journals it.
 
         Returns:
             str: "need_guess_input" to request first guess from player
@@ -353,6 +496,8 @@ class BusinessLogic(IBusinessLogic):
                 self.player_name,
                 self.player_guesser,
             )
+            self.persistence_manager.start_journal(self.game_state)
+            self.start_move_clock()
             return "need_guess_input"
         except ValueError:
             return "need_guess_input"
@@ -380,6 +525,7 @@ class BusinessLogic(IBusinessLogic):
                 self.player_name,
                 self.player_guesser,
             )
+            self.start_move_clock()
             return "need_guess_input"
         return "error"
 
@@ -406,12 +552,28 @@ class BusinessLogic(IBusinessLogic):
                 self.player_name,
                 self.computer_guesser,
             )
+            self.start_move_clock()
             return "wait_for_computer_guess"
         return "error"
 
     def reset_game_state(self: "BusinessLogic") -> None:
-        """Reset the game state."""
+        """Archive a finished game, then reset the game state.
+
+        The journal of the game is discarded.
+        """
+        self.persistence_manager.end_journal()
+        if self.game_state is not None and self.game_result is not None:
+            self.persistence_manager.archive_game(
+                self.game_state,
+                self.current_mode or "guesser",
+                self.game_result == "game_won",
+                self.move_times,
+            )
+        self.game_result = None
+        if self.computer_guesser is not None:
+            self.computer_guesser.close()
         self.game_state = None
+        self.save_slot = None
         self.computer_guesser = None
         self.computer_coder = None
         self.player_guesser = None
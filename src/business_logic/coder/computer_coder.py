@@ -1,18 +1,26 @@
 """Module for computer coder implementation."""
 
 import random
-from typing import List
+from typing import List, Optional
 
 from src.business_logic.coder.i_coder import ICoder
+from src.business_logic.solver.feedback_scorer import (
+    color_histogram,
+    decode_score,
+    score_pair,
+)
 from src.util.color_code import ColorCode
-from src.util.feedback_color_code import FeedbackColorCode
+from src.util.feedback_color_code import FeedbackColorCode # noqa
 
 
 class ComputerCoder(ICoder):
     """Computer implementation of the coder interface.
 
     This class represents the computer as code maker. It generates
-    secret codes and provides feedback on guesses.
+    secret codes and provides feedback on guesses. Feedback is scored with
+    the guesser's scoring core from color counts, which are kept for the
+    secret code, and is also available as the compact integer
+    ``black * (positions + 1) + white``.
 
     Attributes:
         positions: Number of positions in the code
@@ -30,6 +38,11 @@ class ComputerCoder(ICoder):
         self.__secret_code = []
         self.positions = positions
         self.colors = colors
+        self._secret_values: List[int] = []
+        self._secret_histogram: List[int] = []
+        self._feedbacks = [
+            decode_score(score, positions) for score in range((positions + 1) ** 2)
+        ]
 
     def give_feedback(
         self: "ComputerCoder", guess: List[ColorCode]
@@ -40,29 +53,36 @@ class ComputerCoder(ICoder):
             guess: The guess to evaluate
 
         Returns:
-            List[FeedbackColorCode]: Feedback pins for the guess
+            List[FeedbackColorCode]: Feedback pins for the guess, none for a
+                guess of the wrong length or without a secret code
         """
-        feedback = []
-
-        if len(guess) != self.positions:
-            return feedback
-
-        secret_code = self.__secret_code.copy()
-        guess_code = guess.copy()
+        score = self.give_feedback_score(guess)
+        if score is None:
+            return []
+        return list(self._feedbacks[score])
 
-        for i in range(len(secret_code)):
-            if guess_code[i] == secret_code[i]:
-                feedback.append(FeedbackColorCode.BLACK)
-                secret_code[i] = None
-                guess_code[i] = None
+    def give_feedback_score(
+        self: "ComputerCoder", guess: List[ColorCode]
+    ) -> Optional[int]:
+        """Provide the feedback for a guess as an integer.
 
-        for i in range(len(guess_code)):
-            if guess_code[i] is not None:
-                if guess_code[i] in secret_code:
-                    feedback.append(FeedbackColorCode.WHITE)
-                    secret_code[secret_code.index(guess_code[i])] = None
+        Args:
+            guess: The guess to evaluate
 
-        return feedback
+        Returns:
+            Optional[int]: black * (positions + 1) + white, None for a guess
+                of the wrong length or without a secret code. Items that are
+                no color codes match no color of the secret code.
+        """
+        if len(guess) != self.positions or len(self._secret_values) != self.positions:
+            return None
+        # Value 0 belongs to no color, so its histogram count is always 0
+        values = [
+            color.value if isinstance(color, ColorCode) else 0 for color in guess
+        ]
+        return score_pair(
+            values, self._secret_values, self._secret_histogram, self.positions
+        )
 
     def generate_code(self: "ComputerCoder") -> List[ColorCode]:
         """Generate a random secret code.
@@ -70,8 +90,9 @@ class ComputerCoder(ICoder):
         Returns:
             List[ColorCode]: The generated secret code
         """
-        self.__secret_code = [
-            ColorCode(random.randint(1, self.colors)) for _ in range(self.positions)
+        self.secret_code = [
+            ColorCode.from_value(random.randint(1, self.colors))
+            for _ in range(self.positions)
         ]
         return self.__secret_code
 
@@ -92,3 +113,8 @@ class ComputerCoder(ICoder):
             code: List of color codes to set as secret code
         """
         self.__secret_code = code
+        self._secret_values = [color.value for color in code or []]
+        # Counters for every color value, guesses may use any ColorCode
+        self._secret_histogram = color_histogram(
+            self._secret_values, len(ColorCode) + 1
+        )
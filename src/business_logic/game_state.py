@@ -1,16 +1,52 @@
 """Module for managing game state."""
 
-from typing import List
-from src.business_logic.game_turn import GameTurn # noqa
+from typing import Dict, List, Optional, Union
+from src.business_logic.game_turn import GameTurn, pack_colors
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
 from src.business_logic.guesser.i_guesser import IGuesser # noqa
-from src.util.color_code import ColorCode # noqa
+from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.business_logic.solver.strategies import DEFAULT_STRATEGY
+from src.persistence.i_game_journal import IGameJournal # noqa
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode # noqa
+
+GuesserDescriptor = Dict[str, Optional[Union[str, float]]]
+
+# Largest number of rounds and longest string in UTF-8 bytes a game can hold,
+# the limits of the save format
+MAX_ROUNDS = 0xFFFF
+MAX_STRING_LENGTH = 0xFFFF
+
+
+def _legacy_descriptor(guesser: object) -> Optional[GuesserDescriptor]:
+    """Describe a guesser pickled before guessers had descriptors.
+
+    Args:
+        guesser: The unpickled guesser
+
+    Returns:
+        Optional[GuesserDescriptor]: Descriptor of a new guesser of the same
+            type, None if the guesser is unknown
+    """
+    if isinstance(guesser, PlayerGuesser):
+        return {"type": "player"}
+    if isinstance(guesser, ComputerGuesser):
+        return {"type": "computer", "strategy": DEFAULT_STRATEGY,
+                "time_limit": None}
+    return None
 
 
 class GameState:
     """Represents the state of the game.
 
     This class maintains the current state of a game including secret code,
-    game turns, and configuration settings.
+    game turns, and configuration settings. The state is slotted and the
+    secret code is packed as one value byte per position, like the turns.
+    A pickled state holds a descriptor of the guesser instead of the guesser
+    itself; a computer guesser is rebuilt by replaying the turns, so saves
+    grow with the number of turns, not with the solver's candidates.
+    If a journal is attached, every turn added or given feedback is recorded
+    in it; the journal is never pickled.
 
     Attributes:
         secret_code: The secret code that needs to be guessed
@@ -20,11 +56,23 @@ class GameState:
         positions: Number of positions in the code
         colors: Number of available colors
         player_name: Name of the player
+        journal: Journal recording the turns, None if not journaled
     """
 
+    __slots__ = (
+        "_secret_code",
+        "turns",
+        "max_rounds",
+        "current_guesser",
+        "positions",
+        "colors",
+        "player_name",
+        "journal",
+    )
+
     def __init__(
         self: "GameState",
-        secret_code: List[ColorCode],
+        secret_code: Optional[List[ColorCode]],
         max_rounds: int,
         positions: int,
         colors: int,
@@ -34,20 +82,56 @@ class GameState:
         """Initialize the game state.
 
         Args:
-            secret_code: The secret code that needs to be guessed
+            secret_code: The secret code that needs to be guessed, None if
+                only the server knows it
             max_rounds: The maximum number of rounds allowed
             positions: Number of positions in the code
             colors: Number of available colors
             player_name: Name of the player
             current_guesser: The current guesser (player or computer)
         """
-        self.secret_code: List[ColorCode] = secret_code
+        self.secret_code = secret_code
         self.turns: List[GameTurn] = []
         self.max_rounds = max_rounds
         self.current_guesser = current_guesser
         self.positions = positions
         self.colors = colors
         self.player_name = player_name
+        self.journal: Optional[IGameJournal] = None
+
+    @property
+    def secret_code(self: "GameState") -> Optional[List[ColorCode]]:
+        """Get the secret code.
+
+        Returns:
+            Optional[List[ColorCode]]: The secret code, None if unknown
+        """
+        if self._secret_code is None:
+            return None
+        return [ColorCode.from_value(value) for value in self._secret_code]
+
+    @secret_code.setter
+    def secret_code(
+        self: "GameState", secret_code: Optional[List[ColorCode]]
+    ) -> None:
+        """Pack the secret code.
+
+        Args:
+            secret_code: The secret code, None if unknown
+        """
+        self._secret_code = (
+            None if secret_code is None
+            else pack_colors(secret_code)
+        )
+
+    @property
+    def packed_secret_code(self: "GameState") -> Optional[bytes]:
+        """Get the secret code as one value byte per position.
+
+        Returns:
+            Optional[bytes]: The packed secret code, None if unknown
+        """
+        return self._secret_code
 
     def add_turn(self: "GameState", turn: GameTurn) -> None:
         """Add a turn to the game state.
@@ -63,6 +147,25 @@ class GameState:
         if len(turn.guesses) != self.positions:
             raise ValueError(f"Guess must have {self.positions} positions")
         self.turns.append(turn)
+        if self.journal is not None:
+            self.journal.record_turn(len(self.turns) - 1, turn)
+
+    def set_feedback(
+        self: "GameState", feedback: List[FeedbackColorCode]
+    ) -> None:
+        """Set the feedback of the latest turn.
+
+        Args:
+            feedback: The feedback pins of the latest guess
+
+        Raises:
+            IndexError: If no turn was taken yet
+            ValueError: If an item is not a FeedbackColorCode
+        """
+        turns = self.get_turns()
+        turns[-1].feedback = feedback
+        if self.journal is not None:
+            self.journal.record_turn(len(turns) - 1, turns[-1])
 
     def get_secret_code(self: "GameState") -> List[ColorCode]:
         """Returns the secret code.
@@ -94,3 +197,84 @@ class GameState:
             f"GameState(secret_code={self.secret_code}, "
             f"turns={self.turns}, max_rounds={self.max_rounds})"
         )
+
+    def describe_guesser(self: "GameState") -> Optional[GuesserDescriptor]:
+        """Describe the current guesser by its type and configuration.
+
+        Returns:
+            Optional[GuesserDescriptor]: Type and strategy settings of the
+                guesser, None if there is no known guesser
+        """
+        if isinstance(self.current_guesser, PlayerGuesser):
+            return {"type": "player"}
+        if isinstance(self.current_guesser, ComputerGuesser):
+            return {
+                "type": "computer",
+                "strategy": self.current_guesser.strategy.name,
+                "time_limit": self.current_guesser.time_limit,
+            }
+        return None
+
+    def restore_guesser(
+        self: "GameState", descriptor: Optional[GuesserDescriptor]
+    ) -> Optional[IGuesser]:
+        """Rebuild a guesser from its descriptor and the turns of the game.
+
+        Args:
+            descriptor: Type and strategy settings of the guesser
+
+        Returns:
+            Optional[IGuesser]: The guesser at the current turn, None if the
+                descriptor is None
+        """
+        if descriptor is None:
+            return None
+        if descriptor["type"] == "player":
+            return PlayerGuesser()
+        guesser = ComputerGuesser(
+            self.positions,
+            self.colors,
+            strategy=descriptor["strategy"],
+            time_limit=descriptor["time_limit"],
+        )
+        guesser.replay(self.turns)
+        return guesser
+
+    def __getstate__(self: "GameState") -> Dict[str, object]:
+        """Get the slots of the state for pickling.
+
+        The guesser is replaced by its descriptor, the journal is left out.
+
+        Returns:
+            Dict[str, object]: Value of each slot
+        """
+        state = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ("current_guesser", "journal")
+        }
+        state["guesser"] = self.describe_guesser()
+        return state
+
+    def __setstate__(self: "GameState", state: Dict[str, object]) -> None:
+        """Restore a pickled state.
+
+        States pickled before the slotted representation hold the secret
+        code as a list of colors, which is packed on loading, and the guesser
+        itself instead of its descriptor. Such a guesser lacks the attributes
+        of the current guessers, so it is replaced by a new guesser of its
+        type, a computer guesser with the default strategy.
+
+        Args:
+            state: Value of each slot or attribute
+        """
+        state = dict(state)
+        self.journal = None
+        if "secret_code" in state:
+            self.secret_code = state.pop("secret_code")
+        descriptor = state.pop("guesser", None)
+        if "current_guesser" in state:
+            descriptor = _legacy_descriptor(state.pop("current_guesser"))
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.current_guesser = self.restore_guesser(descriptor)
@@ -1,21 +1,183 @@
 """Module for representing a game turn."""
 
-from dataclasses import dataclass
-from typing import List
-from src.util.color_code import ColorCode # noqa
-from src.util.feedback_color_code import FeedbackColorCode # noqa
+from typing import Dict, List, Optional, Sequence, Union
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+def pack_colors(colors: Sequence[Union[ColorCode, FeedbackColorCode]]) -> bytes:
+    """Pack colors or feedback pins as one value byte each.
+
+    Args:
+        colors: The colors or pins to pack
+
+    Returns:
+        bytes: The values of the colors
+
+    Raises:
+        ValueError: If an item is not a color or pin
+    """
+    try:
+        return bytes(color.value for color in colors)
+    except AttributeError:
+        raise ValueError(f"{colors!r} is not a list of colors") from None
 
 
-@dataclass
 class GameTurn:
     """Represents a single turn in the game.
 
     A turn consists of the player's guesses and the corresponding feedback.
+    Both are stored packed as one byte per pin, the value of its color, and
+    are converted to lists of colors when read. Until the feedback is given
+    the turn has no pins and its feedback is pending, which tells it apart
+    from feedback without pins.
 
     Attributes:
         guesses: List of color code guesses made by the player
         feedback: List of feedback pins indicating correctness of guesses
+        feedback_pending: True while the feedback is not given yet
     """
 
-    guesses: List[ColorCode]
-    feedback: List[FeedbackColorCode]
+    __slots__ = ("_guesses", "_feedback")
+
+    def __init__(
+        self: "GameTurn",
+        guesses: List[ColorCode],
+        feedback: Optional[List[FeedbackColorCode]],
+    ) -> None:
+        """Initialize the turn.
+
+        Args:
+            guesses: List of color code guesses made by the player
+            feedback: List of feedback pins of the guesses, None if the
+                feedback is not given yet
+
+        Raises:
+            ValueError: If the guesses or feedback are not lists of colors
+        """
+        self.guesses = guesses
+        self.feedback = feedback
+
+    @property
+    def guesses(self: "GameTurn") -> List[ColorCode]:
+        """Get the guessed colors.
+
+        Returns:
+            List[ColorCode]: The guessed color code
+        """
+        return [ColorCode.from_value(value) for value in self._guesses]
+
+    @guesses.setter
+    def guesses(self: "GameTurn", guesses: List[ColorCode]) -> None:
+        """Pack the guessed colors.
+
+        Args:
+            guesses: The guessed color code
+
+        Raises:
+            ValueError: If an item is not a ColorCode
+        """
+        self._guesses = pack_colors(guesses)
+
+    @property
+    def feedback(self: "GameTurn") -> List[FeedbackColorCode]:
+        """Get the feedback pins.
+
+        Returns:
+            List[FeedbackColorCode]: The feedback of the guess, no pins while
+                it is pending
+        """
+        return [FeedbackColorCode.from_value(value) for value in self.packed_feedback]
+
+    @feedback.setter
+    def feedback(
+        self: "GameTurn", feedback: Optional[List[FeedbackColorCode]]
+    ) -> None:
+        """Pack the feedback pins.
+
+        Args:
+            feedback: The feedback of the guess, None if not given yet
+
+        Raises:
+            ValueError: If an item is not a FeedbackColorCode
+        """
+        self._feedback = None if feedback is None else pack_colors(feedback)
+
+    @property
+    def feedback_pending(self: "GameTurn") -> bool:
+        """Check whether the feedback is not given yet.
+
+        Returns:
+            bool: True while the feedback is pending
+        """
+        return self._feedback is None
+
+    @property
+    def packed_guesses(self: "GameTurn") -> bytes:
+        """Get the guessed colors as one value byte per position.
+
+        Returns:
+            bytes: The packed guess
+        """
+        return self._guesses
+
+    @property
+    def packed_feedback(self: "GameTurn") -> bytes:
+        """Get the feedback pins as one value byte per pin.
+
+        Returns:
+            bytes: The packed feedback, empty while it is pending
+        """
+        return self._feedback or b""
+
+    def __eq__(self: "GameTurn", other: object) -> bool:
+        """Compare the guesses and feedback of two turns.
+
+        Args:
+            other: Object to compare with
+
+        Returns:
+            bool: True if both turns have equal guesses and feedback
+        """
+        if not isinstance(other, GameTurn):
+            return NotImplemented
+        return (
+            self._guesses == other._guesses and self._feedback == other._feedback
+        )
+
+    __hash__ = None
+
+    def __repr__(self: "GameTurn") -> str:
+        """Return string representation of the turn.
+
+        Returns:
+            str: String in format 'GameTurn(guesses=X, feedback=Y)'
+        """
+        return f"GameTurn(guesses={self.guesses}, feedback={self.feedback})"
+
+    def __getstate__(self: "GameTurn") -> Dict[str, Optional[bytes]]:
+        """Get the packed turn for pickling.
+
+        Returns:
+            Dict[str, Optional[bytes]]: Packed guesses and feedback, None
+                while the feedback is pending
+        """
+        return {"_guesses": self._guesses, "_feedback": self._feedback}
+
+    def __setstate__(
+        self: "GameTurn", state: Dict[str, Union[bytes, list]]
+    ) -> None:
+        """Restore a pickled turn.
+
+        Turns pickled before the packed representation hold lists of colors,
+        which are packed on loading.
+
+        Args:
+            state: Packed or unpacked guesses and feedback
+        """
+        if "guesses" in state:
+            self.guesses = state["guesses"]
+            self.feedback = state["feedback"]
+        else:
+            self._guesses = state["_guesses"]
+            self._feedback = state["_feedback"]
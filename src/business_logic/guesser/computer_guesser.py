@@ -1,94 +1,270 @@
 """Module for computer guesser implementation."""
 
-from itertools import product
-from typing import List, Set
+import random
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.business_logic.game_turn import GameTurn # noqa
 from src.business_logic.guesser.i_guesser import IGuesser
-from src.util.color_code import ColorCode
-from src.util.feedback_color_code import FeedbackColorCode
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.consistent_codes import ConsistentCodes
+from src.business_logic.solver.decision_cache import DecisionCache
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+from src.business_logic.solver.minimax_search import Partition # noqa
+from src.business_logic.solver.opening_book import OpeningBook
+from src.business_logic.solver.sampling_budget import SamplingBudget
+from src.business_logic.solver.strategies import DEFAULT_STRATEGY, create_strategy
+from src.business_logic.solver.symmetry_group import SymmetryGroup
+from src.util.color_code import ColorCode # noqa
+from src.util.feedback_color_code import FeedbackColorCode # noqa
 
 
 class ComputerGuesser(IGuesser):
     """Computer implementation of the guesser interface.
 
-    This class implements the computer's strategy for guessing the secret code
-    using a Knuth-like algorithm.
+    This class implements the computer's play for guessing the secret code.
+    The next guess is chosen by a registered solver strategy, Knuth's worst
+    case minimax by default. Codes are handled as integer indices of a
+    CodeSpace internally and only converted to ColorCode lists when a guess
+    leaves the guesser. Above LAZY_THRESHOLD codes the candidates are not
+    filtered eagerly; they are generated from the history by backtracking
+    until few enough remain to keep them as an array.
 
     Attributes:
         positions: Number of positions in the code
         colors: Number of available colors
-        possible_codes: Set of remaining possible codes
+        code_space: Integer encoding of all codes
+        scorer: Feedback engine scoring codes by index
+        strategy: Solver strategy choosing the next guess
+        opening_book: Precomputed guesses for the first moves
+        decision_cache: Guesses chosen earlier for the same game history
+        possible_codes: Indices of the remaining possible codes, or the
+            lazily generated ConsistentCodes on large configurations
         last_guess: Previous guess made by computer
         first_guess: Whether this is the first guess
+        history: (guess, score) pairs of all processed feedback
+        symmetry: Color and position permutations fixing every guess of the
+            history, used to evaluate only one of equivalent guesses
+        move_times: Seconds spent on each guess of the game
+        sampling: Budget bounding the search time on large candidate sets
+        time_limit: Seconds each guess may take, None for no deadline
+        move_coverages: Share of the search covered by each guess, 1.0 for
+            complete searches and guesses from the book or cache
+        last_partition: The last guess and the possible codes grouped by
+            their score against it, kept from the search so the feedback
+            only has to be looked up; None if the guess was not searched on
+            all possible codes
     """
 
-    def __init__(self: "ComputerGuesser", positions: int, colors: int) -> None:
+    LAZY_THRESHOLD = 1 << 22
+    LAZY_SAMPLE_SIZE = 1 << 11
+
+    def __init__(
+        self: "ComputerGuesser",
+        positions: int,
+        colors: int,
+        workers: int = 1,
+        strategy: str = DEFAULT_STRATEGY,
+        opening_book: Optional[OpeningBook] = None,
+        decision_cache: Optional[DecisionCache] = None,
+        sampling: Optional[SamplingBudget] = SamplingBudget(),
+        time_limit: Optional[float] = None,
+    ) -> None:
         """Initialize computer guesser with game parameters.
 
         Args:
             positions: Number of positions in the code
             colors: Number of available colors
+            workers: Number of processes for the minimax search, defaults to 1
+            strategy: Name of the solver strategy, defaults to minimax
+            opening_book: Book consulted before searching, defaults to the
+                shipped opening book
+            decision_cache: Cache consulted before searching, defaults to the
+                cache shared by all games of the process
+            sampling: Budget bounding the search time on large candidate
+                sets, None always searches exactly
+            time_limit: Seconds each guess may take; the best guess found
+                by then is made. Defaults to no deadline
+
+        Raises:
+            ValueError: If the strategy is unknown
         """
         self.positions = positions
         self.colors = colors
+        self.code_space = CodeSpace(positions, colors)
+        self.scorer = FeedbackScorer(self.code_space)
+        self.strategy = create_strategy(strategy, self.scorer, workers, sampling)
+        self.opening_book = opening_book or OpeningBook.default()
+        self.decision_cache = (
+            DecisionCache.default() if decision_cache is None else decision_cache
+        )
         self.possible_codes = self._generate_all_possible_codes()
         self.last_guess = None
         self.first_guess = True
-
-    def _generate_all_possible_codes(self: "ComputerGuesser") -> Set[tuple]:
+        self.history: List[Tuple[int, int]] = []
+        self.symmetry = SymmetryGroup(self.code_space)
+        self.move_times: List[float] = []
+        self.sampling = sampling
+        self.time_limit = time_limit
+        self.move_coverages: List[float] = []
+        self.last_partition: Optional[Tuple[int, Partition]] = None
+        self._rng = random.Random(sampling.seed if sampling else None)
+
+    def _generate_all_possible_codes(self: "ComputerGuesser") -> range:
         """Generate all possible codes.
 
+        The complete code space is represented lazily as a range of indices,
+        so no memory is spent before the first feedback arrives.
+
         Returns:
-            Set[tuple]: A set of all possible color code combinations
+            range: Indices of all possible color code combinations
         """
-        colors = [ColorCode(i) for i in range(1, self.colors + 1)]
-        return set(product(colors, repeat=self.positions))
+        return self.code_space.all_codes()
 
     def make_guess(self: "ComputerGuesser") -> List[ColorCode]:
         """Make a guess for the secret code.
 
+        With a time limit the search stops at the deadline and the best guess
+        found so far is made; the share of the search covered is reported in
+        move_coverages.
+
         Returns:
             List[ColorCode]: The guessed color code
 
+        Raises:
+            ValueError: If no valid guesses remain (cheating detected)
+        """
+        start = time.perf_counter()
+        deadline = None if self.time_limit is None else time.time() + self.time_limit
+        coverage = 1.0
+        self.last_partition = None
+        guess = self._choose_guess()
+        if guess is None:
+            # A search on a sample of lazily generated candidates is approximate
+            sampled = isinstance(self.possible_codes, ConsistentCodes)
+            guess = self.strategy.choose(
+                self._candidate_array(deadline), deadline, self.symmetry
+            )
+            coverage = self.strategy.coverage
+            # Partitions of a candidate sample do not cover the possible codes
+            if (
+                self.strategy.partition is not None
+                and isinstance(self.possible_codes, np.ndarray)
+            ):
+                self.last_partition = (int(guess), self.strategy.partition)
+            if self.strategy.deterministic and coverage == 1.0 and not sampled:
+                self.decision_cache.put(
+                    self.positions, self.colors, self.history, guess,
+                    self.strategy.name
+                )
+        self.last_guess = self.code_space.decode(int(guess))
+        self.move_times.append(time.perf_counter() - start)
+        self.move_coverages.append(coverage)
+        return self.last_guess
+
+    def _choose_guess(self: "ComputerGuesser") -> Optional[int]:
+        """Choose the next guess without searching, if possible.
+
+        The fixed first guess, the opening book and the decision cache are
+        consulted, as far as they apply to the strategy. Only complete
+        searches of all possible codes are cached, so a guess cut short by a
+        deadline or found on a candidate sample is not reused.
+
+        Returns:
+            Optional[int]: Index of the next guess, None if the strategy has
+                to search
+
         Raises:
             ValueError: If no valid guesses remain (cheating detected)
         """
         if self.first_guess:
             self.first_guess = False
-            if self.colors == 1:
-                self.last_guess = [ColorCode(1)] * self.positions
-            else:
-                self.last_guess = [ColorCode(1)] * (self.positions // 2) + [
-                    ColorCode(2)
-                ] * (self.positions - self.positions // 2)
-            return self.last_guess
-
-        if not self.possible_codes:
+            return OpeningBook.first_guess(self.code_space)
+
+        # Candidates still generated lazily are known to be plenty
+        self._resolve_candidates()
+        if (
+            not isinstance(self.possible_codes, ConsistentCodes)
+            and len(self.possible_codes) == 0
+        ):
             raise ValueError("CHEATING_DETECTED")
 
-        best_guess = None
-        min_max_remaining = float("inf")
-
-        for guess in self.possible_codes:
+        if self.strategy.uses_opening_book:
+            best_guess = self.opening_book.lookup(
+                self.positions, self.colors, self.history
+            )
+            if best_guess is not None:
+                return best_guess
+
+        if not self.strategy.deterministic:
+            return None
+        return self.decision_cache.get(
+            self.positions, self.colors, self.history, self.strategy.name
+        )
 
-            max_remaining = 0
+    def _resolve_candidates(self: "ComputerGuesser") -> None:
+        """Materialize lazily generated candidates once few remain.
 
-            score_counts = {}
+        Large configurations switch to lazy generation here as well, so the
+        code space is never enumerated as a whole.
+        """
+        if (
+            isinstance(self.possible_codes, range)
+            and self.code_space.size > self.LAZY_THRESHOLD
+        ):
+            self.possible_codes = ConsistentCodes(self.code_space, self.history)
+        if isinstance(self.possible_codes, ConsistentCodes):
+            smallest = self.possible_codes.first(self.LAZY_SAMPLE_SIZE + 1)
+            if len(smallest) <= self.LAZY_SAMPLE_SIZE:
+                self.possible_codes = smallest
+
+    def _candidate_array(
+        self: "ComputerGuesser", deadline: Optional[float] = None
+    ) -> np.ndarray:
+        """Get the possible codes as a sorted array of indices.
+
+        Lazily generated candidates are represented by a random sample, drawn
+        in at most half the time left until the deadline.
 
-            for possible_code in self.possible_codes:
+        Args:
+            deadline: time.time() by which the guess must be made, if any
 
-                feedback = self._calculate_feedback(list(guess), list(possible_code))
-                score = tuple(feedback)
-                score_counts[score] = score_counts.get(score, 0) + 1
-                max_remaining = max(max_remaining, score_counts[score])
+        Returns:
+            np.ndarray: uint32 indices of the remaining possible codes
+        """
+        if isinstance(self.possible_codes, ConsistentCodes):
+            time_limit = self.sampling.time_limit if self.sampling else None
+            if deadline is not None:
+                time_limit = max(0.0, deadline - time.time()) / 2
+            return self.possible_codes.sample(
+                self.LAZY_SAMPLE_SIZE, self._rng, time_limit
+            )
+        if isinstance(self.possible_codes, range):
+            return np.arange(len(self.possible_codes), dtype=np.uint32)
+        return np.asarray(self.possible_codes, dtype=np.uint32)
+
+    def get_statistics(self: "ComputerGuesser") -> Dict[str, Union[str, float]]:
+        """Get the guess count and move timings of the current game.
 
-            if max_remaining < min_max_remaining:
-                min_max_remaining = max_remaining
-                best_guess = guess
-                if guess in self.possible_codes:
-                    break
+        Returns:
+            Dict[str, Union[str, float]]: Strategy name, number of guesses,
+                mean and maximum seconds per move and the smallest coverage
+                of a move
+        """
+        moves = len(self.move_times)
+        return {
+            "strategy": self.strategy.name,
+            "guesses": moves,
+            "mean_move_time": sum(self.move_times) / moves if moves else 0.0,
+            "max_move_time": max(self.move_times, default=0.0),
+            "min_coverage": min(self.move_coverages, default=1.0),
+        }
 
-        self.last_guess = list(best_guess)
-        return self.last_guess
+    def close(self: "ComputerGuesser") -> None:
+        """Release the worker processes of the strategy, if any."""
+        self.strategy.close()
 
     def _calculate_feedback(
         self: "ComputerGuesser", guess: List[ColorCode], code: List[ColorCode]
@@ -106,22 +282,10 @@ class ComputerGuesser(IGuesser):
         Returns:
             List of feedback pins (BLACK/WHITE) for the guess
         """
-        feedback = []
-        temp_guess = guess.copy()
-        temp_code = code.copy()
-
-        for i in range(len(temp_code)):
-            if temp_guess[i] == temp_code[i]:
-                feedback.append(FeedbackColorCode.BLACK)
-                temp_code[i] = None
-                temp_guess[i] = None
-
-        for i in range(len(temp_guess)):
-            if temp_guess[i] is not None and temp_guess[i] in temp_code:
-                feedback.append(FeedbackColorCode.WHITE)
-                temp_code[temp_code.index(temp_guess[i])] = None
-
-        return feedback
+        score = self.scorer.score(
+            self.code_space.encode(guess), self.code_space.encode(code)
+        )
+        return self.scorer.decode(score)
 
     def process_feedback(
         self: "ComputerGuesser", feedback: List[FeedbackColorCode]
@@ -129,7 +293,10 @@ class ComputerGuesser(IGuesser):
         """Process feedback and update possible codes.
 
         Updates the set of possible codes by eliminating those that would not
-        give the same feedback as received.
+        give the same feedback as received. The remaining codes are kept as a
+        sorted array of indices, or regenerated from the history on large
+        configurations. If the search already partitioned the possible codes
+        by the guess, the remaining codes are looked up instead of scored.
 
         Args:
             feedback: The feedback received for the last guess
@@ -137,11 +304,51 @@ class ComputerGuesser(IGuesser):
         if not self.last_guess:
             return
 
-        self.possible_codes = {
-            code
-            for code in self.possible_codes
-            if self._would_give_same_feedback(list(code), feedback)
-        }
+        guess = self.code_space.encode(self.last_guess)
+        target = self.scorer.encode(feedback)
+        self.history.append((guess, target))
+        self.symmetry.add_guess(guess)
+
+        if self.last_partition is not None and self.last_partition[0] == guess:
+            self.possible_codes = self.last_partition[1].get(
+                target, np.empty(0, dtype=np.uint32)
+            )
+            self.last_partition = None
+            return
+
+        if (
+            not isinstance(self.possible_codes, np.ndarray)
+            and self.code_space.size > self.LAZY_THRESHOLD
+        ):
+            self.possible_codes = ConsistentCodes(self.code_space, self.history)
+            return
+
+        remaining = []
+        for chunk in self.code_space.chunks(self.possible_codes):
+            mask = self.scorer.score_many(guess, chunk) == target
+            remaining.append(chunk[mask])
+
+        self.possible_codes = (
+            np.concatenate(remaining) if remaining else np.empty(0, dtype=np.uint32)
+        )
+
+    def replay(self: "ComputerGuesser", turns: Sequence[GameTurn]) -> None:
+        """Restore the solver state of a game from its turns.
+
+        Each guess is taken as made by the guesser and its feedback is
+        processed, so the possible codes are rebuilt instead of being stored
+        with the game. A turn whose feedback is pending is only taken as the
+        last guess.
+
+        Args:
+            turns: Turns of the game so far, in order
+        """
+        for turn in turns:
+            self.first_guess = False
+            self.last_partition = None
+            self.last_guess = turn.guesses
+            if not turn.feedback_pending:
+                self.process_feedback(turn.feedback)
 
     def _would_give_same_feedback(
         self: "ComputerGuesser",
@@ -160,28 +367,7 @@ class ComputerGuesser(IGuesser):
         Returns:
             True if feedback matches target, False otherwise
         """
-        received_feedback = []
-        temp_guess = self.last_guess.copy()
-        temp_code = code.copy()
-
-        for i in range(len(temp_code)):
-            if temp_guess[i] == temp_code[i]:
-                received_feedback.append(FeedbackColorCode.BLACK)
-                temp_code[i] = None
-                temp_guess[i] = None
-
-        for i in range(len(temp_guess)):
-            if temp_guess[i] is not None and temp_guess[i] in temp_code:
-                received_feedback.append(FeedbackColorCode.WHITE)
-                temp_code[temp_code.index(temp_guess[i])] = None
-
-        black_received = sum(
-            1 for f in received_feedback if f == FeedbackColorCode.BLACK
-        )
-        white_received = sum(
-            1 for f in received_feedback if f == FeedbackColorCode.WHITE
+        score = self.scorer.score(
+            self.code_space.encode(self.last_guess), self.code_space.encode(code)
         )
-        black_target = sum(1 for f in target_feedback if f == FeedbackColorCode.BLACK)
-        white_target = sum(1 for f in target_feedback if f == FeedbackColorCode.WHITE)
-
-        return black_received == black_target and white_received == white_target
+        return score == self.scorer.encode(target_feedback)
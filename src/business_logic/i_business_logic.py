@@ -1,7 +1,8 @@
 """Interface module for game logic layer."""
 
 from abc import ABC, abstractmethod
-from typing import List # noqa
+from typing import List, Optional # noqa
+from src.business_logic.save_info import SaveInfo # noqa
 from src.util.color_code import ColorCode # noqa
 from src.util.feedback_color_code import FeedbackColorCode # noqa
 
@@ -37,11 +38,46 @@ class IBusinessLogic(ABC):
         pass
 
     @abstractmethod
-    def startgame(self: "IBusinessLogic", role: str) -> str:
+    def configure_solver(
+        self: "IBusinessLogic", workers: int, strategy: Optional[str] = None
+    ) -> None:
+        """Configure the search of the computer guesser.
+
+        Args:
+            workers: Number of processes for the minimax search, 1 disables
+                the process pool
+            strategy: Default solver strategy, unchanged if not given
+
+        Raises:
+            ValueError: If the strategy is unknown
+        """
+        pass
+
+    @abstractmethod
+    def get_solver_statistics(self: "IBusinessLogic") -> dict:
+        """Get the guess count, move timings and coverage of the computer guesser.
+
+        Returns:
+            dict: Statistics of the current computer guesser, empty if the
+                computer does not guess
+        """
+        pass
+
+    @abstractmethod
+    def startgame(
+        self: "IBusinessLogic",
+        role: str,
+        strategy: Optional[str] = None,
+        time_limit: Optional[float] = None,
+    ) -> str:
         """Start a new game with the given role.
 
         Args:
             role: Player's role ('guesser', 'coder', or 'online_guesser')
+            strategy: Solver strategy of the computer guesser, defaults to
+                the configured strategy
+            time_limit: Seconds per computer guess, defaults to the
+                configured time limit
 
         Returns:
             str: Next required action
@@ -110,11 +146,17 @@ class IBusinessLogic(ABC):
         pass
 
     @abstractmethod
-    def load_game_state(self: "IBusinessLogic") -> None:
+    def load_game_state(
+        self: "IBusinessLogic", file_path: Optional[str] = None
+    ) -> None:
         """Load a previously saved game state.
 
         Restores the game to the state it was in when saved.
 
+        Args:
+            file_path: Save slot of the game, defaults to the most recently
+                saved game
+
         Raises:
             FileNotFoundError: If no saved game state exists
         """
@@ -129,6 +171,26 @@ class IBusinessLogic(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_saved_games(self: "IBusinessLogic") -> List[SaveInfo]:
+        """List the saved games that can be resumed.
+
+        Returns:
+            List[SaveInfo]: Metadata of every saved game, the most recent
+                first
+        """
+        pass
+
+    @abstractmethod
+    def get_save_slot(self: "IBusinessLogic") -> Optional[str]:
+        """Get the save slot of the current game.
+
+        Returns:
+            Optional[str]: Save slot the game is saved to, None until it is
+                saved or loaded
+        """
+        pass
+
     @abstractmethod
     def is_game_over(
         self: "IBusinessLogic", feedback_list: List[FeedbackColorCode]
@@ -0,0 +1,81 @@
+"""Module for the metadata of a saved game."""
+
+from dataclasses import dataclass
+from typing import Type
+
+from src.business_logic.game_state import GameState # noqa
+from src.persistence.save_format import SaveMetadata # noqa
+
+
+@dataclass
+class SaveInfo:
+    """Metadata of a saved game, enough to list it without opening it.
+
+    Attributes:
+        file_name: Name of the save file in the save directory
+        player_name: Name of the player
+        positions: Number of positions in the code
+        colors: Number of available colors
+        max_rounds: The maximum number of rounds allowed
+        turns: Number of turns played
+        saved_at: time.time() of the last save
+    """
+
+    file_name: str
+    player_name: str
+    positions: int
+    colors: int
+    max_rounds: int
+    turns: int
+    saved_at: float
+
+    @classmethod
+    def of(
+        cls: Type["SaveInfo"], file_name: str, game_state: GameState, saved_at: float
+    ) -> "SaveInfo":
+        """Describe a game state saved to a file.
+
+        Args:
+            file_name: Name of the save file
+            game_state: The saved game state
+            saved_at: time.time() of the save
+
+        Returns:
+            SaveInfo: Metadata of the save
+        """
+        return cls(
+            file_name,
+            game_state.player_name,
+            game_state.positions,
+            game_state.colors,
+            game_state.max_rounds,
+            len(game_state.get_turns()),
+            saved_at,
+        )
+
+    @classmethod
+    def of_metadata(
+        cls: Type["SaveInfo"],
+        file_name: str,
+        metadata: SaveMetadata,
+        saved_at: float,
+    ) -> "SaveInfo":
+        """Describe a save by the metadata read from its header.
+
+        Args:
+            file_name: Name of the save file
+            metadata: Metadata of the save
+            saved_at: time.time() of the save
+
+        Returns:
+            SaveInfo: Metadata of the save
+        """
+        return cls(
+            file_name,
+            metadata.player_name,
+            metadata.positions,
+            metadata.colors,
+            metadata.max_rounds,
+            metadata.turns,
+            saved_at,
+        )
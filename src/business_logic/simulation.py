@@ -0,0 +1,293 @@
+"""Module for headless computer versus computer games.
+
+The simulation lets ComputerGuesser solve secret codes given by
+ComputerCoder without any user interface, e.g. every code of 4 positions
+with 6 colors on 4 processes::
+
+    python -m src.business_logic.simulation 4 6 --processes 4
+
+or a random sample of 200 codes of the default configuration::
+
+    python -m src.business_logic.simulation 5 8 --sample 200
+"""
+
+import argparse
+import bisect
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.business_logic.coder.computer_coder import ComputerCoder
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.solver.decision_cache import DecisionCache # noqa
+from src.business_logic.solver.strategies import DEFAULT_STRATEGY, available_strategies
+from src.util.feedback_color_code import FeedbackColorCode
+
+DEFAULT_MAX_GUESSES = 12
+CHUNKS_PER_PROCESS = 4
+# Upper bounds of the move latency buckets in milliseconds
+LATENCY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+GameResult = Tuple[int, bool, List[float]]
+
+
+@dataclass
+class SimulationReport:
+    """Outcome of a batch of simulated games.
+
+    Attributes:
+        positions: Number of positions in the code
+        colors: Number of available colors
+        strategy: Name of the solver strategy
+        games: Number of games played
+        guess_counts: Number of solved games per number of guesses
+        failures: Games not solved within the guess limit
+        latency_counts: Number of moves per latency bucket, the last entry
+            counting moves slower than the largest bucket
+        total_moves: Number of moves over all games
+        total_move_time: Seconds spent on all moves
+        max_move_time: Seconds of the slowest move
+    """
+
+    positions: int
+    colors: int
+    strategy: str
+    games: int = 0
+    guess_counts: Dict[int, int] = field(default_factory=dict)
+    failures: int = 0
+    latency_counts: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    total_moves: int = 0
+    total_move_time: float = 0.0
+    max_move_time: float = 0.0
+
+    def add_game(self: "SimulationReport", result: GameResult) -> None:
+        """Record the outcome of one game.
+
+        Args:
+            result: Number of guesses, whether the code was solved and the
+                seconds of each move
+        """
+        guesses, solved, move_times = result
+        self.games += 1
+        if solved:
+            self.guess_counts[guesses] = self.guess_counts.get(guesses, 0) + 1
+        else:
+            self.failures += 1
+        for move_time in move_times:
+            bucket = bisect.bisect_left(LATENCY_BUCKETS, move_time * 1000)
+            self.latency_counts[bucket] += 1
+        self.total_moves += len(move_times)
+        self.total_move_time += sum(move_times)
+        self.max_move_time = max([self.max_move_time, *move_times])
+
+    @property
+    def mean_guesses(self: "SimulationReport") -> float:
+        """Get the mean number of guesses of the solved games.
+
+        Returns:
+            float: Mean guesses, 0.0 if no game was solved
+        """
+        solved = sum(self.guess_counts.values())
+        if not solved:
+            return 0.0
+        return sum(g * n for g, n in self.guess_counts.items()) / solved
+
+    @property
+    def max_guesses(self: "SimulationReport") -> int:
+        """Get the largest number of guesses of a solved game.
+
+        Returns:
+            int: Maximum guesses, 0 if no game was solved
+        """
+        return max(self.guess_counts, default=0)
+
+    @property
+    def mean_move_time(self: "SimulationReport") -> float:
+        """Get the mean seconds per move.
+
+        Returns:
+            float: Mean move time, 0.0 without moves
+        """
+        return self.total_move_time / self.total_moves if self.total_moves else 0.0
+
+    def format(self: "SimulationReport") -> str:
+        """Render the report as text tables.
+
+        Returns:
+            str: Summary, guess distribution and latency histogram
+        """
+        lines = [
+            f"{self.positions} positions, {self.colors} colors, "
+            f"strategy {self.strategy}: {self.games} games",
+            f"mean guesses {self.mean_guesses:.3f}, max guesses "
+            f"{self.max_guesses}, failures {self.failures}",
+            f"mean move {self.mean_move_time * 1000:.2f} ms, max move "
+            f"{self.max_move_time * 1000:.2f} ms",
+            "",
+            f"{'guesses':>7} {'games':>7} {'share':>7}",
+        ]
+        for guesses in sorted(self.guess_counts):
+            count = self.guess_counts[guesses]
+            lines.append(f"{guesses:>7} {count:>7} {count / self.games:>7.1%}")
+
+        lines += ["", f"{'move ms':>9} {'moves':>8}"]
+        labels = [f"<= {bound}" for bound in LATENCY_BUCKETS]
+        labels.append(f"> {LATENCY_BUCKETS[-1]}")
+        for label, count in zip(labels, self.latency_counts):
+            if count:
+                lines.append(f"{label:>9} {count:>8}")
+        return "\n".join(lines)
+
+
+def play_game(
+    guesser: ComputerGuesser,
+    coder: ComputerCoder,
+    max_guesses: int = DEFAULT_MAX_GUESSES,
+) -> GameResult:
+    """Let the guesser solve the secret code of the coder.
+
+    Args:
+        guesser: Fresh computer guesser
+        coder: Computer coder holding the secret code
+        max_guesses: Guesses after which the game is lost
+
+    Returns:
+        GameResult: Number of guesses, whether the code was solved and the
+            seconds of each move
+    """
+    solution = [FeedbackColorCode.BLACK] * coder.positions
+    for _ in range(max_guesses):
+        feedback = coder.give_feedback(guesser.make_guess())
+        if feedback == solution:
+            return len(guesser.move_times), True, guesser.move_times
+        guesser.process_feedback(feedback)
+    return max_guesses, False, guesser.move_times
+
+
+def play_secrets(
+    positions: int,
+    colors: int,
+    strategy: str,
+    secrets: Sequence[int],
+    max_guesses: int,
+    workers: int = 1,
+    decision_cache: Optional[DecisionCache] = None,
+) -> List[GameResult]:
+    """Play one game per secret code, in or outside the main process.
+
+    Args:
+        positions: Number of positions in the code
+        colors: Number of available colors
+        strategy: Name of the solver strategy
+        secrets: Indices of the secret codes
+        max_guesses: Guesses after which a game is lost
+        workers: Number of processes for the search of each guesser
+        decision_cache: Cache shared by the games, defaults to the cache of
+            the process
+
+    Returns:
+        List[GameResult]: Outcome of each game
+    """
+    results = []
+    coder = ComputerCoder(positions, colors)
+    for secret in secrets:
+        guesser = ComputerGuesser(
+            positions, colors, workers, strategy, decision_cache=decision_cache
+        )
+        try:
+            coder.secret_code = guesser.code_space.decode(secret)
+            results.append(play_game(guesser, coder, max_guesses))
+        finally:
+            guesser.close()
+    return results
+
+
+def simulate(
+    positions: int,
+    colors: int,
+    strategy: str = DEFAULT_STRATEGY,
+    sample: Optional[int] = None,
+    seed: int = 0,
+    processes: int = 1,
+    max_guesses: int = DEFAULT_MAX_GUESSES,
+) -> SimulationReport:
+    """Play computer versus computer games on every or a sample of the codes.
+
+    Games are split into chunks played by a process pool; each process keeps
+    its own opening book and decision cache across its games.
+
+    Args:
+        positions: Number of positions in the code
+        colors: Number of available colors
+        strategy: Name of the solver strategy, defaults to minimax
+        sample: Number of random secret codes, defaults to every code
+        seed: Seed of the sample, defaults to 0
+        processes: Number of processes playing games, 1 plays in process
+        max_guesses: Guesses after which a game is lost, defaults to the
+            round limit of the game
+
+    Returns:
+        SimulationReport: Guess distribution and move latencies
+
+    Raises:
+        ValueError: If the strategy is unknown
+    """
+    if strategy not in available_strategies():
+        raise ValueError(f"Unknown solver strategy: {strategy}")
+    size = colors**positions
+    if sample is None or sample >= size:
+        secrets = range(size)
+    else:
+        secrets = random.Random(seed).sample(range(size), sample)
+
+    report = SimulationReport(positions, colors, strategy)
+    if processes <= 1:
+        for result in play_secrets(positions, colors, strategy, secrets,
+                                   max_guesses):
+            report.add_game(result)
+        return report
+
+    chunk_size = -(-len(secrets) // (processes * CHUNKS_PER_PROCESS))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(play_secrets, positions, colors, strategy,
+                            secrets[start:start + chunk_size], max_guesses)
+            for start in range(0, len(secrets), chunk_size)
+        ]
+        for future in futures:
+            for result in future.result():
+                report.add_game(result)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a simulation and print its report.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv
+    """
+    parser = argparse.ArgumentParser(
+        description="Play Superhirn computer versus computer games"
+    )
+    parser.add_argument("positions", type=int)
+    parser.add_argument("colors", type=int)
+    parser.add_argument("--strategy", choices=available_strategies(),
+                        default=DEFAULT_STRATEGY)
+    parser.add_argument("--sample", type=int, default=None,
+                        help="number of random secret codes, default all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--max-guesses", type=int, default=DEFAULT_MAX_GUESSES)
+    args = parser.parse_args(argv)
+
+    report = simulate(args.positions, args.colors, args.strategy, args.sample,
+                      args.seed, args.processes, args.max_guesses)
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,18 @@
+"""solver package for the search engine behind the computer guesser.
+
+This package provides the building blocks used by ComputerGuesser:
+    - CodeSpace: Integer encoding of all codes of a game configuration
+    - ConsistentCodes: Lazy backtracking generator of codes matching a history
+    - FeedbackScorer: Feedback engine encoding pins as one small integer
+    - MinimaxSearch: Partition based minimax search with an optional process pool
+    - SamplingBudget: Limits of the approximate search on large candidate sets
+    - SymmetryGroup: Color and position permutations fixing the game history
+    - OpeningBook: Precomputed guess trees for the first moves
+    - DecisionCache: Bounded LRU cache of guesses keyed by the game history
+    - SolverStrategy: Registry of selectable guess strategies
+    - strategy_benchmark: Comparison of the strategies on random secret codes
+
+The solver works on codes packed into integers and only converts to
+ColorCode lists at the guesser's API boundary, which keeps the candidate
+set small enough for every configuration the game accepts.
+"""
@@ -0,0 +1,106 @@
+"""Module for the integer encoded code space of a game configuration."""
+
+from typing import Iterator, List, Sequence, Union
+
+import numpy as np
+
+from src.util.color_code import ColorCode
+
+CodeIndices = Union[range, np.ndarray]
+
+
+class CodeSpace:
+    """Integer encoding of all codes for one (positions, colors) configuration.
+
+    Every code is packed into a single integer by reading its zero based
+    color values as the digits of a base ``colors`` number, most significant
+    digit first. Sets of codes are kept as ``range`` objects (the untouched
+    code space) or sorted ``uint32`` arrays, so even 9 positions with 8 colors
+    fit into memory. ColorCode lists are only produced at the API boundary.
+
+    Attributes:
+        positions: Number of positions in the code
+        colors: Number of available colors
+        size: Number of codes in the code space
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self: "CodeSpace", positions: int, colors: int) -> None:
+        """Initialize the code space for the given configuration.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+        """
+        self.positions = positions
+        self.colors = colors
+        self.size = colors**positions
+        self._dtype = np.uint32 if self.size <= 1 << 32 else np.int64
+        self._weights = colors ** np.arange(positions - 1, -1, -1, dtype=self._dtype)
+        self._color_codes = [
+            ColorCode.from_value(value) for value in range(1, colors + 1)
+        ]
+
+    def encode(self: "CodeSpace", code: Sequence[ColorCode]) -> int:
+        """Pack a code into its integer index.
+
+        Args:
+            code: The code as a sequence of color codes
+
+        Returns:
+            int: Index of the code in the code space
+        """
+        index = 0
+        for color in code:
+            index = index * self.colors + color.value - 1
+        return index
+
+    def decode(self: "CodeSpace", index: int) -> List[ColorCode]:
+        """Unpack an integer index into its code.
+
+        Args:
+            index: Index of the code in the code space
+
+        Returns:
+            List[ColorCode]: The code as a list of color codes
+        """
+        color_codes = self._color_codes
+        return [color_codes[digit] for digit in self.to_digits(index).tolist()]
+
+    def to_digits(self: "CodeSpace", indices: Union[int, np.ndarray]) -> np.ndarray:
+        """Unpack indices into their zero based color digits.
+
+        Args:
+            indices: A single index or an array of N indices
+
+        Returns:
+            np.ndarray: uint8 digits of shape (positions,) or (N, positions)
+        """
+        indices = np.asarray(indices, dtype=self._dtype)
+        digits = indices[..., None] // self._weights % self._dtype(self.colors)
+        return digits.astype(np.uint8)
+
+    def all_codes(self: "CodeSpace") -> range:
+        """Get the complete code space without materializing it.
+
+        Returns:
+            range: All code indices in ascending order
+        """
+        return range(self.size)
+
+    def chunks(self: "CodeSpace", indices: CodeIndices) -> Iterator[np.ndarray]:
+        """Split a set of codes into bounded ``uint32`` arrays.
+
+        Args:
+            indices: Code indices as range or array
+
+        Yields:
+            np.ndarray: Consecutive slices of at most CHUNK_SIZE indices
+        """
+        for start in range(0, len(indices), self.CHUNK_SIZE):
+            stop = min(start + self.CHUNK_SIZE, len(indices))
+            if isinstance(indices, range):
+                yield np.arange(indices[start], indices[stop - 1] + 1, dtype=np.uint32)
+            else:
+                yield np.asarray(indices[start:stop], dtype=np.uint32)
@@ -0,0 +1,180 @@
+"""Module for generating the codes consistent with a game history lazily."""
+
+import random
+import time
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace # noqa
+
+Constraint = Tuple[Tuple[int, ...], Tuple[int, ...], int, int]
+
+
+class ConsistentCodes:
+    """Codes that would have produced every feedback of a game history.
+
+    Instead of enumerating the whole code space, codes are built position by
+    position in a backtracking search. A partial code is dropped as soon as a
+    (guess, feedback) pair can no longer be met: its black pins must stay
+    within reach of the remaining positions, and the colors it shares with
+    the guess (black plus white pins) are bounded by the per-color counts of
+    the guess. Memory use is proportional to the history, not to the size of
+    the code space.
+
+    Attributes:
+        code_space: Code space of the configuration
+        history: (guess, score) pairs the codes must be consistent with
+    """
+
+    RUN_LENGTH = 16
+
+    def __init__(
+        self: "ConsistentCodes",
+        code_space: CodeSpace,
+        history: Sequence[Tuple[int, int]],
+    ) -> None:
+        """Initialize the generator for a game history.
+
+        Args:
+            code_space: Code space of the configuration
+            history: (guess, score) pairs of the game so far
+        """
+        self.code_space = code_space
+        self.history = list(history)
+        self._constraints: List[Constraint] = []
+        for guess, score in self.history:
+            digits = tuple(code_space.to_digits(guess).tolist())
+            counts = tuple(digits.count(color) for color in range(code_space.colors))
+            black, white = divmod(score, code_space.positions + 1)
+            self._constraints.append((digits, counts, black, black + white))
+
+    def __iter__(self: "ConsistentCodes") -> Iterator[int]:
+        """Iterate over all consistent codes in ascending order.
+
+        Returns:
+            Iterator[int]: Indices of the consistent codes
+        """
+        return self._search()
+
+    def first(self: "ConsistentCodes", limit: int) -> np.ndarray:
+        """Get the smallest consistent codes.
+
+        Args:
+            limit: Maximum number of codes
+
+        Returns:
+            np.ndarray: Sorted uint32 indices, all consistent codes if fewer
+                than limit exist
+        """
+        return np.fromiter(islice(iter(self), limit), dtype=np.uint32)
+
+    def sample(
+        self: "ConsistentCodes",
+        size: int,
+        rng: random.Random,
+        time_limit: Optional[float] = None,
+    ) -> np.ndarray:
+        """Draw consistent codes from runs at random points of the code space.
+
+        Each run continues the ascending search from a random code for
+        RUN_LENGTH consistent codes, wrapping around at the end of the code
+        space. Runs may overlap, so fewer codes are returned if the consistent
+        codes are few or the time limit cuts the sampling short.
+
+        Args:
+            size: Number of codes to draw
+            rng: Random number generator choosing the starting points
+            time_limit: Seconds after which no further run is started,
+                defaults to no limit
+
+        Returns:
+            np.ndarray: Sorted unique uint32 indices
+        """
+        deadline = None if time_limit is None else time.time() + time_limit
+        codes = set()
+        for _ in range(2 * -(-size // self.RUN_LENGTH)):
+            start = rng.randrange(self.code_space.size)
+            run = list(islice(self._search(start), self.RUN_LENGTH))
+            if len(run) < self.RUN_LENGTH:
+                run += islice(self._search(0), self.RUN_LENGTH - len(run))
+            if not run:
+                break
+            codes.update(run[: size - len(codes)])
+            if len(codes) == size or (
+                deadline is not None and time.time() >= deadline
+            ):
+                break
+        return np.array(sorted(codes), dtype=np.uint32)
+
+    def _search(self: "ConsistentCodes", start: int = 0) -> Iterator[int]:
+        """Run the backtracking search in ascending order.
+
+        Args:
+            start: Smallest code index to yield, defaults to 0
+
+        Returns:
+            Iterator[int]: Indices of the consistent codes from start on
+        """
+        positions = self.code_space.positions
+        colors = self.code_space.colors
+        constraints = self._constraints
+        start_digits = self.code_space.to_digits(start).tolist()
+        counts = [0] * colors
+
+        def descend(
+            position: int,
+            index: int,
+            blacks: Tuple[int, ...],
+            commons: Tuple[int, ...],
+            at_start: bool,
+        ) -> Iterator[int]:
+            """Extend a consistent partial code by one position.
+
+            Args:
+                position: Position to assign next
+                index: Index of the partial code so far
+                blacks: Black pins of the partial code per constraint
+                commons: Shared colors of the partial code per constraint
+                at_start: Whether the partial code is a prefix of start
+
+            Yields:
+                int: Index of the next consistent code
+            """
+            if position == positions:
+                yield index
+                return
+
+            remaining = positions - position - 1
+            first_color = start_digits[position] if at_start else 0
+            for color in range(first_color, colors):
+                new_blacks = []
+                new_commons = []
+                for (guess, guess_counts, black, common), b, m in zip(
+                    constraints, blacks, commons
+                ):
+                    b += guess[position] == color
+                    m += counts[color] < guess_counts[color]
+                    if (
+                        b > black
+                        or b + remaining < black
+                        or m > common
+                        or m + min(remaining, positions - m) < common
+                    ):
+                        break
+                    new_blacks.append(b)
+                    new_commons.append(m)
+                else:
+                    counts[color] += 1
+                    yield from descend(
+                        position + 1,
+                        index * colors + color,
+                        tuple(new_blacks),
+                        tuple(new_commons),
+                        at_start and color == first_color,
+                    )
+                    counts[color] -= 1
+
+        zeros = (0,) * len(constraints)
+        return descend(0, 0, zeros, zeros, True)
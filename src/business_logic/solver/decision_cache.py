@@ -0,0 +1,179 @@
+"""Module for caching the computer guesser's decisions between games."""
+
+import logging
+import os
+import struct
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple, Type
+
+History = Tuple[Tuple[int, int], ...]
+CacheKey = Tuple[str, int, int, History]
+
+
+class DecisionCache:
+    """Bounded LRU cache of chosen guesses keyed by the game history.
+
+    Games against the computer coder often follow identical guess and feedback
+    paths. The cache maps (strategy, positions, colors, (guess, score) pairs)
+    to the guess chosen in that situation, so a repeated position is answered without
+    searching. The process wide instance lives as long as the process; caches
+    with a file path can additionally be stored on disk.
+
+    File layout (little endian)::
+
+        header: magic "SHDC", uint8 version, uint32 number of entries
+        entry:  uint8 strategy name length, strategy name (ASCII),
+                uint8 positions, uint8 colors, uint8 history length,
+                (uint32 guess, uint8 score) per pair, uint32 chosen guess
+
+    Attributes:
+        capacity: Maximum number of cached decisions
+        file_path: File the cache is loaded from and saved to, if any
+    """
+
+    DEFAULT_CAPACITY = 1 << 16
+    MAGIC = b"SHDC"
+    VERSION = 1
+    _HEADER = struct.Struct("<4sBI")
+    _ENTRY = struct.Struct("<BBB")
+    _PAIR = struct.Struct("<IB")
+    _GUESS = struct.Struct("<I")
+
+    _default = None
+
+    def __init__(
+        self: "DecisionCache",
+        capacity: int = DEFAULT_CAPACITY,
+        file_path: Optional[str] = None,
+    ) -> None:
+        """Initialize the cache, loading it from disk if a file exists.
+
+        Args:
+            capacity: Maximum number of cached decisions
+            file_path: File to persist the cache in, defaults to memory only
+        """
+        self.capacity = capacity
+        self.file_path = file_path
+        self._entries: "OrderedDict[CacheKey, int]" = OrderedDict()
+        if file_path and os.path.exists(file_path):
+            self.load()
+
+    @classmethod
+    def default(cls: Type["DecisionCache"]) -> "DecisionCache":
+        """Get the in-memory cache shared by all games of the process.
+
+        Returns:
+            DecisionCache: The shared cache
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self: "DecisionCache") -> int:
+        """Get the number of cached decisions.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+    def get(
+        self: "DecisionCache",
+        positions: int,
+        colors: int,
+        history: Sequence[Tuple[int, int]],
+        strategy: str = "minimax",
+    ) -> Optional[int]:
+        """Get the cached guess for a game history.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+            history: (guess, score) pairs of the game so far
+            strategy: Name of the strategy that chose the guess
+
+        Returns:
+            Optional[int]: Index of the cached guess, None on a miss
+        """
+        key = (strategy, positions, colors, tuple(history))
+        guess = self._entries.get(key)
+        if guess is not None:
+            self._entries.move_to_end(key)
+        return guess
+
+    def put(
+        self: "DecisionCache",
+        positions: int,
+        colors: int,
+        history: Sequence[Tuple[int, int]],
+        guess: int,
+        strategy: str = "minimax",
+    ) -> None:
+        """Store the guess chosen for a game history.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+            history: (guess, score) pairs of the game so far
+            guess: Index of the chosen guess
+            strategy: Name of the strategy that chose the guess
+        """
+        key = (strategy, positions, colors, tuple(history))
+        self._entries[key] = int(guess)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self: "DecisionCache") -> None:
+        """Remove all cached decisions."""
+        self._entries.clear()
+
+    def save(self: "DecisionCache") -> None:
+        """Write the cache to its file, least recently used entries first.
+
+        Raises:
+            ValueError: If the cache has no file path
+        """
+        if not self.file_path:
+            raise ValueError("Decision cache has no file path")
+
+        chunks = [self._HEADER.pack(self.MAGIC, self.VERSION, len(self._entries))]
+        for (strategy, positions, colors, history), guess in self._entries.items():
+            name = strategy.encode("ascii")
+            chunks.append(bytes([len(name)]) + name)
+            chunks.append(self._ENTRY.pack(positions, colors, len(history)))
+            chunks.extend(self._PAIR.pack(g, score) for g, score in history)
+            chunks.append(self._GUESS.pack(guess))
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.file_path)), exist_ok=True)
+        with open(self.file_path, "wb") as file:
+            file.write(b"".join(chunks))
+
+    def load(self: "DecisionCache") -> None:
+        """Merge the decisions stored in the cache file into the cache.
+
+        Unreadable files are logged and ignored.
+        """
+        try:
+            with open(self.file_path, "rb") as file:
+                data = file.read()
+            magic, version, count = self._HEADER.unpack_from(data)
+            if (magic, version) != (self.MAGIC, self.VERSION):
+                raise ValueError("Unknown decision cache format")
+
+            offset = self._HEADER.size
+            for _ in range(count):
+                name_length = data[offset]
+                strategy = data[offset + 1:offset + 1 + name_length].decode("ascii")
+                offset += 1 + name_length
+                positions, colors, length = self._ENTRY.unpack_from(data, offset)
+                offset += self._ENTRY.size
+                history = []
+                for _ in range(length):
+                    history.append(self._PAIR.unpack_from(data, offset))
+                    offset += self._PAIR.size
+                (guess,) = self._GUESS.unpack_from(data, offset)
+                offset += self._GUESS.size
+                self.put(positions, colors, history, guess, strategy)
+        except (OSError, ValueError, IndexError, struct.error) as e:
+            logging.error(f"Failed to load decision cache: {e}")
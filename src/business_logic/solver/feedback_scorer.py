@@ -0,0 +1,321 @@
+"""Module for scoring guesses against integer encoded codes."""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace # noqa
+from src.util.feedback_color_code import FeedbackColorCode # noqa
+
+
+class FeedbackScorer:
+    """Feedback engine for integer encoded codes.
+
+    A feedback is encoded as the single integer
+    ``black * (positions + 1) + white``, so partitions of a candidate set can
+    be counted with a plain array of ``(positions + 1) ** 2`` buckets. Scores
+    are computed from per-code color histograms, which are precomputed for the
+    whole code space when it is small enough and shared, read-only, by all
+    scorers of the same configuration in the process. For small code spaces the rows
+    of the guess x candidate score matrix can additionally be cached.
+
+    Attributes:
+        code_space: Code space the scorer works on
+        positions: Number of positions in the code
+        colors: Number of available colors
+        num_scores: Number of distinct feedback scores
+        winning_score: Score of a guess matching the code exactly
+        cache_matrix: Whether score matrix rows are cached
+    """
+
+    TABLE_LIMIT = 1 << 18
+    MATRIX_LIMIT = 1 << 12
+
+    _tables: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __init__(
+        self: "FeedbackScorer", code_space: CodeSpace, cache_matrix: bool = True
+    ) -> None:
+        """Initialize the scorer for a code space.
+
+        Args:
+            code_space: Code space the scorer works on
+            cache_matrix: Cache score matrix rows if the code space has at
+                most MATRIX_LIMIT codes, defaults to True
+        """
+        self.code_space = code_space
+        self.positions = code_space.positions
+        self.colors = code_space.colors
+        self.num_scores = (self.positions + 1) ** 2
+        self.winning_score = self.positions * (self.positions + 1)
+        self.cache_matrix = cache_matrix and code_space.size <= self.MATRIX_LIMIT
+        self._rows: Dict[int, np.ndarray] = {}
+        self._digits = None
+        self._histograms = None
+        if code_space.size <= self.TABLE_LIMIT:
+            self._digits, self._histograms = self._code_tables()
+
+    def _code_tables(self: "FeedbackScorer") -> Tuple[np.ndarray, np.ndarray]:
+        """Get the digits and histograms of every code of the configuration.
+
+        The tables are computed once per configuration and process; they are
+        read-only as every scorer of the configuration shares them.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Digits (size, positions) and
+                histograms (size, colors) of all codes
+        """
+        key = (self.positions, self.colors)
+        if key not in self._tables:
+            digits = self.code_space.to_digits(np.arange(self.code_space.size))
+            histograms = self.histograms(digits)
+            digits.flags.writeable = False
+            histograms.flags.writeable = False
+            FeedbackScorer._tables[key] = (digits, histograms)
+        return self._tables[key]
+
+    def encode(self: "FeedbackScorer", feedback: Sequence[FeedbackColorCode]) -> int:
+        """Encode feedback pins as a score.
+
+        Args:
+            feedback: Feedback pins in any order
+
+        Returns:
+            int: The encoded score
+        """
+        black = sum(1 for pin in feedback if pin == FeedbackColorCode.BLACK)
+        white = sum(1 for pin in feedback if pin == FeedbackColorCode.WHITE)
+        return black * (self.positions + 1) + white
+
+    def decode(self: "FeedbackScorer", score: int) -> List[FeedbackColorCode]:
+        """Decode a score into feedback pins.
+
+        Args:
+            score: The encoded score
+
+        Returns:
+            List[FeedbackColorCode]: Black pins followed by white pins
+        """
+        return decode_score(score, self.positions)
+
+    def histograms(self: "FeedbackScorer", digits: np.ndarray) -> np.ndarray:
+        """Count how often each color occurs in each code.
+
+        Args:
+            digits: Color digits of shape (N, positions)
+
+        Returns:
+            np.ndarray: uint8 color counts of shape (N, colors)
+        """
+        digits = np.asarray(digits)
+        if digits.ndim == 1:
+            return np.bincount(digits, minlength=self.colors).astype(np.uint8)
+        offsets = digits + np.arange(len(digits))[:, None] * self.colors
+        counts = np.bincount(offsets.ravel(), minlength=len(digits) * self.colors)
+        return counts.reshape(len(digits), self.colors).astype(np.uint8)
+
+    def code_data(
+        self: "FeedbackScorer", indices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get digits and histograms of a batch of codes.
+
+        Args:
+            indices: Array of N code indices
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Column-major digits (N, positions)
+                and histograms (N, colors)
+        """
+        if self._digits is not None:
+            digits, histograms = self._digits[indices], self._histograms[indices]
+        else:
+            digits = self.code_space.to_digits(indices)
+            histograms = self.histograms(digits)
+        # Column-major matrices make the per-row reductions of score_batch fast
+        return np.asfortranarray(digits), np.asfortranarray(histograms)
+
+    def score(self: "FeedbackScorer", guess: int, code: int) -> int:
+        """Score a single guess against a single code.
+
+        Args:
+            guess: Index of the guess
+            code: Index of the code
+
+        Returns:
+            int: The encoded feedback score
+        """
+        digits, histograms = self.code_data(np.array([guess, code]))
+        guess_digits, code_digits = digits.tolist()
+        return score_pair(guess_digits, code_digits, histograms[1].tolist(),
+                          self.positions)
+
+    def score_many(
+        self: "FeedbackScorer", guess: int, codes: np.ndarray
+    ) -> np.ndarray:
+        """Score one guess against a batch of codes.
+
+        Args:
+            guess: Index of the guess
+            codes: Array of N code indices
+
+        Returns:
+            np.ndarray: uint8 scores of shape (N,)
+        """
+        if self.cache_matrix:
+            return self._matrix_row(int(guess))[codes]
+        return self._score_batch(int(guess), codes)
+
+    def _matrix_row(self: "FeedbackScorer", guess: int) -> np.ndarray:
+        """Get the cached score matrix row of a guess.
+
+        Args:
+            guess: Index of the guess
+
+        Returns:
+            np.ndarray: Scores of the guess against every code
+        """
+        row = self._rows.get(guess)
+        if row is None:
+            row = self._score_batch(guess, np.arange(self.code_space.size))
+            self._rows[guess] = row
+        return row
+
+    def score_batch(
+        self: "FeedbackScorer",
+        guess_digits: np.ndarray,
+        digits: np.ndarray,
+        histograms: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Score one guess against a candidate matrix in one vectorized pass.
+
+        Black pins are counted by elementwise equality of the digits, the
+        number of common colors by the per-color minimum of the histograms.
+
+        Args:
+            guess_digits: Color digits of the guess, shape (positions,)
+            digits: uint8 candidate matrix of shape (N, positions)
+            histograms: Color counts of the candidates; if omitted only the
+                colors of the guess are counted
+
+        Returns:
+            np.ndarray: uint8 scores of shape (N,)
+        """
+        guess_histogram = self.histograms(guess_digits)
+        black = (digits == guess_digits).sum(axis=1, dtype=np.uint8)
+        if histograms is None:
+            common = np.zeros(len(digits), dtype=np.uint8)
+            for color in np.flatnonzero(guess_histogram):
+                count = (digits == color).sum(axis=1, dtype=np.uint8)
+                common += np.minimum(count, guess_histogram[color])
+        else:
+            common = np.minimum(histograms, guess_histogram).sum(
+                axis=1, dtype=np.uint8
+            )
+        # black * (positions + 1) + (common - black)
+        return black * np.uint8(self.positions) + common
+
+    def score_table(
+        self: "FeedbackScorer", guesses: np.ndarray, codes: np.ndarray
+    ) -> np.ndarray:
+        """Score every guess against every code in one vectorized pass.
+
+        Meant for small code sets, as the intermediate arrays have
+        ``len(guesses) * len(codes) * positions`` elements.
+
+        Args:
+            guesses: Array of G guess indices
+            codes: Array of N code indices
+
+        Returns:
+            np.ndarray: uint8 scores of shape (G, N)
+        """
+        guess_digits = self.code_space.to_digits(guesses)
+        digits = self.code_space.to_digits(codes)
+        black = (guess_digits[:, None, :] == digits[None, :, :]).sum(
+            axis=2, dtype=np.uint8
+        )
+        common = np.minimum(
+            self.histograms(guess_digits)[:, None, :],
+            self.histograms(digits)[None, :, :],
+        ).sum(axis=2, dtype=np.uint8)
+        return black * np.uint8(self.positions) + common
+
+    def _score_batch(
+        self: "FeedbackScorer", guess: int, codes: np.ndarray
+    ) -> np.ndarray:
+        """Score one guess against a batch of codes without the cache.
+
+        Args:
+            guess: Index of the guess
+            codes: Array of N code indices
+
+        Returns:
+            np.ndarray: uint8 scores of shape (N,)
+        """
+        guess_digits = self.code_space.to_digits(guess)
+        if self._digits is not None:
+            digits, histograms = self.code_data(codes)
+            return self.score_batch(guess_digits, digits, histograms)
+        return self.score_batch(guess_digits, self.code_space.to_digits(codes))
+
+
+def color_histogram(digits: Sequence[int], size: int) -> List[int]:
+    """Count how often each color occurs in a code.
+
+    Args:
+        digits: Color values of the code
+        size: Number of counters, larger than every color value
+
+    Returns:
+        List[int]: Count per color value
+    """
+    counts = [0] * size
+    for digit in digits:
+        counts[digit] += 1
+    return counts
+
+
+def score_pair(
+    guess_digits: Sequence[int],
+    code_digits: Sequence[int],
+    code_histogram: Sequence[int],
+    positions: int,
+) -> int:
+    """Score a guess against a code in one pass over the positions.
+
+    Black pins are equal colors at equal positions. A color of the guess is
+    shared with the code, giving a black or white pin, as long as the guess
+    has used it less often so far than the code contains it.
+
+    Args:
+        guess_digits: Color values of the guess
+        code_digits: Color values of the code
+        code_histogram: Color counts of the code, indexed by color value
+        positions: Number of positions in the code
+
+    Returns:
+        int: The encoded feedback score
+    """
+    counts = [0] * len(code_histogram)
+    black = common = 0
+    for guess_digit, code_digit in zip(guess_digits, code_digits):
+        if guess_digit == code_digit:
+            black += 1
+        if counts[guess_digit] < code_histogram[guess_digit]:
+            common += 1
+        counts[guess_digit] += 1
+    return black * (positions + 1) + common - black
+
+
+def decode_score(score: int, positions: int) -> List[FeedbackColorCode]:
+    """Decode a score into feedback pins.
+
+    Args:
+        score: The encoded score
+        positions: Number of positions in the code
+
+    Returns:
+        List[FeedbackColorCode]: Black pins followed by white pins
+    """
+    black, white = divmod(int(score), positions + 1)
+    return [FeedbackColorCode.BLACK] * black + [FeedbackColorCode.WHITE] * white
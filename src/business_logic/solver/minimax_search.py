@@ -0,0 +1,551 @@
+"""Module for the partition based minimax search of the computer guesser."""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+from src.business_logic.solver.sampling_budget import SamplingBudget # noqa
+from src.business_logic.solver.symmetry_group import SymmetryGroup # noqa
+
+PartitionValue = Union[int, float]
+SearchKey = Tuple[PartitionValue, bool, int]
+ShardResult = Tuple[SearchKey, int, Optional[np.ndarray]]
+Partition = Dict[int, np.ndarray]
+
+OBJECTIVES = ("worst_case", "expected_size", "entropy", "most_parts")
+
+_worker_scorers: Dict[Tuple[int, int], FeedbackScorer] = {}
+
+
+class MinimaxSearch:
+    """Partition based minimax search with an optional process pool.
+
+    Every guess is scored against all candidates, splitting them into one
+    partition per feedback. The objective rates these partitions and the guess
+    with the smallest value wins:
+
+        - worst_case: Size of the largest partition (Knuth)
+        - expected_size: Sum of squared sizes, i.e. the expected remaining size
+        - entropy: Sum of n * log2(n), minimal for the most informative guess
+        - most_parts: Negated number of non-empty partitions
+
+    Guesses are evaluated in a heuristic order: their partitions of a small,
+    evenly spaced candidate sample are rated first and the most promising
+    guesses are searched first. Ties are broken by preferring guesses from
+    the candidate set and then the earlier guess in that order, so the result
+    is the same no matter how the guesses are split up. With more than one worker
+    the guesses are sharded across a process pool while the candidates are
+    placed in shared memory once per search instead of being pickled per task.
+
+    Each worker scores at most ``score_budget`` guess/candidate pairs per
+    search; if the full search is larger only the first guesses are tried.
+    With a sampling budget, large candidate sets are approximated by random
+    samples and the sampled search is cut off after the budget's time limit;
+    smaller candidate sets are still searched exhaustively. A deadline
+    passed to best_guess cuts the search off in any mode; the best guess
+    found so far is returned and ``coverage`` tells how much of the search
+    was done. Given the symmetry group of the history, guesses that
+    are equivalent under it split the candidates alike and only the first of
+    each class in the heuristic order is evaluated; coverage is then counted
+    in classes.
+
+    Attributes:
+        scorer: Feedback engine of the code space
+        workers: Number of worker processes, 1 searches in process
+        objective: Name of the partition objective
+        sampling: Budget of the approximate search, None searches exactly
+        score_budget: Scores computed per worker and search
+        coverage: Share of the full search covered by the last search, 1.0
+            if every guess was scored against every candidate or ruled out
+            by the lower bound
+        partition: Candidates of the last search grouped by their score
+            against the best guess, None if the candidates were sampled
+    """
+
+    PARALLEL_THRESHOLD = 1 << 11
+    ORDER_SAMPLES = 64
+    ORDER_LIMIT = 1 << 16
+    SHARDS_PER_WORKER = 4
+    SCORE_BUDGET = 1 << 25
+
+    def __init__(
+        self: "MinimaxSearch",
+        scorer: FeedbackScorer,
+        workers: int = 1,
+        objective: str = "worst_case",
+        sampling: Optional[SamplingBudget] = None,
+    ) -> None:
+        """Initialize the search.
+
+        Args:
+            scorer: Feedback engine of the code space
+            workers: Number of worker processes, defaults to 1
+            objective: Partition objective, defaults to the worst case
+            sampling: Budget of the approximate search, defaults to exact
+
+        Raises:
+            ValueError: If the objective is unknown
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown search objective: {objective}")
+        self.scorer = scorer
+        self.workers = max(1, workers)
+        self.objective = objective
+        self.sampling = sampling
+        self.score_budget = self.SCORE_BUDGET
+        self.coverage = 1.0
+        self.partition: Optional[Partition] = None
+        self._rng = np.random.default_rng(sampling.seed if sampling else None)
+        self._executor = None
+
+    def best_guess(
+        self: "MinimaxSearch",
+        candidates: np.ndarray,
+        guesses: Optional[np.ndarray] = None,
+        deadline: Optional[float] = None,
+        symmetry: Optional[SymmetryGroup] = None,
+    ) -> int:
+        """Find the guess with the best partition of the candidates.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            guesses: Indices of the guesses to evaluate, defaults to the
+                candidates themselves
+            deadline: time.time() after which the best guess so far is
+                returned, defaults to the sampling time limit if the
+                candidates are sampled
+            symmetry: Symmetries of the history that produced the
+                candidates, only one guess per equivalence class is
+                evaluated if given
+
+        Returns:
+            int: Index of the best guess
+        """
+        candidates = np.asarray(candidates, dtype=np.uint32)
+        guesses = candidates if guesses is None else np.asarray(guesses, np.uint32)
+        full_search = len(guesses) * len(candidates)
+        sampled = False
+        if self.sampling is not None:
+            sampled = len(candidates) > self.sampling.threshold
+            if sampled:
+                if deadline is None:
+                    deadline = time.time() + self.sampling.time_limit
+                candidates, guesses = self._sample(candidates, guesses)
+        searched = len(guesses) * len(candidates)
+        guesses = self.order_guesses(candidates, guesses)
+        # Deduplicating after ordering keeps the guess a full search would pick
+        if symmetry is not None:
+            guesses = symmetry.representatives(guesses)
+        classes = len(guesses)
+        limit = max(1, self.score_budget * self.workers // len(candidates))
+        guesses = guesses[:limit]
+        bound = self.lower_bound(len(candidates))
+
+        if self.workers == 1 or len(candidates) < self.PARALLEL_THRESHOLD:
+            key, covered, scores = search_shard(
+                self.scorer, candidates, guesses, bound, self.objective, deadline,
+                keep_scores=True,
+            )
+        else:
+            key, covered, scores = self._parallel_search(
+                candidates, guesses, bound, deadline
+            )
+        # The bound also rules out the guesses cut off by the score budget
+        if reaches_bound(key, bound):
+            covered = classes
+        self.coverage = covered * searched / (classes * full_search)
+        best = int(guesses[key[2]])
+
+        self.partition = None
+        if not sampled:
+            if scores is None:
+                scores = self.scorer.score_many(best, candidates)
+            self.partition = split_candidates(candidates, scores)
+        return best
+
+    def order_guesses(
+        self: "MinimaxSearch", candidates: np.ndarray, guesses: np.ndarray
+    ) -> np.ndarray:
+        """Sort the guesses by how well they split a candidate sample.
+
+        Small candidate sets and very many guesses keep the given order, as
+        rating them would cost about as much as searching.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            guesses: Indices of the guesses to evaluate
+
+        Returns:
+            np.ndarray: The guesses, most promising first
+        """
+        if (
+            len(candidates) <= 2 * self.ORDER_SAMPLES
+            or not 1 < len(guesses) <= self.ORDER_LIMIT
+        ):
+            return guesses
+
+        step = len(candidates) // self.ORDER_SAMPLES
+        sample = candidates[::step][: self.ORDER_SAMPLES]
+        values = np.concatenate([
+            partition_values(
+                partition_counts(self.scorer.score_table(chunk, sample),
+                                 self.scorer.num_scores),
+                self.objective,
+            )
+            for chunk in np.array_split(guesses, -(-len(guesses) // 4096))
+        ])
+        outside = ~is_member(guesses, candidates)
+        return guesses[np.lexsort((outside, values))]
+
+    def _sample(
+        self: "MinimaxSearch", candidates: np.ndarray, guesses: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw the random samples of the approximate search.
+
+        Sampled guesses from the candidate set are added to the candidate
+        sample, so they keep their preference over outside guesses and their
+        winning partition.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            guesses: Indices of the guesses to evaluate
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Sorted candidate sample and guess
+                sample
+        """
+        if len(guesses) > self.sampling.guesses:
+            guesses = self._rng.choice(guesses, self.sampling.guesses, replace=False)
+        if len(candidates) > self.sampling.candidates:
+            sample = self._rng.choice(
+                candidates, self.sampling.candidates, replace=False
+            )
+            candidates = np.union1d(sample, guesses[is_member(guesses, candidates)])
+        return candidates.astype(np.uint32), guesses.astype(np.uint32)
+
+    def lower_bound(self: "MinimaxSearch", num_candidates: int) -> PartitionValue:
+        """Get the smallest objective value any guess could reach.
+
+        Every objective is best for candidates split as evenly as possible
+        across all feasible feedbacks.
+
+        Args:
+            num_candidates: Number of remaining possible codes
+
+        Returns:
+            PartitionValue: Lower bound for the objective
+        """
+        positions = self.scorer.positions
+        # (positions - 1) black pins and one white pin is impossible
+        feasible_scores = (positions + 1) * (positions + 2) // 2 - 1
+        size, larger = divmod(num_candidates, feasible_scores)
+        counts = np.array(
+            [size] * (feasible_scores - larger) + [size + 1] * larger, dtype=np.int64
+        )
+        return partition_value(counts, self.objective)
+
+    def _parallel_search(
+        self: "MinimaxSearch",
+        candidates: np.ndarray,
+        guesses: np.ndarray,
+        bound: PartitionValue,
+        deadline: Optional[float] = None,
+    ) -> ShardResult:
+        """Search shards of the guesses in the process pool.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            guesses: Indices of the guesses to evaluate
+            bound: Lower bound of the objective
+            deadline: time.time() after which shards stop early, if any
+
+        Returns:
+            ShardResult: Best (value, outside candidates, rank) key, the
+                number of guesses covered and no scores
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        shared = SharedMemory(create=True, size=(len(candidates) + len(guesses)) * 4)
+        try:
+            buffer = np.ndarray(
+                len(candidates) + len(guesses), dtype=np.uint32, buffer=shared.buf
+            )
+            buffer[: len(candidates)] = candidates
+            buffer[len(candidates):] = guesses
+            del buffer
+
+            shard_size = -(-len(guesses) // (self.workers * self.SHARDS_PER_WORKER))
+            futures = [
+                self._executor.submit(
+                    _search_shared_shard,
+                    shared.name,
+                    self.scorer.positions,
+                    self.scorer.colors,
+                    len(candidates),
+                    start,
+                    min(start + shard_size, len(guesses)),
+                    bound,
+                    self.objective,
+                    deadline,
+                )
+                for start in range(0, len(guesses), shard_size)
+            ]
+            results = [future.result() for future in futures]
+            return (min(key for key, _, _ in results),
+                    sum(covered for _, covered, _ in results), None)
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def close(self: "MinimaxSearch") -> None:
+        """Shut down the process pool if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self: "MinimaxSearch") -> dict:
+        """Get the picklable state without the process pool.
+
+        Returns:
+            dict: Instance attributes except the executor
+        """
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+
+def partition_value(counts: np.ndarray, objective: str) -> PartitionValue:
+    """Rate the partition sizes of a guess, lower is better.
+
+    Args:
+        counts: Number of candidates per feedback score
+        objective: Name of the partition objective
+
+    Returns:
+        PartitionValue: Value of the partition under the objective
+    """
+    if objective == "worst_case":
+        return int(counts.max())
+    if objective == "expected_size":
+        return int((counts.astype(np.int64) ** 2).sum())
+    if objective == "most_parts":
+        return -int(np.count_nonzero(counts))
+    parts = counts[counts > 1].astype(np.float64)
+    return float((parts * np.log2(parts)).sum())
+
+
+def partition_counts(scores: np.ndarray, num_scores: int) -> np.ndarray:
+    """Count the candidates per feedback score for each row of a score table.
+
+    Args:
+        scores: Scores of shape (G, N)
+        num_scores: Number of possible scores
+
+    Returns:
+        np.ndarray: Counts of shape (G, num_scores)
+    """
+    offsets = np.arange(len(scores), dtype=np.int64)[:, None] * num_scores
+    return np.bincount(
+        (scores + offsets).ravel(), minlength=len(scores) * num_scores
+    ).reshape(len(scores), num_scores)
+
+
+def partition_values(counts: np.ndarray, objective: str) -> np.ndarray:
+    """Rate the partition sizes of many guesses at once, lower is better.
+
+    Args:
+        counts: Counts of shape (G, num_scores)
+        objective: Name of the partition objective
+
+    Returns:
+        np.ndarray: float64 values of shape (G,)
+    """
+    counts = counts.astype(np.float64)
+    if objective == "worst_case":
+        return counts.max(axis=1)
+    if objective == "expected_size":
+        return (counts**2).sum(axis=1)
+    if objective == "most_parts":
+        return -np.count_nonzero(counts, axis=1).astype(np.float64)
+    logs = np.log2(counts, out=np.zeros_like(counts), where=counts > 1)
+    return (counts * logs).sum(axis=1)
+
+
+def is_member(values: np.ndarray, sorted_set: np.ndarray) -> np.ndarray:
+    """Check which values occur in a sorted array.
+
+    A binary search per value, far cheaper than np.isin for a few values in
+    a large set.
+
+    Args:
+        values: Values to look up
+        sorted_set: Sorted array to search in
+
+    Returns:
+        np.ndarray: Boolean mask, True for values found in the set
+    """
+    positions = np.searchsorted(sorted_set, values)
+    found = positions < len(sorted_set)
+    found[found] = sorted_set[positions[found]] == values[found]
+    return found
+
+
+def reaches_bound(key: SearchKey, bound: PartitionValue) -> bool:
+    """Check whether no other guess can beat a search key.
+
+    Args:
+        key: (value, outside candidates, rank) key of a guess
+        bound: Lower bound of the objective
+
+    Returns:
+        bool: True if the guess is a candidate reaching the lower bound
+    """
+    # Tolerance for the floating point entropy
+    return key[0] <= bound + 1e-9 and not key[1]
+
+
+def split_candidates(candidates: np.ndarray, scores: np.ndarray) -> Partition:
+    """Group candidates by their score against a guess.
+
+    Args:
+        candidates: Sorted indices of the candidates
+        scores: Score of each candidate against the guess
+
+    Returns:
+        Partition: Sorted candidate indices per score that occurs
+    """
+    order = np.argsort(scores, kind="stable")
+    sorted_scores = scores[order]
+    starts = np.flatnonzero(np.diff(sorted_scores)) + 1
+    groups = np.split(candidates[order], starts)
+    keys = sorted_scores[np.concatenate(([0], starts))] if len(scores) else []
+    return {int(score): group for score, group in zip(keys, groups)}
+
+
+def search_shard(
+    scorer: FeedbackScorer,
+    candidates: np.ndarray,
+    guesses: np.ndarray,
+    bound: PartitionValue,
+    objective: str = "worst_case",
+    deadline: Optional[float] = None,
+    offset: int = 0,
+    keep_scores: bool = False,
+) -> ShardResult:
+    """Evaluate a shard of guesses against all candidates.
+
+    Guesses are evaluated in the given order and the search stops early once a
+    guess from the candidate set reaches the lower bound, as no later guess can
+    beat it, or once the deadline has passed. The first guess is always
+    evaluated.
+
+    Args:
+        scorer: Feedback engine of the code space
+        candidates: Sorted indices of the remaining possible codes
+        guesses: Indices of the guesses to evaluate
+        bound: Lower bound of the objective
+        objective: Name of the partition objective, defaults to the worst case
+        deadline: time.time() after which no further guess is evaluated
+        offset: Rank of the shard's first guess among all guesses
+        keep_scores: Whether to return the scores of the best guess, which
+            worker processes skip to keep their results small
+
+    Returns:
+        ShardResult: Best (value, outside candidates, rank) key, the number
+            of guesses covered, counting those ruled out by the lower bound,
+            and the scores of the best guess against the candidates if kept
+    """
+    if not scorer.cache_matrix:
+        digits, histograms = scorer.code_data(candidates)
+    outside = ~is_member(guesses, candidates)
+
+    best = None
+    best_scores = None
+    covered = 0
+    for rank, (guess, is_outside) in enumerate(
+        zip(guesses.tolist(), outside.tolist()), offset
+    ):
+        covered += 1
+        if scorer.cache_matrix:
+            scores = scorer.score_many(guess, candidates)
+        else:
+            guess_digits = scorer.code_space.to_digits(guess)
+            scores = scorer.score_batch(guess_digits, digits, histograms)
+        value = partition_value(
+            np.bincount(scores, minlength=scorer.num_scores), objective
+        )
+
+        key = (value, is_outside, rank)
+        if best is None or key < best:
+            best = key
+            best_scores = scores
+            if reaches_bound(key, bound):
+                covered = len(guesses)
+                break
+        if deadline is not None and time.time() >= deadline:
+            break
+    return best, covered, best_scores if keep_scores else None
+
+
+def _search_shared_shard(
+    name: str,
+    positions: int,
+    colors: int,
+    num_candidates: int,
+    start: int,
+    stop: int,
+    bound: PartitionValue,
+    objective: str,
+    deadline: Optional[float],
+) -> ShardResult:
+    """Worker entry point evaluating a shard stored in shared memory.
+
+    Args:
+        name: Name of the shared memory block
+        positions: Number of positions in the code
+        colors: Number of available colors
+        num_candidates: Number of candidates at the start of the block
+        start: First guess of the shard, relative to the guesses
+        stop: End of the shard, relative to the guesses
+        bound: Lower bound of the objective
+        objective: Name of the partition objective
+        deadline: time.time() after which no further guess is evaluated
+
+    Returns:
+        ShardResult: Best (value, outside candidates, rank) key, the number
+            of guesses covered and no scores
+    """
+    shared = SharedMemory(name=name)
+    try:
+        buffer = np.ndarray(
+            num_candidates + stop, dtype=np.uint32, buffer=shared.buf
+        )
+        candidates = buffer[:num_candidates].copy()
+        guesses = buffer[num_candidates + start:].copy()
+        del buffer
+        return search_shard(_worker_scorer(positions, colors), candidates, guesses,
+                            bound, objective, deadline, start)
+    finally:
+        shared.close()
+
+
+def _worker_scorer(positions: int, colors: int) -> FeedbackScorer:
+    """Get the scorer of a worker process, built once per configuration.
+
+    Args:
+        positions: Number of positions in the code
+        colors: Number of available colors
+
+    Returns:
+        FeedbackScorer: Scorer for the configuration
+    """
+    key = (positions, colors)
+    if key not in _worker_scorers:
+        _worker_scorers[key] = FeedbackScorer(CodeSpace(positions, colors))
+    return _worker_scorers[key]
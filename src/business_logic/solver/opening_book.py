@@ -0,0 +1,286 @@
+"""Module for the precomputed opening book of the computer guesser.
+
+The book can be built from the command line, e.g. for 5 positions, 8 colors
+and the first three guesses::
+
+    python -m src.business_logic.solver.opening_book 5 8 --plies 3
+"""
+
+import argparse
+import logging
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+from src.business_logic.solver.minimax_search import MinimaxSearch
+
+BookTree = Dict[Tuple[int, ...], int]
+
+DEFAULT_BOOK_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../util/opening_books")
+)
+
+
+class OpeningBook:
+    """Precomputed guess trees for the first moves of each configuration.
+
+    A tree maps the feedback scores received so far to the next guess; the
+    empty path holds the first guess. Trees are stored per (positions, colors)
+    in a small binary file and loaded lazily on first use.
+
+    File layout (little endian)::
+
+        header: magic "SHOB", uint8 version, uint8 positions, uint8 colors,
+                uint32 number of entries
+        entry:  uint8 path length, one uint8 score per ply, uint32 guess
+
+    Attributes:
+        book_dir: Directory holding the book files, None for a book without
+            trees
+    """
+
+    MAGIC = b"SHOB"
+    VERSION = 1
+    _HEADER = struct.Struct("<4sBBBI")
+    _GUESS = struct.Struct("<I")
+
+    _default = None
+
+    def __init__(
+        self: "OpeningBook", book_dir: Optional[str] = DEFAULT_BOOK_DIR
+    ) -> None:
+        """Initialize the opening book.
+
+        Args:
+            book_dir: Directory holding the book files, defaults to the books
+                shipped with the game. None gives an empty book that never
+                touches the file system
+        """
+        self.book_dir = book_dir
+        self._trees: Dict[Tuple[int, int], BookTree] = {}
+
+    @classmethod
+    def default(cls: Type["OpeningBook"]) -> "OpeningBook":
+        """Get the process wide book with the shipped trees.
+
+        Returns:
+            OpeningBook: The shared opening book
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def first_guess(code_space: CodeSpace) -> int:
+        """Get the fixed first guess of a configuration.
+
+        The first half of the positions gets the first color and the rest the
+        second color, or all positions the first color if only one exists.
+
+        Args:
+            code_space: Code space of the configuration
+
+        Returns:
+            int: Index of the first guess
+        """
+        positions = code_space.positions
+        if code_space.colors == 1:
+            return 0
+        # Digits 0 ... 0 1 ... 1 with positions - positions // 2 trailing ones
+        return (code_space.colors ** (positions - positions // 2) - 1) // (
+            code_space.colors - 1
+        )
+
+    def path(self: "OpeningBook", positions: int, colors: int) -> str:
+        """Get the file path of a configuration's tree.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+
+        Returns:
+            str: Path of the book file
+        """
+        return os.path.join(self.book_dir, f"book_{positions}x{colors}.bin")
+
+    def lookup(
+        self: "OpeningBook",
+        positions: int,
+        colors: int,
+        history: Sequence[Tuple[int, int]],
+    ) -> Optional[int]:
+        """Look up the next guess for a game history.
+
+        The history only matches the book while every guess made so far is
+        the one the book prescribes.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+            history: (guess, score) pairs of the game so far
+
+        Returns:
+            Optional[int]: Index of the next guess, None if not in the book
+        """
+        tree = self.get_tree(positions, colors)
+        node = ()
+        for guess, score in history:
+            if tree.get(node) != guess:
+                return None
+            node += (score,)
+        return tree.get(node)
+
+    def get_tree(self: "OpeningBook", positions: int, colors: int) -> BookTree:
+        """Get the tree of a configuration, loading it on first use.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+
+        Returns:
+            BookTree: The tree, empty if no book file exists
+        """
+        key = (positions, colors)
+        if key not in self._trees and self.book_dir is None:
+            self._trees[key] = {}
+        if key not in self._trees:
+            try:
+                self._trees[key] = self._read(positions, colors)
+            except (OSError, ValueError, struct.error) as e:
+                if not isinstance(e, FileNotFoundError):
+                    logging.error(f"Failed to load opening book: {e}")
+                self._trees[key] = {}
+        return self._trees[key]
+
+    def save(
+        self: "OpeningBook", positions: int, colors: int, tree: BookTree
+    ) -> None:
+        """Write the tree of a configuration to its book file.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+            tree: The tree to store
+
+        Raises:
+            ValueError: If the book has no directory
+        """
+        if self.book_dir is None:
+            raise ValueError("An opening book without directory cannot be saved")
+        os.makedirs(self.book_dir, exist_ok=True)
+        with open(self.path(positions, colors), "wb") as file:
+            file.write(
+                self._HEADER.pack(
+                    self.MAGIC, self.VERSION, positions, colors, len(tree)
+                )
+            )
+            for node in sorted(tree, key=lambda path: (len(path), path)):
+                file.write(bytes([len(node), *node]))
+                file.write(self._GUESS.pack(tree[node]))
+        self._trees[(positions, colors)] = dict(tree)
+
+    def _read(self: "OpeningBook", positions: int, colors: int) -> BookTree:
+        """Read the tree of a configuration from its book file.
+
+        Args:
+            positions: Number of positions in the code
+            colors: Number of available colors
+
+        Returns:
+            BookTree: The stored tree
+
+        Raises:
+            FileNotFoundError: If no book file exists
+            ValueError: If the file is not a book of this configuration
+        """
+        with open(self.path(positions, colors), "rb") as file:
+            data = file.read()
+
+        magic, version, book_positions, book_colors, count = (
+            self._HEADER.unpack_from(data)
+        )
+        if (magic, version) != (self.MAGIC, self.VERSION):
+            raise ValueError("Unknown opening book format")
+        if (book_positions, book_colors) != (positions, colors):
+            raise ValueError("Opening book belongs to another configuration")
+
+        tree = {}
+        offset = self._HEADER.size
+        for _ in range(count):
+            length = data[offset]
+            node = tuple(data[offset + 1:offset + 1 + length])
+            offset += 1 + length
+            (tree[node],) = self._GUESS.unpack_from(data, offset)
+            offset += self._GUESS.size
+        return tree
+
+
+def build_tree(code_space: CodeSpace, plies: int, workers: int = 1) -> BookTree:
+    """Compute the opening tree of a configuration.
+
+    Every reachable feedback path is expanded up to the given number of guesses
+    and each node gets the guess of an unbudgeted minimax search.
+
+    Args:
+        code_space: Code space of the configuration
+        plies: Number of guesses covered by the tree
+        workers: Number of processes for the search, defaults to 1
+
+    Returns:
+        BookTree: The computed tree
+    """
+    scorer = FeedbackScorer(code_space)
+    search = MinimaxSearch(scorer, workers)
+    search.score_budget = code_space.size**2
+    tree = {}
+    pending: List[Tuple[Tuple[int, ...], np.ndarray, int]] = [
+        ((), np.arange(code_space.size, dtype=np.uint32),
+         OpeningBook.first_guess(code_space))
+    ]
+    try:
+        while pending:
+            node, candidates, guess = pending.pop()
+            tree[node] = guess
+            if len(node) + 1 >= plies:
+                continue
+            scores = scorer.score_many(guess, candidates)
+            for score in np.unique(scores).tolist():
+                if score == scorer.winning_score:
+                    continue
+                remaining = candidates[scores == score]
+                pending.append(
+                    (node + (score,), remaining, search.best_guess(remaining))
+                )
+    finally:
+        search.close()
+    return tree
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Build and store the opening book of a configuration.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv
+    """
+    parser = argparse.ArgumentParser(description="Build a Superhirn opening book")
+    parser.add_argument("positions", type=int)
+    parser.add_argument("colors", type=int)
+    parser.add_argument("--plies", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--book-dir", default=DEFAULT_BOOK_DIR)
+    args = parser.parse_args(argv)
+
+    code_space = CodeSpace(args.positions, args.colors)
+    tree = build_tree(code_space, args.plies, args.workers)
+    OpeningBook(args.book_dir).save(args.positions, args.colors, tree)
+    print(f"Stored {len(tree)} positions in "
+          f"{OpeningBook(args.book_dir).path(args.positions, args.colors)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
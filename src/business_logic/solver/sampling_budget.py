@@ -0,0 +1,30 @@
+"""Module for the budget of the approximate minimax search."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class SamplingBudget:
+    """Limits of the sampling based approximate search.
+
+    Above ``threshold`` candidates the search scores a random sample of
+    guesses against a random sample of candidates instead of the full sets.
+    The sampled search stops evaluating further guesses once ``time_limit``
+    has passed. Smaller candidate sets are searched exactly and without a
+    time limit, so their guesses do not depend on the speed of the machine.
+
+    Attributes:
+        threshold: Largest candidate set that is searched exactly
+        guesses: Number of sampled guesses
+        candidates: Number of sampled candidates
+        time_limit: Seconds after which the sampled search returns the best
+            guess so far
+        seed: Seed of the sampling, None for a random seed
+    """
+
+    threshold: int = 1 << 14
+    guesses: int = 1 << 10
+    candidates: int = 1 << 12
+    time_limit: float = 1.0
+    seed: Optional[int] = None
@@ -0,0 +1,271 @@
+"""Module for the selectable guess strategies of the computer guesser."""
+
+import random
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Type
+
+import numpy as np
+
+from src.business_logic.solver.feedback_scorer import FeedbackScorer # noqa
+from src.business_logic.solver.minimax_search import MinimaxSearch, Partition
+from src.business_logic.solver.sampling_budget import SamplingBudget # noqa
+from src.business_logic.solver.symmetry_group import SymmetryGroup # noqa
+
+DEFAULT_STRATEGY = "minimax"
+
+STRATEGIES: Dict[str, Type["SolverStrategy"]] = {}
+
+
+def register_strategy(name: str) -> Callable[[Type["SolverStrategy"]],
+                                             Type["SolverStrategy"]]:
+    """Register a strategy class under a name.
+
+    Args:
+        name: Name the strategy is selected by
+
+    Returns:
+        Callable: Class decorator adding the class to the registry
+    """
+
+    def decorator(strategy: Type["SolverStrategy"]) -> Type["SolverStrategy"]:
+        """Add the class to the registry.
+
+        Args:
+            strategy: The strategy class
+
+        Returns:
+            Type[SolverStrategy]: The unchanged class
+        """
+        strategy.name = name
+        STRATEGIES[name] = strategy
+        return strategy
+
+    return decorator
+
+
+def available_strategies() -> List[str]:
+    """Get the names of all registered strategies.
+
+    Returns:
+        List[str]: Strategy names in registration order
+    """
+    return list(STRATEGIES)
+
+
+def create_strategy(
+    name: str,
+    scorer: FeedbackScorer,
+    workers: int = 1,
+    sampling: Optional[SamplingBudget] = None,
+) -> "SolverStrategy":
+    """Create a registered strategy.
+
+    Args:
+        name: Name of the strategy
+        scorer: Feedback engine of the code space
+        workers: Number of processes for searching strategies, defaults to 1
+        sampling: Budget of the approximate search, defaults to exact
+
+    Returns:
+        SolverStrategy: The new strategy
+
+    Raises:
+        ValueError: If no strategy is registered under the name
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown solver strategy: {name}")
+    return STRATEGIES[name](scorer, workers, sampling)
+
+
+class SolverStrategy(ABC):
+    """Rule choosing the next guess from the remaining candidates.
+
+    Attributes:
+        name: Name the strategy is registered under
+        scorer: Feedback engine of the code space
+        uses_opening_book: Whether the minimax opening book applies
+        deterministic: Whether equal candidates always give the same guess,
+            which allows caching the decision
+        coverage: Share of its search the last choice covered, 1.0 if it
+            was complete
+        partition: Candidates grouped by their score against the last
+            choice, None if the strategy did not score all of them
+    """
+
+    name = ""
+    uses_opening_book = False
+    deterministic = True
+
+    def __init__(
+        self: "SolverStrategy",
+        scorer: FeedbackScorer,
+        workers: int = 1,
+        sampling: Optional[SamplingBudget] = None,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            scorer: Feedback engine of the code space
+            workers: Number of processes for searching, defaults to 1
+            sampling: Budget of the approximate search, defaults to exact
+        """
+        self.scorer = scorer
+        self.coverage = 1.0
+        self.partition: Optional[Partition] = None
+
+    @abstractmethod
+    def choose(
+        self: "SolverStrategy",
+        candidates: np.ndarray,
+        deadline: Optional[float] = None,
+        symmetry: Optional[SymmetryGroup] = None,
+    ) -> int:
+        """Choose the next guess.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            deadline: time.time() by which the choice must be made, if any
+            symmetry: Symmetries of the history that produced the
+                candidates, if known
+
+        Returns:
+            int: Index of the next guess
+        """
+        pass
+
+    def close(self: "SolverStrategy") -> None:
+        """Release resources held by the strategy."""
+        pass
+
+
+class PartitionStrategy(SolverStrategy):
+    """Strategy picking the guess whose feedback partition scores best.
+
+    Attributes:
+        search: Search rating the partitions of every guess
+    """
+
+    objective = "worst_case"
+
+    def __init__(
+        self: "PartitionStrategy",
+        scorer: FeedbackScorer,
+        workers: int = 1,
+        sampling: Optional[SamplingBudget] = None,
+    ) -> None:
+        """Initialize the strategy and its search.
+
+        Args:
+            scorer: Feedback engine of the code space
+            workers: Number of processes for the search, defaults to 1
+            sampling: Budget of the approximate search, defaults to exact
+        """
+        super().__init__(scorer, workers, sampling)
+        self.search = MinimaxSearch(scorer, workers, self.objective, sampling)
+
+    def choose(
+        self: "PartitionStrategy",
+        candidates: np.ndarray,
+        deadline: Optional[float] = None,
+        symmetry: Optional[SymmetryGroup] = None,
+    ) -> int:
+        """Choose the guess with the best partition of the candidates.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            deadline: time.time() after which the best guess so far is used
+            symmetry: Symmetries of the history, equivalent guesses are
+                evaluated once
+
+        Returns:
+            int: Index of the next guess
+        """
+        guess = self.search.best_guess(
+            candidates, deadline=deadline, symmetry=symmetry
+        )
+        self.coverage = self.search.coverage
+        self.partition = self.search.partition
+        return guess
+
+    def close(self: "PartitionStrategy") -> None:
+        """Shut down the process pool of the search."""
+        self.search.close()
+
+
+@register_strategy("minimax")
+class WorstCaseStrategy(PartitionStrategy):
+    """Knuth's strategy minimizing the largest remaining partition."""
+
+    objective = "worst_case"
+    uses_opening_book = True
+
+
+@register_strategy("expected_size")
+class ExpectedSizeStrategy(PartitionStrategy):
+    """Strategy minimizing the expected number of remaining codes."""
+
+    objective = "expected_size"
+
+
+@register_strategy("entropy")
+class EntropyStrategy(PartitionStrategy):
+    """Strategy maximizing the information gained from the feedback."""
+
+    objective = "entropy"
+
+
+@register_strategy("most_parts")
+class MostPartsStrategy(PartitionStrategy):
+    """Strategy maximizing the number of distinct feedbacks."""
+
+    objective = "most_parts"
+
+
+@register_strategy("random")
+class RandomConsistentStrategy(SolverStrategy):
+    """Cheap strategy guessing a random code that is still possible.
+
+    Attributes:
+        rng: Random number generator picking the guesses
+    """
+
+    deterministic = False
+
+    def __init__(
+        self: "RandomConsistentStrategy",
+        scorer: FeedbackScorer,
+        workers: int = 1,
+        sampling: Optional[SamplingBudget] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            scorer: Feedback engine of the code space
+            workers: Unused, the strategy does not search
+            sampling: Budget whose seed is used if no seed is given
+            seed: Seed of the random number generator, defaults to the
+                sampling seed or a random seed
+        """
+        super().__init__(scorer, workers, sampling)
+        if seed is None and sampling is not None:
+            seed = sampling.seed
+        self.rng = random.Random(seed)
+
+    def choose(
+        self: "RandomConsistentStrategy",
+        candidates: np.ndarray,
+        deadline: Optional[float] = None,
+        symmetry: Optional[SymmetryGroup] = None,
+    ) -> int:
+        """Choose a random candidate.
+
+        Args:
+            candidates: Sorted indices of the remaining possible codes
+            deadline: Unused, the choice takes constant time
+            symmetry: Unused, every candidate is equally likely
+
+        Returns:
+            int: Index of the next guess
+        """
+        return int(candidates[self.rng.randrange(len(candidates))])
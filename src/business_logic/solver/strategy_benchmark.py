@@ -0,0 +1,97 @@
+"""Module for comparing the solver strategies on random secret codes.
+
+The strategies can be compared from the command line, e.g. for 4 positions,
+6 colors and 50 games each::
+
+    python -m src.business_logic.solver.strategy_benchmark 4 6 --games 50
+"""
+
+import argparse
+import random
+import sys
+from typing import Dict, List, Optional, Union
+
+from src.business_logic.simulation import SimulationReport, play_secrets
+from src.business_logic.solver.decision_cache import DecisionCache
+from src.business_logic.solver.strategies import available_strategies
+
+BenchmarkResult = Dict[str, Union[str, float]]
+
+
+def benchmark_strategy(
+    strategy: str,
+    positions: int,
+    colors: int,
+    games: int = 20,
+    seed: int = 0,
+    workers: int = 1,
+) -> BenchmarkResult:
+    """Let a strategy solve random secret codes.
+
+    The games are played like those of the simulation, without a guess
+    limit. All games share one fresh decision cache, like consecutive games
+    of a process do, and the secrets only depend on the seed so strategies
+    are compared on the same codes.
+
+    Args:
+        strategy: Name of the solver strategy
+        positions: Number of positions in the code
+        colors: Number of available colors
+        games: Number of games to play, defaults to 20
+        seed: Seed of the secret codes, defaults to 0
+        workers: Number of processes for the search, defaults to 1
+
+    Returns:
+        BenchmarkResult: Mean and maximum guesses per game and seconds per move
+    """
+    rng = random.Random(seed)
+    size = colors**positions
+    secrets = [rng.randrange(size) for _ in range(games)]
+    report = SimulationReport(positions, colors, strategy)
+    # No guesser needs more guesses than there are codes
+    for result in play_secrets(
+        positions, colors, strategy, secrets, size, workers, DecisionCache()
+    ):
+        report.add_game(result)
+
+    return {
+        "strategy": strategy,
+        "games": report.games,
+        "mean_guesses": report.mean_guesses,
+        "max_guesses": report.max_guesses,
+        "mean_move_time": report.mean_move_time,
+        "max_move_time": report.max_move_time,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Benchmark the selected strategies and print a comparison table.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv
+    """
+    parser = argparse.ArgumentParser(description="Compare Superhirn solver strategies")
+    parser.add_argument("positions", type=int)
+    parser.add_argument("colors", type=int)
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--strategies", nargs="+", choices=available_strategies(),
+        default=available_strategies()
+    )
+    args = parser.parse_args(argv)
+
+    print(f"{'strategy':<14} {'mean':>6} {'max':>4} {'ms/move':>9} {'max ms':>9}")
+    for strategy in args.strategies:
+        result = benchmark_strategy(
+            strategy, args.positions, args.colors, args.games, args.seed, args.workers
+        )
+        print(f"{strategy:<14} {result['mean_guesses']:>6.2f} "
+              f"{result['max_guesses']:>4} "
+              f"{result['mean_move_time'] * 1000:>9.2f} "
+              f"{result['max_move_time'] * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
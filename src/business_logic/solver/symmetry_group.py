@@ -0,0 +1,125 @@
+"""Module for the symmetries of the code space that survive a game history."""
+
+from typing import List
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace # noqa
+
+
+class SymmetryGroup:
+    """Color and position permutations that leave every guess so far unchanged.
+
+    Such a permutation maps the set of possible codes onto itself, so guesses
+    that are images of each other split the candidates into partitions of the
+    same sizes and only one representative per class has to be evaluated.
+
+    The group is tracked as the product of two easily maintained subgroups:
+    permutations of the free colors, which no guess has used yet, and
+    permutations within classes of positions on which every guess has the
+    same color. Each guess removes its colors from the free colors and splits
+    the position classes by its colors.
+
+    Attributes:
+        code_space: Code space of the configuration
+        free_colors: Sorted color digits not used by any guess
+        position_classes: Groups of interchangeable positions
+    """
+
+    def __init__(self: "SymmetryGroup", code_space: CodeSpace) -> None:
+        """Initialize the full group of a game without history.
+
+        Args:
+            code_space: Code space of the configuration
+        """
+        self.code_space = code_space
+        self.free_colors: List[int] = list(range(code_space.colors))
+        self.position_classes: List[List[int]] = [list(range(code_space.positions))]
+
+    def add_guess(self: "SymmetryGroup", guess: int) -> None:
+        """Restrict the group to the permutations that fix a guess.
+
+        Args:
+            guess: Index of the guess
+        """
+        digits = self.code_space.to_digits(guess).tolist()
+        self.free_colors = [
+            color for color in self.free_colors if color not in digits
+        ]
+        classes = []
+        for positions in self.position_classes:
+            by_color = {}
+            for position in positions:
+                by_color.setdefault(digits[position], []).append(position)
+            classes.extend(by_color[color] for color in sorted(by_color))
+        self.position_classes = classes
+
+    def is_trivial(self: "SymmetryGroup") -> bool:
+        """Check whether only the identity is left.
+
+        Returns:
+            bool: True if no two codes are equivalent
+        """
+        return (
+            len(self.free_colors) < 2
+            and len(self.position_classes) == self.code_space.positions
+        )
+
+    def canonical(self: "SymmetryGroup", indices: np.ndarray) -> np.ndarray:
+        """Map codes to a canonical member of their equivalence class.
+
+        Free colors are relabeled by how often they occur in each position
+        class, the most frequent taking the smallest free color, and the
+        colors within each position class are then sorted. Two codes get the
+        same canonical code exactly if a permutation of the group maps one to
+        the other.
+
+        Args:
+            indices: Array of N code indices
+
+        Returns:
+            np.ndarray: Indices of the canonical codes, same shape as indices
+        """
+        positions = self.code_space.positions
+        colors = self.code_space.colors
+        digits = self.code_space.to_digits(indices).reshape(-1, positions)
+        rows = np.arange(len(digits))[:, None]
+
+        if len(self.free_colors) > 1:
+            free = np.array(self.free_colors, dtype=np.uint8)
+            # Occurrences of each free color per position class, read as one
+            # base (positions + 1) number so classes compare in order
+            keys = np.zeros((len(digits), len(free)), dtype=np.int64)
+            for positions_of_class in self.position_classes:
+                occurrences = (
+                    digits[:, positions_of_class, None] == free[None, None, :]
+                ).sum(axis=1)
+                keys = keys * (positions + 1) + occurrences
+            order = np.argsort(-keys, axis=1, kind="stable")
+            mapping = np.tile(np.arange(colors, dtype=np.uint8), (len(digits), 1))
+            mapping[rows, free[order]] = free[None, :]
+            digits = mapping[rows, digits]
+
+        for positions_of_class in self.position_classes:
+            if len(positions_of_class) > 1:
+                digits[:, positions_of_class] = np.sort(
+                    digits[:, positions_of_class], axis=1
+                )
+
+        weights = colors ** np.arange(positions - 1, -1, -1, dtype=np.int64)
+        canonical = (digits.astype(np.int64) * weights).sum(axis=1)
+        return canonical.astype(np.asarray(indices).dtype).reshape(np.shape(indices))
+
+    def representatives(self: "SymmetryGroup", guesses: np.ndarray) -> np.ndarray:
+        """Keep one guess per equivalence class.
+
+        Args:
+            guesses: Indices of the guesses
+
+        Returns:
+            np.ndarray: The first guess of each class, in the given order
+        """
+        if self.is_trivial() or len(guesses) < 2:
+            return guesses
+        _, first = np.unique(self.canonical(guesses), return_index=True)
+        return guesses[np.sort(first)]
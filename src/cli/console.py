@@ -55,10 +55,25 @@ class Console:
                 self.application_logic.save_game()
                 self.menu_renderer.display_save_game()
             elif action == "load_game":
-                next_action = self.application_logic.load_game()
+                next_action = self.choose_saved_game()
                 if next_action != "error":
                     self.start_game_loop(next_action)
 
+    def choose_saved_game(self: "Console") -> str:
+        """Let the user choose which saved game to resume.
+
+        The choice is only asked for if more than one game is saved.
+
+        Returns:
+            str: Game action of the loaded game, 'error' if none was loaded
+        """
+        saves = self.application_logic.get_saved_games()
+        if len(saves) <= 1:
+            return self.application_logic.load_game()
+        self.menu_renderer.display_saved_games(saves)
+        choice = self.input_handler.handle_menu_input()
+        return self.application_logic.load_game(choice)
+
     def handle_language_change(self: "Console") -> None:
         """Handle language selection and update.
 
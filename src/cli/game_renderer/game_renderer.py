@@ -59,12 +59,10 @@ class GameRenderer:
         if not pins:
             return " " * width
 
-        colored_pins = [
-            pin.get_ansi_code() + str(pin.value) + "\033[0m" for pin in pins
-        ]
-        pin_str = " ".join(colored_pins)
+        pin_str = " ".join([pin.get_colored_value() for pin in pins])
 
-        visible_length = len(" ".join(str(pin.value) for pin in pins))
+        # Every pin value is a single digit
+        visible_length = 2 * len(pins) - 1
         padding = (width - visible_length) // 2
 
         return " " * padding + pin_str + " " * (width - visible_length - padding)
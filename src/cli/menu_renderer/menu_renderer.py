@@ -1,6 +1,9 @@
 """Module for rendering game menus."""
 import os
+import time
+from typing import List
 
+from src.business_logic.save_info import SaveInfo # noqa
 from src.util.color_code import ColorCode
 from src.util.translations import translations
 
@@ -156,6 +159,24 @@ class MenuRenderer:
         """
         print(translations[self.language]["loads_resumed_game"])
 
+    def display_saved_games(self: "MenuRenderer", saves: List[SaveInfo]) -> None:
+        """Display the saved games to choose from.
+
+        Shows player, configuration, rounds played and time of each save,
+        numbered starting from 1.
+
+        Args:
+            saves: Metadata of the saved games
+        """
+        print(translations[self.language]["saved_games"])
+        for number, save in enumerate(saves, 1):
+            saved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(save.saved_at))
+            print(
+                f"{number}. {save.player_name} ({save.positions}/{save.colors}) "
+                f"{translations[self.language]['round']} "
+                f"{save.turns}/{save.max_rounds}, {saved_at}"
+            )
+
     def display_start_game(self: "MenuRenderer") -> None:
         """Display game start message.
 
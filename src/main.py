@@ -29,13 +29,15 @@ def main() -> None:
         - business_logic for game flow control
         - Console for user interface
 
-    Then starts the main game loop through the Console.
+    Then starts the main game loop through the Console and closes the
+    persistence, waiting for pending saves, before returning.
     """
     persistence_manager = PersistenceManager()
     business_logic = BusinessLogic(persistence_manager)
     application_logic = ApplicationLogic(business_logic)
     ui = Console(application_logic)
     ui.run()
+    persistence_manager.close()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ This package provides network communication capabilities for online gameplay:
     - NetworkService: Handles game server communication
     - HTTPHandler: Manages HTTP requests
     - HTTPClient: Low-level HTTP client
+    - HttpClientPool: Shares HTTP clients per server across games
     - JsonValidator: Validates JSON data against schema
     - INetworkService: Interface defining network operations
 
@@ -1,30 +1,49 @@
 """Module for handling HTTP client functionality."""
 
 import logging
+import time
 from typing import Dict, Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 4
 
 
 class HttpClient:
     """HTTP client for making requests to the game server.
 
     This class handles making HTTP requests to the game server with proper
-    error handling and logging.
+    error handling and logging. Its session keeps up to pool_size
+    connections to the server open between requests.
 
     Attributes:
         base_url: Base URL for the HTTP requests
         session: Requests session for connection pooling
+        last_used: time.monotonic() of the last request
     """
 
-    def __init__(self: "HttpClient", base_url: str) -> None:
+    def __init__(
+        self: "HttpClient",
+        base_url: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+    ) -> None:
         """Initialize the HttpClient.
 
         Args:
             base_url: The base URL for the HTTP client
+            pool_size: Number of connections kept open to the server
+            keep_alive: False closes the connection after every request
         """
         self.base_url = base_url
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.last_used = time.monotonic()
 
     def post(
         self: "HttpClient", endpoint: str, data: Dict[str, Any], timeout: int = 10
@@ -43,6 +62,7 @@ class HttpClient:
             requests.exceptions.Timeout: If the request times out
             requests.exceptions.RequestException: If the request fails
         """
+        self.last_used = time.monotonic()
         try:
             response = self.session.post(
                 f"{self.base_url}/{endpoint}",
@@ -74,3 +94,7 @@ class HttpClient:
         except Exception as e:
             logging.error(f"Unerwarteter Fehler: {str(e)}")
             return {"error": "Unerwarteter Fehler"}
+
+    def close(self: "HttpClient") -> None:
+        """Close the pooled connections."""
+        self.session.close()
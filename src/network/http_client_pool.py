@@ -0,0 +1,102 @@
+"""Module for sharing HTTP clients between games.
+
+Every online game used to build its own HttpClient, so each game opened
+new connections to the server. The pool keeps one client per server base
+URL for the whole process: a new game against the same server reuses the
+keep-alive connections of the previous one. Clients left unused for
+idle_timeout seconds are closed, since the server drops idle connections
+anyway.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Type
+
+from src.network.http_client import DEFAULT_POOL_SIZE, HttpClient
+
+
+class HttpClientPool:
+    """Pool of HTTP clients keyed by server base URL.
+
+    Attributes:
+        pool_size: Number of connections each client keeps open
+        keep_alive: False closes the connection after every request
+        idle_timeout: Seconds after which an unused client is closed,
+            None to keep clients until the pool is closed
+    """
+
+    DEFAULT_IDLE_TIMEOUT = 60.0
+
+    _default = None
+
+    def __init__(
+        self: "HttpClientPool",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            pool_size: Number of connections each client keeps open
+            keep_alive: False closes the connection after every request
+            idle_timeout: Seconds after which an unused client is closed
+        """
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.idle_timeout = idle_timeout
+        self._clients: Dict[str, HttpClient] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls: Type["HttpClientPool"]) -> "HttpClientPool":
+        """Get the pool shared by all games of the process.
+
+        Returns:
+            HttpClientPool: The shared pool
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def __len__(self: "HttpClientPool") -> int:
+        """Get the number of pooled clients.
+
+        Returns:
+            int: Number of clients
+        """
+        return len(self._clients)
+
+    def get(self: "HttpClientPool", base_url: str) -> HttpClient:
+        """Get the client of a server, creating it if needed.
+
+        Args:
+            base_url: Base URL of the server
+
+        Returns:
+            HttpClient: The pooled client
+        """
+        with self._lock:
+            self._evict_idle()
+            client = self._clients.get(base_url)
+            if client is None:
+                client = HttpClient(base_url, self.pool_size, self.keep_alive)
+                self._clients[base_url] = client
+            return client
+
+    def _evict_idle(self: "HttpClientPool") -> None:
+        """Close and drop the clients unused for idle_timeout seconds."""
+        if self.idle_timeout is None:
+            return
+        oldest = time.monotonic() - self.idle_timeout
+        for base_url, client in list(self._clients.items()):
+            if client.last_used < oldest:
+                client.close()
+                del self._clients[base_url]
+
+    def close(self: "HttpClientPool") -> None:
+        """Close all pooled clients."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
@@ -1,19 +1,24 @@
 """Module for handling HTTP communication with the game server."""
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import requests
 
-from src.network.http_client import HttpClient
+from src.network.http_client_pool import HttpClientPool
 from src.network.json_validator import JsonValidator
 
+SCHEMA_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../util/schema.json")
+)
+
 
 class HttpHandler:
     """Handler for HTTP communication with the game server.
 
     This class manages HTTP requests to the game server including starting new games
-    and making moves.
+    and making moves. The HTTP client comes from a pool shared by the
+    process, so handlers for the same server reuse its connections.
 
     Attributes:
         base_url: Base URL of the game server
@@ -21,20 +26,24 @@ class HttpHandler:
         validate: JSON schema validator
     """
 
-    def __init__(self: "HttpHandler", server_ip: str, server_port: int) -> None:
+    def __init__(
+        self: "HttpHandler",
+        server_ip: str,
+        server_port: int,
+        client_pool: Optional[HttpClientPool] = None,
+    ) -> None:
         """Initialize the HttpHandler with server IP and port.
 
         Args:
             server_ip: The IP address of the game server
             server_port: The port number of the game server
+            client_pool: Pool to take the HTTP client from, defaults to the
+                pool shared by the process
         """
         self.base_url = f"http://{server_ip}:{server_port}"
-        self.http_client = HttpClient(self.base_url)
-
-        schema_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "../util/schema.json")
-        )
-        self.validate = JsonValidator(schema_path)
+        pool = client_pool if client_pool is not None else HttpClientPool.default()
+        self.http_client = pool.get(self.base_url)
+        self.validate = JsonValidator.for_schema(SCHEMA_PATH)
 
     def send_json_via_post(
         self: "HttpHandler", json_data: Dict[str, Any]
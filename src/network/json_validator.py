@@ -2,7 +2,7 @@
 
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Type
 
 from jsonschema.exceptions import ValidationError
 from jsonschema.validators import validate
@@ -17,6 +17,8 @@ class JsonValidator:
         schema: The loaded JSON schema used for validation
     """
 
+    _loaded: Dict[str, "JsonValidator"] = {}
+
     def __init__(self: "JsonValidator", schema_path: str) -> None:
         """Initialize the JsonValidator with a schema.
 
@@ -29,6 +31,24 @@ class JsonValidator:
         """
         self.schema = self._load_schema(schema_path)
 
+    @classmethod
+    def for_schema(
+        cls: Type["JsonValidator"], schema_path: str
+    ) -> "JsonValidator":
+        """Get a validator of a schema file, loading the file only once.
+
+        Args:
+            schema_path: Path to the JSON schema file
+
+        Returns:
+            JsonValidator: The validator shared by the process
+        """
+        validator = cls._loaded.get(schema_path)
+        if validator is None:
+            validator = cls(schema_path)
+            cls._loaded[schema_path] = validator
+        return validator
+
     def _load_schema(self: "JsonValidator", schema_path: str) -> Dict[str, Any]:
         """Load JSON schema from file.
 
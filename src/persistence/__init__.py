@@ -3,7 +3,14 @@
 This package provides functionality for saving and loading game states:
     - PersistenceManager: Handles saving/loading game states to/from files
     - IPersistenceManager: Interface defining persistence operations
+    - game_archive: SQLite archive and statistics of finished games
+    - game_journal: Append-only journal of the game in progress
+    - IGameJournal: Interface of the journal the game state records to
+    - save_format: Versioned binary save format with checksum
+    - save_index: In-memory index of the saved games
+    - save_migrator: Conversion of legacy pickle saves
+    - save_writer: Atomic background writing of saves
 
-The persistence layer uses pickle for serialization and follows the
-layered architecture pattern.
+The persistence layer stores games in the binary save format and follows
+the layered architecture pattern.
 """
@@ -0,0 +1,392 @@
+"""Module for the archive of finished games.
+
+Every finished game is recorded in an SQLite database next to the saves:
+its configuration, player, mode, outcome and every move with its guess,
+feedback and duration. Besides the games and moves, the archive keeps one
+row of running totals per player, guessing side and configuration, which
+is updated with each recorded game. Statistics are aggregated from these
+totals, so win rates, average guesses and leaderboards are answered in
+milliseconds however many games are archived.
+"""
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from src.business_logic.game_state import GameState # noqa
+from src.util.feedback_color_code import FeedbackColorCode
+
+ARCHIVE_FILE = "history.sqlite3"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player_name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    guesser TEXT NOT NULL,
+    positions INTEGER NOT NULL,
+    colors INTEGER NOT NULL,
+    max_rounds INTEGER NOT NULL,
+    secret_code BLOB,
+    guesses INTEGER NOT NULL,
+    solved INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    duration REAL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_player ON games (player_name);
+CREATE INDEX IF NOT EXISTS games_by_configuration ON games (positions, colors);
+
+CREATE TABLE IF NOT EXISTS moves (
+    game_id INTEGER NOT NULL REFERENCES games (id),
+    turn INTEGER NOT NULL,
+    guess BLOB NOT NULL,
+    feedback BLOB NOT NULL,
+    seconds REAL,
+    PRIMARY KEY (game_id, turn)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS totals (
+    positions INTEGER NOT NULL,
+    colors INTEGER NOT NULL,
+    guesser TEXT NOT NULL,
+    player_name TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    solved INTEGER NOT NULL,
+    solved_guesses INTEGER NOT NULL,
+    PRIMARY KEY (positions, colors, guesser, player_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS totals_by_player
+    ON totals (player_name, guesser);
+"""
+
+ADD_TOTALS = """
+INSERT INTO totals VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+ON CONFLICT (positions, colors, guesser, player_name) DO UPDATE SET
+    games = games + 1,
+    wins = wins + excluded.wins,
+    solved = solved + excluded.solved,
+    solved_guesses = solved_guesses + excluded.solved_guesses
+"""
+
+
+@dataclass
+class ArchivedGame:
+    """Summary of an archived game.
+
+    Attributes:
+        game_id: Number of the game in the archive
+        player_name: Name of the player
+        mode: Game mode the player chose, e.g. "guesser" or "coder"
+        guesser: Who guessed, "player" or "computer"
+        positions: Number of positions in the code
+        colors: Number of available colors
+        guesses: Number of guesses made
+        solved: True if the code was guessed
+        won: True if the player won
+        duration: Seconds of all timed moves, None if no move was timed
+        finished_at: time.time() the game ended
+    """
+
+    game_id: int
+    player_name: str
+    mode: str
+    guesser: str
+    positions: int
+    colors: int
+    guesses: int
+    solved: bool
+    won: bool
+    duration: Optional[float]
+    finished_at: float
+
+
+@dataclass
+class LeaderboardEntry:
+    """Standing of a player in a configuration.
+
+    Attributes:
+        player_name: Name of the player
+        games: Number of games played
+        wins: Number of games won
+        win_rate: Share of games won
+        average_guesses: Average guesses of the solved games, None if no
+            game was solved
+    """
+
+    player_name: str
+    games: int
+    wins: int
+    win_rate: float
+    average_guesses: Optional[float]
+
+
+def _is_solved(game_state: GameState) -> bool:
+    """Check whether the last guess of a game matched the code.
+
+    Args:
+        game_state: The finished game
+
+    Returns:
+        bool: True if the last feedback is all black pins
+    """
+    turns = game_state.get_turns()
+    return bool(turns) and turns[-1].packed_feedback == bytes(
+        [FeedbackColorCode.BLACK.value] * game_state.positions
+    )
+
+
+def _filters(
+    player_name: Optional[str],
+    positions: Optional[int],
+    colors: Optional[int],
+    guesser: Optional[str],
+) -> Tuple[str, list]:
+    """Build the condition selecting rows of the totals.
+
+    Args:
+        player_name: Name of the player, None for all players
+        positions: Number of positions, None for all
+        colors: Number of colors, None for all
+        guesser: "player" or "computer", None for both
+
+    Returns:
+        Tuple[str, list]: WHERE clause and its parameters
+    """
+    columns = {
+        "player_name": player_name,
+        "positions": positions,
+        "colors": colors,
+        "guesser": guesser,
+    }
+    conditions = [f"{name} = ?" for name, value in columns.items()
+                  if value is not None]
+    parameters = [value for value in columns.values() if value is not None]
+    if not conditions:
+        return "", parameters
+    return " WHERE " + " AND ".join(conditions), parameters
+
+
+class GameArchive:
+    """SQLite archive of finished games and their statistics.
+
+    The database is opened on first use.
+
+    Attributes:
+        path: Path of the database file
+    """
+
+    def __init__(self: "GameArchive", path: str) -> None:
+        """Initialize the archive of a database file.
+
+        Args:
+            path: Path of the database file, created if missing
+        """
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self: "GameArchive") -> sqlite3.Connection:
+        """Get the connection, opening the database and its schema.
+
+        Returns:
+            sqlite3.Connection: Connection to the database
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            with connection:
+                connection.executescript(SCHEMA)
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._connection = connection
+        return self._connection
+
+    def record_game(
+        self: "GameArchive",
+        game_state: GameState,
+        mode: str,
+        won: bool,
+        move_times: Sequence[Optional[float]] = (),
+        finished_at: Optional[float] = None,
+    ) -> int:
+        """Archive a finished game.
+
+        Args:
+            game_state: The finished game
+            mode: Game mode the player chose
+            won: True if the player won
+            move_times: Seconds each turn took, None for untimed turns
+            finished_at: time.time() the game ended, defaults to now
+
+        Returns:
+            int: Number of the game in the archive
+        """
+        descriptor = game_state.describe_guesser()
+        guesser = descriptor["type"] if descriptor else "player"
+        turns = game_state.get_turns()
+        solved = _is_solved(game_state)
+        timed = [seconds for seconds in move_times if seconds is not None]
+        with self.connection as connection:
+            cursor = connection.execute(
+                "INSERT INTO games (player_name, mode, guesser, positions, colors,"
+                " max_rounds, secret_code, guesses, solved, won, duration,"
+                " finished_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    game_state.player_name,
+                    mode,
+                    guesser,
+                    game_state.positions,
+                    game_state.colors,
+                    game_state.max_rounds,
+                    game_state.packed_secret_code,
+                    len(turns),
+                    solved,
+                    won,
+                    sum(timed) if timed else None,
+                    time.time() if finished_at is None else finished_at,
+                ),
+            )
+            game_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT INTO moves VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        game_id,
+                        number,
+                        turn.packed_guesses,
+                        turn.packed_feedback,
+                        move_times[number] if number < len(move_times) else None,
+                    )
+                    for number, turn in enumerate(turns)
+                ],
+            )
+            connection.execute(
+                ADD_TOTALS,
+                (
+                    game_state.positions,
+                    game_state.colors,
+                    guesser,
+                    game_state.player_name,
+                    won,
+                    solved,
+                    len(turns) if solved else 0,
+                ),
+            )
+        return game_id
+
+    def win_rate(
+        self: "GameArchive",
+        player_name: Optional[str] = None,
+        positions: Optional[int] = None,
+        colors: Optional[int] = None,
+        guesser: Optional[str] = None,
+    ) -> Optional[float]:
+        """Get the share of games won by the player.
+
+        Args:
+            player_name: Name of the player, None for all players
+            positions: Number of positions, None for all
+            colors: Number of colors, None for all
+            guesser: "player" or "computer", None for both
+
+        Returns:
+            Optional[float]: Share of won games, None without games
+        """
+        where, parameters = _filters(player_name, positions, colors, guesser)
+        games, wins = self.connection.execute(
+            f"SELECT SUM(games), SUM(wins) FROM totals{where}", parameters
+        ).fetchone()
+        return wins / games if games else None
+
+    def average_guesses(
+        self: "GameArchive",
+        player_name: Optional[str] = None,
+        positions: Optional[int] = None,
+        colors: Optional[int] = None,
+        guesser: Optional[str] = "player",
+    ) -> Optional[float]:
+        """Get the average number of guesses needed to solve a code.
+
+        Args:
+            player_name: Name of the player, None for all players
+            positions: Number of positions, None for all
+            colors: Number of colors, None for all
+            guesser: "player" or "computer", None for both
+
+        Returns:
+            Optional[float]: Average guesses of the solved games, None if no
+                game was solved
+        """
+        where, parameters = _filters(player_name, positions, colors, guesser)
+        solved, guesses = self.connection.execute(
+            f"SELECT SUM(solved), SUM(solved_guesses) FROM totals{where}",
+            parameters,
+        ).fetchone()
+        return guesses / solved if solved else None
+
+    def leaderboard(
+        self: "GameArchive", positions: int, colors: int, limit: int = 10
+    ) -> List[LeaderboardEntry]:
+        """Rank the guessing players of a configuration.
+
+        Players are ranked by wins, then by fewer average guesses.
+
+        Args:
+            positions: Number of positions
+            colors: Number of colors
+            limit: Number of players to rank
+
+        Returns:
+            List[LeaderboardEntry]: The best players, the best first
+        """
+        rows = self.connection.execute(
+            "SELECT player_name, games, wins,"
+            " CAST(solved_guesses AS REAL) / NULLIF(solved, 0) AS average"
+            " FROM totals WHERE positions = ? AND colors = ? AND guesser = ?"
+            " ORDER BY wins DESC, average IS NULL, average, player_name"
+            " LIMIT ?",
+            (positions, colors, "player", limit),
+        ).fetchall()
+        return [
+            LeaderboardEntry(name, games, wins, wins / games, average)
+            for name, games, wins, average in rows
+        ]
+
+    def recent_games(
+        self: "GameArchive", player_name: Optional[str] = None, limit: int = 10
+    ) -> List[ArchivedGame]:
+        """List the last finished games.
+
+        Args:
+            player_name: Name of the player, None for all players
+            limit: Number of games to list
+
+        Returns:
+            List[ArchivedGame]: The games, the last archived first
+        """
+        where = " WHERE player_name = ?" if player_name is not None else ""
+        parameters = [player_name] if player_name is not None else []
+        rows = self.connection.execute(
+            "SELECT id, player_name, mode, guesser, positions, colors, guesses,"
+            f" solved, won, duration, finished_at FROM games{where}"
+            " ORDER BY id DESC LIMIT ?",
+            parameters + [limit],
+        ).fetchall()
+        return [
+            ArchivedGame(
+                game_id, name, mode, guesser, positions, colors, guesses,
+                bool(solved), bool(won), duration, finished_at
+            )
+            for (game_id, name, mode, guesser, positions, colors, guesses,
+                 solved, won, duration, finished_at) in rows
+        ]
+
+    def close(self: "GameArchive") -> None:
+        """Close the database if it is open."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
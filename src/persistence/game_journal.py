@@ -0,0 +1,324 @@
+"""Module for the append-only journal of a game in progress.
+
+While a game is played, every turn added or completed with feedback is
+appended to the journal of the game as one small record instead of
+rewriting a save. After a crash the journal is replayed to recover the
+game. A journal consists of a header and records::
+
+    header   magic "SHJL", format version
+    record   type, payload length, payload, CRC32 of type, length and payload
+
+The first record is a snapshot, the save slot of the game and the game in
+the save format. Turn records hold the index of the turn as uint16, which
+covers every turn the save format can hold, its guess and its feedback, or
+the byte FEEDBACK_PENDING of the save format while it is not given yet.
+All writes go through a SaveWriter, so the console never waits for the
+disk: records are appended by its worker thread, which syncs them to the
+disk after every ``sync_every`` records and batches the records queued
+while it is busy into one write and sync. After ``compact_every`` turn
+records the journal is atomically replaced by a new snapshot, so
+replaying it takes bounded time.
+"""
+
+import struct
+import zlib
+from typing import Iterator, Optional, Tuple
+
+from src.business_logic.game_state import GameState # noqa
+from src.business_logic.game_turn import GameTurn
+from src.persistence import save_format
+from src.persistence.i_game_journal import IGameJournal
+from src.persistence.save_format import FEEDBACK_PENDING, SaveFormatError
+from src.persistence.save_writer import SaveWriter
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+JOURNAL_MAGIC = b"SHJL"
+JOURNAL_VERSION = 1
+JOURNAL_EXTENSION = ".journal"
+
+JOURNAL_HEADER = struct.Struct("<4sB")
+RECORD = struct.Struct("<BI")
+CHECKSUM = struct.Struct("<I")
+SLOT_LENGTH = struct.Struct("<H")
+TURN_INDEX = struct.Struct("<H")
+
+RECORD_SNAPSHOT = 1
+RECORD_TURN = 2
+
+SYNC_EVERY = 1
+COMPACT_EVERY = 8
+
+
+def _pack_record(record_type: int, payload: bytes) -> bytes:
+    """Frame a record with its type, length and checksum.
+
+    Args:
+        record_type: RECORD_SNAPSHOT or RECORD_TURN
+        payload: Content of the record
+
+    Returns:
+        bytes: The framed record
+    """
+    framed = RECORD.pack(record_type, len(payload)) + payload
+    return framed + CHECKSUM.pack(zlib.crc32(framed))
+
+
+class GameJournal(IGameJournal):
+    """Append-only journal of a game in progress.
+
+    The journal attaches itself to the game state, which records its turns
+    in it. It starts with a snapshot of the game.
+
+    Attributes:
+        path: Path of the journal file
+        game_state: The journaled game
+        save_slot: Save slot of the game, None if it was never saved
+        writer: Background writer of the journal file
+        sync_every: Records per sync to the disk, 0 syncs only when
+            compacting or closing
+        compact_every: Turn records per new snapshot, 0 never compacts
+        records: Turn records since the snapshot
+        unsynced: Records not yet synced to the disk
+    """
+
+    def __init__(
+        self: "GameJournal",
+        path: str,
+        game_state: GameState,
+        save_slot: Optional[str] = None,
+        sync_every: int = SYNC_EVERY,
+        compact_every: int = COMPACT_EVERY,
+        writer: Optional[SaveWriter] = None,
+    ) -> None:
+        """Start the journal of a game with a snapshot.
+
+        Args:
+            path: Path of the journal file, replaced if it exists
+            game_state: The game to journal
+            save_slot: Save slot of the game, None if it was never saved
+            sync_every: Records per sync to the disk
+            compact_every: Turn records per new snapshot
+            writer: Background writer to share, a new one if None
+        """
+        self.path = path
+        self.game_state = game_state
+        self.save_slot = save_slot
+        self.writer = writer or SaveWriter()
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.records = 0
+        self.unsynced = 0
+        self._open = True
+        self.compact()
+        game_state.journal = self
+
+    def compact(
+        self: "GameJournal",
+        save_slot: Optional[str] = None,
+        encoded: Optional[bytes] = None,
+    ) -> None:
+        """Replace the journal by a snapshot of the game.
+
+        The writer replaces the journal atomically, so a crash leaves
+        either journal intact; records queued before are dropped.
+
+        Args:
+            save_slot: New save slot of the game, unchanged if None
+            encoded: The game in the save format if it was just encoded for
+                a save, encoded anew if None
+        """
+        if save_slot is not None:
+            self.save_slot = save_slot
+        if not self._open:
+            return
+        if encoded is None:
+            encoded = save_format.encode(self.game_state)
+        slot = (self.save_slot or "").encode("utf-8")
+        payload = SLOT_LENGTH.pack(len(slot)) + slot + encoded
+        self.writer.submit(
+            self.path,
+            JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION)
+            + _pack_record(RECORD_SNAPSHOT, payload),
+        )
+        self.records = 0
+        self.unsynced = 0
+
+    def record_turn(self: "GameJournal", index: int, turn: GameTurn) -> None:
+        """Append a turn to the journal.
+
+        Args:
+            index: Position of the turn in the game
+            turn: The turn as it is now
+        """
+        if not self._open:
+            return
+        self.records += 1
+        if self.compact_every and self.records >= self.compact_every:
+            self.compact()
+            return
+        feedback = (
+            bytes([FEEDBACK_PENDING]) if turn.feedback_pending
+            else turn.packed_feedback
+        )
+        payload = TURN_INDEX.pack(index) + turn.packed_guesses + feedback
+        self.unsynced += 1
+        sync = bool(self.sync_every) and self.unsynced >= self.sync_every
+        self.writer.append(self.path, _pack_record(RECORD_TURN, payload), sync)
+        if sync:
+            self.unsynced = 0
+
+    def sync(self: "GameJournal") -> None:
+        """Have the writer sync all recorded turns to the disk."""
+        if not self._open or not self.unsynced:
+            return
+        self.writer.append(self.path, b"", sync=True)
+        self.unsynced = 0
+
+    def close(self: "GameJournal") -> None:
+        """Sync and close the journal, keeping it for recovery.
+
+        Raises:
+            OSError: If the journal or a save could not be written
+        """
+        if not self._open:
+            return
+        self.sync()
+        self._detach()
+        self.writer.flush()
+
+    def discard(self: "GameJournal") -> None:
+        """Close and delete the journal once the game needs no recovery."""
+        if self._open:
+            self._detach()
+        self.writer.remove(self.path)
+
+    def _detach(self: "GameJournal") -> None:
+        """Stop recording turns of the game."""
+        self._open = False
+        if self.game_state.journal is self:
+            self.game_state.journal = None
+
+
+def _records(data: bytes, offset: int) -> Iterator[Tuple[int, bytes]]:
+    """Iterate over the intact records of a journal.
+
+    A record that is cut off or fails its checksum was torn by a crash; it
+    and everything after it are ignored.
+
+    Args:
+        data: The journal
+        offset: Position of the first record
+
+    Yields:
+        Tuple[int, bytes]: Type and payload of each record
+    """
+    while offset + RECORD.size + CHECKSUM.size <= len(data):
+        record_type, length = RECORD.unpack_from(data, offset)
+        end = offset + RECORD.size + length
+        if end + CHECKSUM.size > len(data):
+            return
+        (checksum,) = CHECKSUM.unpack_from(data, end)
+        if zlib.crc32(data[offset:end]) != checksum:
+            return
+        yield record_type, data[offset + RECORD.size:end]
+        offset = end + CHECKSUM.size
+
+
+def _read_snapshot(payload: bytes) -> Tuple[GameState, Optional[str]]:
+    """Parse a snapshot record.
+
+    Args:
+        payload: Content of the record
+
+    Returns:
+        Tuple[GameState, Optional[str]]: The game and its save slot
+
+    Raises:
+        SaveFormatError: If the snapshot is invalid
+    """
+    if len(payload) < SLOT_LENGTH.size:
+        raise SaveFormatError("Journal snapshot is truncated")
+    (length,) = SLOT_LENGTH.unpack_from(payload)
+    start = SLOT_LENGTH.size
+    try:
+        save_slot = payload[start:start + length].decode("utf-8")
+    except UnicodeDecodeError:
+        raise SaveFormatError("Journal holds an invalid save slot") from None
+    return save_format.decode(payload[start + length:]), save_slot or None
+
+
+def _apply_turn(game_state: GameState, payload: bytes) -> None:
+    """Add or replace the turn of a turn record.
+
+    Args:
+        game_state: The game being recovered
+        payload: Content of the record
+
+    Raises:
+        SaveFormatError: If the turn is invalid or does not follow the game
+    """
+    positions = game_state.positions
+    start = TURN_INDEX.size
+    if len(payload) < start + positions:
+        raise SaveFormatError("Journal holds a truncated turn")
+    (index,) = TURN_INDEX.unpack_from(payload)
+    feedback = payload[start + positions:]
+    try:
+        turn = GameTurn(
+            [ColorCode.from_value(value)
+             for value in payload[start:start + positions]],
+            None if feedback == bytes([FEEDBACK_PENDING])
+            else [FeedbackColorCode.from_value(value) for value in feedback],
+        )
+        if index < len(game_state.turns):
+            game_state.turns[index] = turn
+        elif index == len(game_state.turns):
+            game_state.add_turn(turn)
+        else:
+            raise ValueError(f"turn {index} follows turn {len(game_state.turns)}")
+    except ValueError as error:
+        raise SaveFormatError(f"Journal holds an invalid turn: {error}") from None
+
+
+def replay(data: bytes) -> Tuple[GameState, Optional[str]]:
+    """Recover the game of a journal.
+
+    Args:
+        data: The journal
+
+    Returns:
+        Tuple[GameState, Optional[str]]: The game at its last intact record
+            with its guesser restored, and its save slot
+
+    Raises:
+        SaveFormatError: If the data is no journal or holds no snapshot
+    """
+    if len(data) < JOURNAL_HEADER.size:
+        raise SaveFormatError("Journal is truncated")
+    magic, version = JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC:
+        raise SaveFormatError("Data is not a Superhirn journal")
+    if version != JOURNAL_VERSION:
+        raise SaveFormatError(f"Unsupported journal version {version}")
+
+    game_state = save_slot = None
+    replayed = False
+    for record_type, payload in _records(data, JOURNAL_HEADER.size):
+        if record_type == RECORD_SNAPSHOT:
+            game_state, save_slot = _read_snapshot(payload)
+            replayed = False
+        elif record_type != RECORD_TURN:
+            raise SaveFormatError(f"Unknown journal record {record_type}")
+        elif game_state is None:
+            raise SaveFormatError("Journal does not start with a snapshot")
+        else:
+            _apply_turn(game_state, payload)
+            replayed = True
+    if game_state is None:
+        raise SaveFormatError("Journal holds no snapshot")
+    if replayed:
+        game_state.current_guesser = game_state.restore_guesser(
+            game_state.describe_guesser()
+        )
+    return game_state, save_slot
@@ -0,0 +1,38 @@
+"""Interface for the journal of a game in progress."""
+from abc import ABC, abstractmethod
+
+from src.business_logic.game_turn import GameTurn # noqa
+
+
+class IGameJournal(ABC):
+    """Interface for the journal of a game in progress.
+
+    A game state with a journal reports every turn added or completed with
+    feedback to it, so the game can be recovered after a crash.
+    """
+
+    @abstractmethod
+    def record_turn(self: "IGameJournal", index: int, turn: GameTurn) -> None:
+        """Append a turn to the journal.
+
+        Args:
+            index: Position of the turn in the game, a recorded index
+                replaces the earlier record of the turn
+            turn: The turn as it is now
+        """
+        pass
+
+    @abstractmethod
+    def sync(self: "IGameJournal") -> None:
+        """Write all recorded turns through to the disk."""
+        pass
+
+    @abstractmethod
+    def close(self: "IGameJournal") -> None:
+        """Sync and close the journal, keeping it for recovery."""
+        pass
+
+    @abstractmethod
+    def discard(self: "IGameJournal") -> None:
+        """Close and delete the journal once the game needs no recovery."""
+        pass
@@ -1,28 +1,33 @@
 """Interface for persistence management."""
 from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
 
 from src.business_logic.game_state import GameState # noqa
+from src.business_logic.save_info import SaveInfo # noqa
+from src.persistence.game_archive import GameArchive # noqa
 
 
 class IPersistenceManager(ABC):
     """Interface for persistence management.
 
     This interface defines the contract for managing game state persistence,
-    including saving and loading game states.
+    including saving and loading game states in one slot per game and
+    journaling the game in progress for crash recovery and archiving
+    finished games.
     """
 
     @abstractmethod
     def save_game_state(
         self: "IPersistenceManager",
         game_state: GameState,
-        file_path: str = "game_state.pkl",
+        file_path: str = "game_state.sav",
     ) -> None:
         """Save the current game state to a file.
 
         Args:
             game_state: The game state to save
             file_path: The file path where the game state will be saved.
-                      Defaults to "game_state.pkl"
+                      Defaults to "game_state.sav"
 
         Raises:
             TypeError: If game_state is not an instance of GameState
@@ -31,20 +36,73 @@ class IPersistenceManager(ABC):
 
     @abstractmethod
     def load_game_state(
-        self: "IPersistenceManager", file_path: str = "game_state.pkl"
+        self: "IPersistenceManager", file_path: Optional[str] = None
     ) -> GameState:
         """Load the game state from a file.
 
         Args:
             file_path: The file path from where to load.
-                      Defaults to "game_state.pkl"
+                      Defaults to the most recently saved game
 
         Returns:
             GameState: The loaded game state
 
         Raises:
             FileNotFoundError: If the save file doesn't exist
-            pickle.UnpicklingError: If the file contains invalid data
+            SaveFormatError: If the file contains invalid data
+        """
+        pass
+
+    @abstractmethod
+    def flush(
+        self: "IPersistenceManager", timeout: Optional[float] = None
+    ) -> bool:
+        """Wait until all saves are written to disk.
+
+        Args:
+            timeout: Seconds to wait at most, None waits until done
+
+        Returns:
+            bool: True if all saves are written, False on timeout
+
+        Raises:
+            OSError: If a save could not be written
+        """
+        pass
+
+    @abstractmethod
+    def close(self: "IPersistenceManager") -> None:
+        """Wait for pending saves and release open files.
+
+        Raises:
+            OSError: If a save could not be written
+        """
+        pass
+
+    @abstractmethod
+    def archive_game(
+        self: "IPersistenceManager",
+        game_state: GameState,
+        mode: str,
+        won: bool,
+        move_times: Sequence[Optional[float]] = (),
+    ) -> None:
+        """Record a finished game in the archive.
+
+        Args:
+            game_state: The finished game
+            mode: Game mode the player chose
+            won: True if the player won
+            move_times: Seconds each turn took, None for untimed turns
+        """
+        pass
+
+    @abstractmethod
+    def get_archive(self: "IPersistenceManager") -> GameArchive:
+        """Get the archive of finished games for statistics queries.
+
+        Returns:
+            GameArchive: History of the finished games
         """
         pass
 
@@ -56,3 +114,44 @@ class IPersistenceManager(ABC):
             bool: True if a saved game exists, False otherwise
         """
         pass
+
+    @abstractmethod
+    def list_saved_games(self: "IPersistenceManager") -> List[SaveInfo]:
+        """List the saved games.
+
+        Returns:
+            List[SaveInfo]: Metadata of every saved game, the most recent
+                first
+        """
+        pass
+
+    @abstractmethod
+    def new_save_slot(self: "IPersistenceManager", player_name: str) -> str:
+        """Choose the file a new game of a player is saved to.
+
+        Args:
+            player_name: Name of the player
+
+        Returns:
+            str: Unused file name for the save
+        """
+        pass
+
+    @abstractmethod
+    def start_journal(
+        self: "IPersistenceManager",
+        game_state: GameState,
+        save_slot: Optional[str] = None,
+    ) -> None:
+        """Journal the turns of a game in progress.
+
+        Args:
+            game_state: The game to journal
+            save_slot: Save slot of the game, None if it was never saved
+        """
+        pass
+
+    @abstractmethod
+    def end_journal(self: "IPersistenceManager") -> None:
+        """Discard the journal of the game in progress, if any."""
+        pass
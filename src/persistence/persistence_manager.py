@@ -1,36 +1,171 @@
 """Module for managing game state persistence."""
 
 import os
-import pickle
+import tempfile
+from typing import List, Optional, Sequence
 from src.business_logic.game_state import GameState
+from src.business_logic.save_info import SaveInfo # noqa
+from src.persistence import game_journal, save_format
+from src.persistence.game_archive import ARCHIVE_FILE, GameArchive
+from src.persistence.game_journal import (
+    COMPACT_EVERY,
+    JOURNAL_EXTENSION,
+    SYNC_EVERY,
+    GameJournal,
+)
 from src.persistence.i_persistence_manager import IPersistenceManager
+from src.persistence.save_format import SaveMetadata # noqa
+from src.persistence.save_index import SaveIndex
+from src.persistence.save_migrator import migrate_legacy_save
+from src.persistence.save_writer import TEMP_SUFFIX, SaveWriter
+
+SAVE_FILE = "game_state.sav"
+LEGACY_SAVE_FILE = "game_state.pkl"
 
 
 class PersistenceManager(IPersistenceManager):
     """Manages the persistence of game states.
 
-    This class handles saving and loading game states to/from files.
+    This class handles saving and loading game states to/from files in the
+    binary save format. Every game is saved in its own slot, a file of the
+    save directory, and a SaveIndex keeps the metadata of all slots in
+    memory, so listing the saved games touches no save file. A legacy pickle
+    save is migrated to the slot game_state.sav on start.
+    The game in progress can be journaled; journals left behind by a crash
+    are replayed on start and their games saved to their slots.
+    Saves, the index and the journal are written by a background
+    SaveWriter; flush waits for them. Finished games are recorded in a GameArchive.
     Implements the IPersistenceManager interface.
 
     Attributes:
         save_dir (str): Directory path where game states are saved
+        index (SaveIndex): Metadata of the saved games
+        writer (SaveWriter): Background writer of the saves, the index and
+            the journal
+        archive (GameArchive): History of the finished games
+        journal (Optional[GameJournal]): Journal of the game in progress
+        sync_every (int): Journal records per sync to the disk
+        compact_every (int): Journal records per snapshot
     """
 
-    def __init__(self: "PersistenceManager") -> None:
+    def __init__(
+        self: "PersistenceManager",
+        save_dir: Optional[str] = None,
+        sync_every: int = SYNC_EVERY,
+        compact_every: int = COMPACT_EVERY,
+    ) -> None:
         """Initialize the PersistenceManager.
 
-        Creates the save directory if it doesn't exist.
+        Creates the save directory if it doesn't exist, loads the index and
+        recovers the games of left over journals.
+
+        Args:
+            save_dir: Directory of the saves, defaults to src/saves
+            sync_every: Journal records per sync to the disk, 0 syncs only
+                on snapshots
+            compact_every: Journal records per snapshot, 0 never compacts
         """
-        self.save_dir = os.path.join(os.path.dirname(__file__), "..", "saves")
+        self.save_dir = save_dir or os.path.join(
+            os.path.dirname(__file__), "..", "saves"
+        )
         os.makedirs(self.save_dir, exist_ok=True)
+        self.writer = SaveWriter()
+        self.index = SaveIndex(
+            self.save_dir, self._read_metadata, self.writer.submit
+        )
+        self.archive = GameArchive(os.path.join(self.save_dir, ARCHIVE_FILE))
+        self.journal: Optional[GameJournal] = None
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self._migrate_legacy_save()
+        self._recover_journals()
+
+    def _read_save(self: "PersistenceManager", path: str) -> GameState:
+        """Load the game state of a save file.
+
+        Args:
+            path: Path of the save file
+
+        Returns:
+            GameState: The saved game state
+
+        Raises:
+            FileNotFoundError: If the save file doesn't exist
+            SaveFormatError: If the file contains invalid data
+        """
+        with open(path, "rb") as file:
+            return save_format.decode(file.read())
+
+    def _read_metadata(self: "PersistenceManager", path: str) -> SaveMetadata:
+        """Read the metadata of a save file without decoding the game.
+
+        Args:
+            path: Path of the save file
+
+        Returns:
+            SaveMetadata: Player, configuration and turn count of the save
+
+        Raises:
+            FileNotFoundError: If the save file doesn't exist
+            SaveFormatError: If the file has no valid header
+        """
+        with open(path, "rb") as file:
+            return save_format.read_metadata(file)
+
+    def _migrate_legacy_save(self: "PersistenceManager") -> None:
+        """Convert a legacy pickle save into the default slot.
+
+        A legacy save that cannot be read or converted is left in place;
+        unpickling may fail with any exception, none of which may keep the
+        game from starting.
+        """
+        legacy_path = os.path.join(self.save_dir, LEGACY_SAVE_FILE)
+        if not os.path.exists(legacy_path) or SAVE_FILE in self.index.entries:
+            return
+        try:
+            game_state = migrate_legacy_save(
+                legacy_path, os.path.join(self.save_dir, SAVE_FILE)
+            )
+        except Exception:
+            return
+        self.index.put(SAVE_FILE, game_state)
+
+    def _recover_journals(self: "PersistenceManager") -> None:
+        """Save the games of journals left behind by a crash.
+
+        A recovered game is saved to its slot, or to a new slot if it was
+        never saved, and its journal is deleted once the save is written.
+        Unreadable journals are left in place, temporary files of
+        interrupted compactions are deleted.
+        """
+        for file_name in sorted(os.listdir(self.save_dir)):
+            path = os.path.join(self.save_dir, file_name)
+            if JOURNAL_EXTENSION in file_name and file_name.endswith(TEMP_SUFFIX):
+                os.remove(path)
+                continue
+            if not file_name.endswith(JOURNAL_EXTENSION):
+                continue
+            try:
+                with open(path, "rb") as file:
+                    game_state, save_slot = game_journal.replay(file.read())
+            except (OSError, ValueError):
+                continue
+            self.save_game_state(
+                game_state, save_slot or self.new_save_slot(game_state.player_name)
+            )
+            self.writer.flush()
+            os.remove(path)
 
     def save_game_state(
         self: "PersistenceManager",
         game_state: GameState,
-        file_path: str = "game_state.pkl",
+        file_path: str = SAVE_FILE,
     ) -> None:
         """Save the current game state to a file.
 
+        The game is serialized right away and written in the background;
+        a journal of the game is compacted to a snapshot of the same data.
+
         Args:
             game_state: The game state to save
             file_path: The file path where the game state will be saved
@@ -41,34 +176,148 @@ class PersistenceManager(IPersistenceManager):
         if not isinstance(game_state, GameState):
             raise TypeError("game_state must be an instance of GameState")
 
-        file_path = os.path.join(self.save_dir, file_path)
-        with open(file_path, "wb") as file:
-            pickle.dump(game_state, file)
+        encoded = save_format.encode(game_state)
+        self.writer.submit(os.path.join(self.save_dir, file_path), encoded)
+        self.index.put(file_path, game_state)
+        if self.journal is not None and self.journal.game_state is game_state:
+            self.journal.compact(file_path, encoded)
 
     def load_game_state(
-        self: "PersistenceManager", file_path: str = "game_state.pkl"
+        self: "PersistenceManager", file_path: Optional[str] = None
     ) -> GameState:
         """Load a game state from a file.
 
         Args:
-            file_path: The file path from where to load the game state
+            file_path: The file path from where to load the game state,
+                defaults to the most recently saved game
 
         Returns:
             GameState: The loaded game state
 
         Raises:
             FileNotFoundError: If the save file doesn't exist
-            pickle.UnpicklingError: If the file contains invalid data
+            SaveFormatError: If the file contains invalid data
+            OSError: If a pending save could not be written
         """
-        file_path = os.path.join(self.save_dir, file_path)
-        with open(file_path, "rb") as file:
-            return pickle.load(file)
+        if file_path is None:
+            saves = self.index.saves()
+            file_path = saves[0].file_name if saves else SAVE_FILE
+        self.writer.flush()
+        try:
+            return self._read_save(os.path.join(self.save_dir, file_path))
+        except FileNotFoundError:
+            self.index.remove(file_path)
+            raise
+
+    def flush(
+        self: "PersistenceManager", timeout: Optional[float] = None
+    ) -> bool:
+        """Wait until all saves are written to disk.
+
+        Args:
+            timeout: Seconds to wait at most, None waits until done
+
+        Returns:
+            bool: True if all saves are written, False on timeout
+
+        Raises:
+            OSError: If a save could not be written
+        """
+        return self.writer.flush(timeout)
+
+    def close(self: "PersistenceManager") -> None:
+        """Wait for pending saves and close the archive.
+
+        Raises:
+            OSError: If a save could not be written
+        """
+        self.archive.close()
+        self.writer.flush()
+
+    def archive_game(
+        self: "PersistenceManager",
+        game_state: GameState,
+        mode: str,
+        won: bool,
+        move_times: Sequence[Optional[float]] = (),
+    ) -> None:
+        """Record a finished game in the archive.
+
+        Args:
+            game_state: The finished game
+            mode: Game mode the player chose
+            won: True if the player won
+            move_times: Seconds each turn took, None for untimed turns
+        """
+        self.archive.record_game(game_state, mode, won, move_times)
+
+    def get_archive(self: "PersistenceManager") -> GameArchive:
+        """Get the archive of finished games for statistics queries.
+
+        Returns:
+            GameArchive: History of the finished games
+        """
+        return self.archive
 
     def has_saved_game(self: "PersistenceManager") -> bool:
         """Check if a saved game exists.
 
+        Answered from the index without accessing the file system.
+
         Returns:
             bool: True if a saved game exists, False otherwise
         """
-        save_path = os.path.join(self.save_dir, "game_state.pkl")
-        return os.path.exists(save_path)
+        return bool(self.index.entries)
+
+    def list_saved_games(self: "PersistenceManager") -> List[SaveInfo]:
+        """List the saved games from the index.
+
+        Returns:
+            List[SaveInfo]: Metadata of every saved game, the most recent
+                first
+        """
+        return self.index.saves()
+
+    def new_save_slot(self: "PersistenceManager", player_name: str) -> str:
+        """Choose the file a new game of a player is saved to.
+
+        Args:
+            player_name: Name of the player
+
+        Returns:
+            str: Unused file name in the save directory
+        """
+        return self.index.new_file_name(player_name)
+
+    def start_journal(
+        self: "PersistenceManager",
+        game_state: GameState,
+        save_slot: Optional[str] = None,
+    ) -> None:
+        """Journal the turns of a game in progress.
+
+        A journal of a previous game is discarded.
+
+        Args:
+            game_state: The game to journal
+            save_slot: Save slot of the game, None if it was never saved
+        """
+        self.end_journal()
+        handle, path = tempfile.mkstemp(
+            prefix="game_", suffix=JOURNAL_EXTENSION, dir=self.save_dir
+        )
+        os.close(handle)
+        self.journal = GameJournal(
+            path,
+            game_state,
+            save_slot,
+            self.sync_every,
+            self.compact_every,
+            self.writer,
+        )
+
+    def end_journal(self: "PersistenceManager") -> None:
+        """Discard the journal of the game in progress, if any."""
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
@@ -0,0 +1,376 @@
+"""Module for the versioned binary save format of game states.
+
+A save consists of a fixed header, a body and a CRC32 checksum of both::
+
+    header   magic "SHSV", format version, positions, colors,
+             max rounds, number of turns, guesser type
+    body     player name, secret code, guesser settings, turns
+    trailer  CRC32 of header and body
+
+Strings are stored with their length, colors as one value byte each and
+every turn as its guess followed by the number and values of its feedback
+pins; a number of FEEDBACK_PENDING marks feedback not given yet. All
+numbers are little endian. Parsing reads each field once, so loading a
+game takes time proportional to the size of the save. The header
+and the player name, the first field of the body, are the metadata of the
+save; read_metadata reads them without parsing the rest of the save.
+"""
+
+import math
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Tuple, Type, Union
+
+from src.business_logic.game_state import (
+    MAX_STRING_LENGTH,
+    GameState,
+    GuesserDescriptor,
+)
+from src.business_logic.game_turn import GameTurn
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+MAGIC = b"SHSV"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBBBHHB")
+CHECKSUM = struct.Struct("<I")
+STRING_LENGTH = struct.Struct("<H")
+FEEDBACK_PENDING = 0xFF
+
+GUESSER_NONE = 0
+GUESSER_PLAYER = 1
+GUESSER_COMPUTER = 2
+GUESSER_TYPES = {"player": GUESSER_PLAYER, "computer": GUESSER_COMPUTER}
+GUESSER_NAMES = {value: name for name, value in GUESSER_TYPES.items()}
+
+
+class SaveFormatError(ValueError):
+    """Raised when data is not a valid save of a supported version."""
+
+
+@dataclass
+class SaveMetadata:
+    """Metadata of a save, read without parsing the turns.
+
+    Attributes:
+        player_name: Name of the player
+        positions: Number of positions in the code
+        colors: Number of available colors
+        max_rounds: The maximum number of rounds allowed
+        turns: Number of turns played
+        guesser: "player" or "computer", None without guesser
+    """
+
+    player_name: str
+    positions: int
+    colors: int
+    max_rounds: int
+    turns: int
+    guesser: Optional[str]
+
+
+class _Reader:
+    """Cursor over the bytes of a save, failing on truncated data.
+
+    Attributes:
+        data: Bytes of the save
+        offset: Position of the next field
+    """
+
+    def __init__(self: "_Reader", data: bytes, offset: int) -> None:
+        """Start reading at an offset.
+
+        Args:
+            data: Bytes of the save
+            offset: Position of the first field
+        """
+        self.data = data
+        self.offset = offset
+
+    def take(self: "_Reader", size: int) -> bytes:
+        """Read the next bytes.
+
+        Args:
+            size: Number of bytes
+
+        Returns:
+            bytes: The bytes read
+
+        Raises:
+            SaveFormatError: If the data ends before
+        """
+        end = self.offset + size
+        if end > len(self.data):
+            raise SaveFormatError("Save is truncated")
+        chunk = self.data[self.offset:end]
+        self.offset = end
+        return chunk
+
+    def unpack(self: "_Reader", layout: str) -> tuple:
+        """Read the next fields of a struct layout.
+
+        Args:
+            layout: struct format of the fields
+
+        Returns:
+            tuple: The values read
+        """
+        return struct.unpack(layout, self.take(struct.calcsize(layout)))
+
+    def string(self: "_Reader") -> str:
+        """Read a string stored with its length.
+
+        Returns:
+            str: The string read
+
+        Raises:
+            SaveFormatError: If the string is not valid UTF-8
+        """
+        (length,) = STRING_LENGTH.unpack(self.take(STRING_LENGTH.size))
+        try:
+            return self.take(length).decode("utf-8")
+        except UnicodeDecodeError:
+            raise SaveFormatError("Save holds an invalid string") from None
+
+
+def _pack_string(text: str) -> bytes:
+    """Store a string with its length.
+
+    Args:
+        text: String to store
+
+    Returns:
+        bytes: Length and UTF-8 bytes of the string
+
+    Raises:
+        SaveFormatError: If the string is longer than MAX_STRING_LENGTH bytes
+    """
+    encoded = text.encode("utf-8")
+    if len(encoded) > MAX_STRING_LENGTH:
+        raise SaveFormatError("String is too long to be saved")
+    return STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_colors(
+    values: bytes, color_type: Union[Type[ColorCode], Type[FeedbackColorCode]]
+) -> List:
+    """Convert value bytes back to colors.
+
+    Args:
+        values: One value byte per color
+        color_type: ColorCode or FeedbackColorCode
+
+    Returns:
+        List: The colors of the values
+
+    Raises:
+        SaveFormatError: If a value is no color of the type
+    """
+    try:
+        return [color_type.from_value(value) for value in values]
+    except ValueError as error:
+        raise SaveFormatError(f"Save holds an invalid color: {error}") from None
+
+
+def encode(game_state: GameState) -> bytes:
+    """Serialize a game state.
+
+    Args:
+        game_state: The game state to save
+
+    Returns:
+        bytes: The save
+
+    Raises:
+        SaveFormatError: If the game does not fit the fields of the format
+    """
+    descriptor = game_state.describe_guesser()
+    guesser_type = (
+        GUESSER_NONE if descriptor is None else GUESSER_TYPES[descriptor["type"]]
+    )
+    turns = game_state.get_turns()
+    try:
+        header = HEADER.pack(
+            MAGIC,
+            VERSION,
+            game_state.positions,
+            game_state.colors,
+            game_state.max_rounds,
+            len(turns),
+            guesser_type,
+        )
+    except struct.error as error:
+        raise SaveFormatError(f"Game does not fit a save: {error}") from error
+    parts = [header, _pack_string(game_state.player_name)]
+
+    secret_code = game_state.packed_secret_code or b""
+    parts.append(struct.pack("<B", len(secret_code)) + secret_code)
+
+    if guesser_type == GUESSER_COMPUTER:
+        time_limit = descriptor["time_limit"]
+        parts.append(_pack_string(descriptor["strategy"]))
+        parts.append(struct.pack("<d", math.nan if time_limit is None else time_limit))
+
+    for turn in turns:
+        parts.append(turn.packed_guesses)
+        if turn.feedback_pending:
+            parts.append(struct.pack("<B", FEEDBACK_PENDING))
+        else:
+            feedback = turn.packed_feedback
+            parts.append(struct.pack("<B", len(feedback)) + feedback)
+
+    body = b"".join(parts)
+    return body + CHECKSUM.pack(zlib.crc32(body))
+
+
+def _check_header(header: tuple) -> None:
+    """Check the magic and version of a save header.
+
+    Args:
+        header: Fields of the header
+
+    Raises:
+        SaveFormatError: If the header is not one of a save of this version
+    """
+    if header[0] != MAGIC:
+        raise SaveFormatError("Data is not a Superhirn save")
+    if header[1] != VERSION:
+        raise SaveFormatError(f"Unsupported save version {header[1]}")
+
+
+def _read_header(data: bytes) -> Tuple[tuple, bytes]:
+    """Check the header and checksum of a save.
+
+    Args:
+        data: The save
+
+    Returns:
+        Tuple[tuple, bytes]: Fields of the header and the save without its
+            checksum
+
+    Raises:
+        SaveFormatError: If the data is not an intact save of this version
+    """
+    if len(data) < HEADER.size + CHECKSUM.size:
+        raise SaveFormatError("Save is truncated")
+    header = HEADER.unpack_from(data)
+    _check_header(header)
+    body = data[:-CHECKSUM.size]
+    (checksum,) = CHECKSUM.unpack_from(data, len(body))
+    if zlib.crc32(body) != checksum:
+        raise SaveFormatError("Save checksum mismatch")
+    return header, body
+
+
+def _read_guesser(
+    reader: _Reader, guesser_type: int
+) -> Optional[GuesserDescriptor]:
+    """Read the descriptor of the guesser.
+
+    Args:
+        reader: Cursor at the guesser settings
+        guesser_type: Guesser type of the header
+
+    Returns:
+        Optional[GuesserDescriptor]: Type and strategy settings of the
+            guesser, None without guesser
+
+    Raises:
+        SaveFormatError: If the guesser type is unknown
+    """
+    if guesser_type == GUESSER_NONE:
+        return None
+    if guesser_type == GUESSER_PLAYER:
+        return {"type": "player"}
+    if guesser_type != GUESSER_COMPUTER:
+        raise SaveFormatError(f"Unknown guesser type {guesser_type}")
+    strategy = reader.string()
+    (time_limit,) = reader.unpack("<d")
+    return {
+        "type": "computer",
+        "strategy": strategy,
+        "time_limit": None if math.isnan(time_limit) else time_limit,
+    }
+
+
+def read_metadata(file: BinaryIO) -> SaveMetadata:
+    """Read the metadata at the start of a save.
+
+    Only the header and the player name are read. The checksum is not
+    verified, so a save with a damaged body fails only when it is decoded.
+
+    Args:
+        file: Save file opened in binary mode at its start
+
+    Returns:
+        SaveMetadata: Player, configuration, turn count and guesser type
+
+    Raises:
+        SaveFormatError: If the file does not start with a save header
+    """
+    prefix = file.read(HEADER.size + STRING_LENGTH.size)
+    if len(prefix) < HEADER.size + STRING_LENGTH.size:
+        raise SaveFormatError("Save is truncated")
+    header = HEADER.unpack_from(prefix)
+    _check_header(header)
+    _, _, positions, colors, max_rounds, turns, guesser_type = header
+    if guesser_type != GUESSER_NONE and guesser_type not in GUESSER_NAMES:
+        raise SaveFormatError(f"Unknown guesser type {guesser_type}")
+    (length,) = STRING_LENGTH.unpack_from(prefix, HEADER.size)
+    reader = _Reader(prefix + file.read(length), HEADER.size)
+    return SaveMetadata(
+        reader.string(),
+        positions,
+        colors,
+        max_rounds,
+        turns,
+        GUESSER_NAMES.get(guesser_type),
+    )
+
+
+def decode(data: bytes) -> GameState:
+    """Parse a save and rebuild its game state.
+
+    Args:
+        data: The save
+
+    Returns:
+        GameState: The saved game state with its guesser restored
+
+    Raises:
+        SaveFormatError: If the data is not a valid save of this version
+    """
+    header, body = _read_header(data)
+    _, _, positions, colors, max_rounds, turn_count, guesser_type = header
+
+    reader = _Reader(body, HEADER.size)
+    player_name = reader.string()
+    (secret_length,) = reader.unpack("<B")
+    secret_code = (
+        _unpack_colors(reader.take(secret_length), ColorCode)
+        if secret_length else None
+    )
+    descriptor = _read_guesser(reader, guesser_type)
+
+    game_state = GameState(secret_code, max_rounds, positions, colors, player_name)
+    for _ in range(turn_count):
+        guesses = _unpack_colors(reader.take(positions), ColorCode)
+        (feedback_length,) = reader.unpack("<B")
+        feedback = (
+            None if feedback_length == FEEDBACK_PENDING
+            else _unpack_colors(reader.take(feedback_length), FeedbackColorCode)
+        )
+        try:
+            game_state.add_turn(GameTurn(guesses, feedback))
+        except ValueError as error:
+            raise SaveFormatError(f"Save holds an invalid turn: {error}") from None
+    if reader.offset != len(body):
+        raise SaveFormatError("Save has trailing data")
+
+    try:
+        game_state.current_guesser = game_state.restore_guesser(descriptor)
+    except ValueError as error:
+        raise SaveFormatError(f"Save holds an invalid guesser: {error}") from None
+    return game_state
@@ -0,0 +1,162 @@
+"""Module for the in-memory index of the saved games."""
+
+import json
+import os
+import re
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional
+
+from src.business_logic.game_state import GameState # noqa
+from src.business_logic.save_info import SaveInfo
+from src.persistence.save_format import SaveMetadata # noqa
+from src.persistence.save_writer import write_atomic
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+SAVE_EXTENSION = ".sav"
+
+
+class SaveIndex:
+    """Index of the saves of a directory, kept in memory and in a JSON file.
+
+    The index answers which games are saved without touching the save
+    files. It is read once; if it is missing or unreadable it is rebuilt
+    from the metadata of the save files in the directory.
+
+    Attributes:
+        save_dir: Directory of the saves and the index file
+        path: Path of the index file
+        entries: Metadata per save file name
+        store: Function writing the content of the index file
+    """
+
+    def __init__(
+        self: "SaveIndex",
+        save_dir: str,
+        read_metadata: Callable[[str], SaveMetadata],
+        store: Callable[[str, bytes], None] = write_atomic,
+    ) -> None:
+        """Load the index, rebuilding it from the saves if necessary.
+
+        Args:
+            save_dir: Directory of the saves and the index file
+            read_metadata: Function reading the metadata of a save file
+                path, used to rebuild the index
+            store: Function writing a file path with new content, defaults
+                to writing it atomically right away
+        """
+        self.save_dir = save_dir
+        self.path = os.path.join(save_dir, INDEX_FILE)
+        self.entries: Dict[str, SaveInfo] = {}
+        self.store = store
+        if not self._read():
+            self._rebuild(read_metadata)
+
+    def _read(self: "SaveIndex") -> bool:
+        """Read the index file.
+
+        Returns:
+            bool: True if the index file was read, False if it is missing or
+                unreadable
+        """
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+            if data.get("version") != INDEX_VERSION:
+                return False
+            self.entries = {
+                name: SaveInfo(**info) for name, info in data["saves"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return False
+        return True
+
+    def _rebuild(
+        self: "SaveIndex", read_metadata: Callable[[str], SaveMetadata]
+    ) -> None:
+        """Index every readable save file of the directory.
+
+        Args:
+            read_metadata: Function reading the metadata of a save file path
+        """
+        self.entries = {}
+        for file_name in sorted(os.listdir(self.save_dir)):
+            if not file_name.endswith(SAVE_EXTENSION):
+                continue
+            path = os.path.join(self.save_dir, file_name)
+            try:
+                metadata = read_metadata(path)
+            except (OSError, ValueError):
+                continue
+            self.entries[file_name] = SaveInfo.of_metadata(
+                file_name, metadata, os.path.getmtime(path)
+            )
+        self.write()
+
+    def write(self: "SaveIndex") -> None:
+        """Store the index file."""
+        data = {
+            "version": INDEX_VERSION,
+            "saves": {name: asdict(info) for name, info in self.entries.items()},
+        }
+        self.store(self.path, json.dumps(data, indent=2).encode("utf-8"))
+
+    def put(
+        self: "SaveIndex",
+        file_name: str,
+        game_state: GameState,
+        saved_at: Optional[float] = None,
+    ) -> SaveInfo:
+        """Record a save and store the index.
+
+        Args:
+            file_name: Name of the save file
+            game_state: The saved game state
+            saved_at: time.time() of the save, defaults to now
+
+        Returns:
+            SaveInfo: Metadata of the save
+        """
+        info = SaveInfo.of(
+            file_name, game_state, time.time() if saved_at is None else saved_at
+        )
+        self.entries[file_name] = info
+        self.write()
+        return info
+
+    def remove(self: "SaveIndex", file_name: str) -> None:
+        """Forget a save and store the index.
+
+        Args:
+            file_name: Name of the save file
+        """
+        if self.entries.pop(file_name, None) is not None:
+            self.write()
+
+    def saves(self: "SaveIndex") -> List[SaveInfo]:
+        """List the saves, the most recent first.
+
+        Returns:
+            List[SaveInfo]: Metadata of every save
+        """
+        return sorted(
+            self.entries.values(), key=lambda info: info.saved_at, reverse=True
+        )
+
+    def new_file_name(self: "SaveIndex", player_name: str) -> str:
+        """Choose an unused save file name for a new game of a player.
+
+        Args:
+            player_name: Name of the player
+
+        Returns:
+            str: File name of the form <player>_<number>.sav
+        """
+        stem = re.sub(r"[^A-Za-z0-9]+", "_", player_name).strip("_") or "game"
+        number = 1
+        while f"{stem}_{number}{SAVE_EXTENSION}" in self.entries or os.path.exists(
+            os.path.join(self.save_dir, f"{stem}_{number}{SAVE_EXTENSION}")
+        ):
+            number += 1
+        return f"{stem}_{number}{SAVE_EXTENSION}"
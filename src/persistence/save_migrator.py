@@ -0,0 +1,65 @@
+"""Module for converting legacy pickle saves to the binary save format.
+
+Saves written before the binary format are pickles of the game state. A
+legacy save is loaded once, written in the current format and renamed
+with the suffix ``.migrated``, e.g.::
+
+    python -m src.persistence.save_migrator src/saves/game_state.pkl
+
+Unpickling runs code chosen by the file, so only saves written by this
+game on this machine should be migrated.
+"""
+
+import os
+import pickle
+import sys
+from typing import List, Optional
+
+from src.business_logic.game_state import GameState
+from src.persistence import save_format
+from src.persistence.save_writer import write_atomic
+
+MIGRATED_SUFFIX = ".migrated"
+
+
+def migrate_legacy_save(legacy_path: str, save_path: str) -> GameState:
+    """Convert a legacy pickle save to the binary save format.
+
+    Args:
+        legacy_path: Path of the pickle save
+        save_path: Path the converted save is written to
+
+    Returns:
+        GameState: The migrated game state
+
+    Raises:
+        FileNotFoundError: If the legacy save doesn't exist
+        pickle.UnpicklingError: If the legacy save holds invalid data
+        TypeError: If the legacy save holds no game state
+    """
+    with open(legacy_path, "rb") as file:
+        game_state = pickle.load(file)
+    if not isinstance(game_state, GameState):
+        raise TypeError(f"{legacy_path} does not hold a game state")
+
+    write_atomic(save_path, save_format.encode(game_state))
+    os.replace(legacy_path, legacy_path + MIGRATED_SUFFIX)
+    return game_state
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Migrate the legacy saves given on the command line.
+
+    Each save is written next to the legacy file with the extension .sav.
+
+    Args:
+        argv: Paths of the legacy saves, defaults to sys.argv
+    """
+    for legacy_path in argv if argv is not None else sys.argv[1:]:
+        save_path = os.path.splitext(legacy_path)[0] + ".sav"
+        migrate_legacy_save(legacy_path, save_path)
+        print(f"{legacy_path} -> {save_path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
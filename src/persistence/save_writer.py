@@ -0,0 +1,201 @@
+"""Module for writing saves in the background.
+
+Saves are handed to a SaveWriter as serialized bytes and written by a
+worker thread, so a slow disk does not stall the console. Every file is
+written to a temporary file in its directory, synced and renamed over the
+target, so an interrupted write leaves the previous save intact. Saves of
+a file submitted while an earlier one waits are coalesced into one write
+of the latest data. Data can also be appended to a file, as the journal
+does with its records; appends queued while the worker is busy are written
+and synced together.
+"""
+
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+TEMP_SUFFIX = ".tmp"
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Replace a file with new content in one step.
+
+    Args:
+        path: Path of the file
+        data: New content of the file
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    directory, name = os.path.split(path)
+    handle, temp_path = tempfile.mkstemp(
+        prefix=f".{name}.", suffix=TEMP_SUFFIX, dir=directory or "."
+    )
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def append_file(path: str, data: bytes, sync: bool) -> None:
+    """Append data to a file.
+
+    Args:
+        path: Path of the file, created if missing
+        data: Data to append
+        sync: True to sync the file to the disk afterwards
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with open(path, "ab") as file:
+        file.write(data)
+        file.flush()
+        if sync:
+            os.fsync(file.fileno())
+
+
+class SaveWriter:
+    """Writes files atomically on a background thread.
+
+    The worker thread is started when a file is submitted and ends once no
+    write is pending. It is not a daemon, so pending saves are completed
+    before the interpreter exits.
+
+    Attributes:
+        writes: Number of writes completed
+        failures: Number of writes that failed
+    """
+
+    def __init__(self: "SaveWriter") -> None:
+        """Initialize the writer without pending writes."""
+        self.writes = 0
+        self.failures = 0
+        # Per file: True to replace it, the data, True to sync after appending
+        self._pending: Dict[str, Tuple[bool, bytes, bool]] = {}
+        self._writing: Optional[str] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+
+    def submit(self: "SaveWriter", path: str, data: bytes) -> None:
+        """Queue the new content of a file.
+
+        Content queued earlier for the same file and not written yet is
+        replaced.
+
+        Args:
+            path: Path of the file
+            data: New content of the file
+        """
+        with self._condition:
+            self._pending[path] = (True, data, True)
+            self._start()
+
+    def append(
+        self: "SaveWriter", path: str, data: bytes, sync: bool = True
+    ) -> None:
+        """Queue data to append to a file.
+
+        Data queued after new content of the same file is appended to it.
+
+        Args:
+            path: Path of the file
+            data: Data to append
+            sync: True to sync the file to the disk after appending
+        """
+        with self._condition:
+            replace, queued, queued_sync = self._pending.get(
+                path, (False, b"", False)
+            )
+            self._pending[path] = (replace, queued + data, queued_sync or sync)
+            self._start()
+
+    def remove(self: "SaveWriter", path: str) -> None:
+        """Drop the pending writes of a file and delete it.
+
+        Waits until the worker is done with the file, so it is not
+        recreated by a write in progress.
+
+        Args:
+            path: Path of the file
+        """
+        with self._condition:
+            self._pending.pop(path, None)
+            self._condition.wait_for(lambda: self._writing != path)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _start(self: "SaveWriter") -> None:
+        """Start the worker thread unless it runs; hold the condition."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="save-writer")
+            self._thread.start()
+
+    def _run(self: "SaveWriter") -> None:
+        """Write pending files until none is left.
+
+        A failed write is kept for the next flush. However the worker ends,
+        it is unregistered and waiting flushes are woken.
+        """
+        try:
+            while True:
+                with self._condition:
+                    if not self._pending:
+                        self._thread = None
+                        self._condition.notify_all()
+                        return
+                    path = next(iter(self._pending))
+                    replace, data, sync = self._pending.pop(path)
+                    self._writing = path
+                try:
+                    if replace:
+                        write_atomic(path, data)
+                    else:
+                        append_file(path, data, sync)
+                except Exception as error:
+                    with self._condition:
+                        self._error = error
+                        self.failures += 1
+                else:
+                    with self._condition:
+                        self.writes += 1
+                with self._condition:
+                    self._writing = None
+                    self._condition.notify_all()
+        finally:
+            with self._condition:
+                self._writing = None
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                    self._condition.notify_all()
+
+    def flush(self: "SaveWriter", timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted file is written.
+
+        Args:
+            timeout: Seconds to wait at most, None waits until done
+
+        Returns:
+            bool: True if all writes are done, False on timeout
+
+        Raises:
+            Exception: The error of a write that failed since the last
+                flush, usually an OSError
+        """
+        with self._condition:
+            done = self._condition.wait_for(
+                lambda: self._thread is None, timeout
+            )
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return done
@@ -1,6 +1,20 @@
 """Module containing color code enumeration for the game."""
 
 from enum import Enum
+from typing import Dict, Type
+
+RESET = "\033[0m"
+
+_ANSI_CODES = {
+    1: "\033[31m",  # RED
+    2: "\033[32m",  # GREEN
+    3: "\033[33m",  # YELLOW
+    4: "\033[34m",  # BLUE
+    5: "\033[38;5;214m",  # ORANGE
+    6: "\033[38;5;94m",  # BROWN
+    7: "\033[97m",  # WHITE
+    8: "\033[90m",  # BLACK
+}
 
 
 class ColorCode(Enum):
@@ -32,21 +46,34 @@ class ColorCode(Enum):
     def __init__(self: "ColorCode", value: int) -> None:
         """Initialize the ColorCode enum instance.
 
+        The colored renderings are built once per member here, so printing
+        a board only looks them up.
+
         Args:
             value: Integer value for the color (1-8)
         """
         self._value_ = value
-        self._ansi_codes = {
-            1: "\033[31m",  # RED
-            2: "\033[32m",  # GREEN
-            3: "\033[33m",  # YELLOW
-            4: "\033[34m",  # BLUE
-            5: "\033[38;5;214m",  # ORANGE
-            6: "\033[38;5;94m",  # BROWN
-            7: "\033[97m",  # WHITE
-            8: "\033[90m",  # BLACK
-        }
-        self.ansi_code = self._ansi_codes[value]
+        self.ansi_code = _ANSI_CODES[value]
+        self._text = f"{self.ansi_code}{self._name_}{RESET}"
+        self._colored_value = f"{self.ansi_code}{value}{RESET}"
+
+    @classmethod
+    def from_value(cls: Type["ColorCode"], value: int) -> "ColorCode":
+        """Get the color of a value without the Enum lookup machinery.
+
+        Args:
+            value: Integer value for the color (1-8)
+
+        Returns:
+            ColorCode: The color with the value
+
+        Raises:
+            ValueError: If no color has the value
+        """
+        try:
+            return _COLORS_BY_VALUE[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid ColorCode") from None
 
     def __str__(self: "ColorCode") -> str:
         """Return string representation with ANSI color.
@@ -54,7 +81,7 @@ class ColorCode(Enum):
         Returns:
             str: Colored string representation of the enum value
         """
-        return f"{self.ansi_code}{self.name}\033[0m"
+        return self._text
 
     def get_ansi_code(self: "ColorCode") -> str:
         """Get the ANSI color code for this color.
@@ -63,3 +90,14 @@ class ColorCode(Enum):
             str: ANSI color code sequence
         """
         return self.ansi_code
+
+    def get_colored_value(self: "ColorCode") -> str:
+        """Get the value of this color as a colored pin.
+
+        Returns:
+            str: Value wrapped in the ANSI color code and a reset
+        """
+        return self._colored_value
+
+
+_COLORS_BY_VALUE: Dict[int, ColorCode] = {color.value: color for color in ColorCode}
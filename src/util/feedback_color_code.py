@@ -1,6 +1,14 @@
 """Module for feedback color code enumeration."""
 
 from enum import Enum
+from typing import Dict, Type
+
+from src.util.color_code import RESET
+
+_ANSI_CODES = {
+    7: "\033[97m",  # WHITE
+    8: "\033[90m",  # BLACK
+}
 
 
 class FeedbackColorCode(Enum):
@@ -20,16 +28,38 @@ class FeedbackColorCode(Enum):
     def __init__(self: "FeedbackColorCode", value: int) -> None:
         """Initialize the FeedbackColorCode enum instance.
 
+        The colored renderings are built once per member here, so printing
+        a board only looks them up.
+
         Args:
             value: Integer value for the feedback color (7 or 8)
         """
         self._value_ = value
-        # Map values to ANSI codes
-        self._ansi_codes = {
-            7: "\033[97m",  # WHITE
-            8: "\033[90m",  # BLACK
-        }
-        self.ansi_code = self._ansi_codes[value]
+        self.ansi_code = _ANSI_CODES[value]
+        self._text = f"{self.ansi_code}{self._name_}{RESET}"
+        self._colored_value = f"{self.ansi_code}{value}{RESET}"
+
+    @classmethod
+    def from_value(
+        cls: Type["FeedbackColorCode"], value: int
+    ) -> "FeedbackColorCode":
+        """Get the feedback color of a value without the Enum machinery.
+
+        Args:
+            value: Integer value for the feedback color (7 or 8)
+
+        Returns:
+            FeedbackColorCode: The feedback color with the value
+
+        Raises:
+            ValueError: If no feedback color has the value
+        """
+        try:
+            return _FEEDBACK_BY_VALUE[value]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"{value!r} is not a valid FeedbackColorCode"
+            ) from None
 
     def __str__(self: "FeedbackColorCode") -> str:
         """Return string representation with ANSI color.
@@ -37,7 +67,7 @@ class FeedbackColorCode(Enum):
         Returns:
             str: Colored string representation of the enum value
         """
-        return f"{self.ansi_code}{self.name}\033[0m"
+        return self._text
 
     def get_ansi_code(self: "FeedbackColorCode") -> str:
         """Get the ANSI color code for this feedback color.
@@ -46,3 +76,16 @@ class FeedbackColorCode(Enum):
             str: ANSI color code sequence
         """
         return self.ansi_code
+
+    def get_colored_value(self: "FeedbackColorCode") -> str:
+        """Get the value of this feedback color as a colored pin.
+
+        Returns:
+            str: Value wrapped in the ANSI color code and a reset
+        """
+        return self._colored_value
+
+
+_FEEDBACK_BY_VALUE: Dict[int, FeedbackColorCode] = {
+    feedback.value: feedback for feedback in FeedbackColorCode
+}
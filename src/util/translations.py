@@ -57,6 +57,7 @@ translations = {
         "secret_code": "Secret Code",
         "game_title": "Super Mastermind",
         "round": "Round",
+        "saved_games": "Saved games:",
         "feedback": "Feedback",
         "guess": "Guess",
         "warning": "WARNING",
@@ -129,6 +130,7 @@ translations = {
         "secret_code": "Geheimer Code",
         "game_title": "Super Superhirn",
         "round": "Runde",
+        "saved_games": "Gespeicherte Spiele:",
         "feedback": "Feedback",
         "guess": "Tipp",
         "warning": "WARNUNG",
@@ -201,6 +203,7 @@ translations = {
         "secret_code": "Code Secret",
         "game_title": "Super Super cerveau",
         "round": "Tour",
+        "saved_games": "Parties sauvegardées :",
         "feedback": "Retour",
         "guess": "Supposition",
         "warning": "AVERTISSEMENT",
@@ -269,6 +272,7 @@ translations = {
         "secret_code": "비밀 코드",
         "game_title": "슈퍼 슈퍼히른",
         "round": "라운드",
+        "saved_games": "저장된 게임:",
         "feedback": "피드백",
         "guess": "추측",
         "warning": "경고",
@@ -6,6 +6,7 @@ from src.business_logic.business_logic import BusinessLogic
 from src.business_logic.guesser.player_guesser import PlayerGuesser
 from src.util.color_code import ColorCode
 from src.persistence.i_persistence_manager import IPersistenceManager
+from src.business_logic.save_info import SaveInfo
 
 
 class TestApplicationLogic(unittest.TestCase):
@@ -228,6 +229,18 @@ class TestApplicationLogic(unittest.TestCase):
             ),
             "invalid_configuration"
         )
+        self.assertEqual(
+            self.app_logic.handle_game_configuration(
+                "Player1", "4", "6", "70000"
+            ),
+            "invalid_configuration"
+        )
+        self.assertEqual(
+            self.app_logic.handle_game_configuration(
+                "P" * 70000, "4", "6", "10"
+            ),
+            "invalid_configuration"
+        )
 
         # Non-numeric values
         self.assertEqual(
@@ -387,6 +400,24 @@ class TestApplicationLogic(unittest.TestCase):
         result = self.app_logic.load_game()
         self.assertEqual(result, "error")
 
+    def test_load_game_choice(self: "TestApplicationLogic") -> None:
+        """Test loading a game chosen from the list of saved games."""
+        mock_game_state = Mock()
+        mock_game_state.current_guesser = PlayerGuesser()
+        saves = [SaveInfo(f"game_{n}.sav", "TestPlayer", 4, 6, 10, n, float(n))
+                 for n in (1, 2)]
+        self.game_logic.list_saved_games = Mock(return_value=saves)
+        self.game_logic.load_game_state = Mock(return_value=None)
+        self.game_logic.get_game_state = Mock(return_value=mock_game_state)
+
+        self.assertEqual(self.app_logic.load_game("2"), "need_guess_input")
+        self.game_logic.load_game_state.assert_called_once_with("game_2.sav")
+        self.assertEqual(self.app_logic.get_saved_games(), saves)
+
+        # Choices outside the list are rejected
+        for choice in ("0", "3", "x"):
+            self.assertEqual(self.app_logic.load_game(choice), "error")
+
     def test_process_game_action(self: "TestApplicationLogic") -> None:
         """Test game action processing."""
         # Setup
@@ -0,0 +1 @@
+"""Test package for the performance benchmarks, run with --benchmark."""
@@ -0,0 +1,378 @@
+"""pytest plugin timing the hot paths against stored baselines.
+
+The benchmarks are skipped unless pytest runs with ``--benchmark``::
+
+    # compare against tests/benchmarks/baselines.json
+    pytest tests/benchmarks --benchmark
+    # store the current timings as the new baselines
+    pytest tests/benchmarks --benchmark --benchmark-save
+    # fail on benchmarks more than 10 % plus their noise slower
+    pytest tests/benchmarks --benchmark --benchmark-max-regression 0.1
+
+A benchmark is timed in rounds. Each round calls the function as many
+times as it takes to run for at least ``MIN_ROUND_TIME``, so the clock
+resolution and single hiccups do not dominate microsecond timings; the
+time per call is the round time divided by its calls. Shared machines
+run faster and slower for seconds at a time, so every round is preceded
+by a fixed reference loop and timed relative to it. The fastest relative
+round is compared with the one stored for the same name. Its spread, how
+far the median round lies above the fastest one, measures the remaining
+noise: a benchmark fails if it is slower than its baseline by more than
+the allowed fraction plus ``NOISE_FACTOR`` times the larger spread of the
+two runs. The comparison of all benchmarks is printed at the end of the
+session.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pytest
+from _pytest.terminal import TerminalReporter # noqa
+
+DEFAULT_BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_MAX_REGRESSION = 0.25
+NOISE_FACTOR = 2.0
+MIN_ROUND_TIME = 0.02
+REFERENCE_LOOPS = 50000
+
+Stats = Dict[str, float]
+
+
+def reference_time() -> float:
+    """Time the fixed reference loop.
+
+    Returns:
+        float: Seconds the loop took
+    """
+    start = time.perf_counter()
+    total = 0
+    for number in range(REFERENCE_LOOPS):
+        total += number * number
+    return time.perf_counter() - start
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark options.
+
+    Args:
+        parser: Command line parser of pytest
+    """
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true",
+                    help="run the benchmarks in tests/benchmarks")
+    group.addoption("--benchmark-save", action="store_true",
+                    help="store the timings as new baselines")
+    group.addoption("--benchmark-baselines", default=DEFAULT_BASELINES,
+                    help="JSON file of the baselines")
+    group.addoption("--benchmark-max-regression", type=float,
+                    default=DEFAULT_MAX_REGRESSION,
+                    help="allowed slowdown of the fastest round as a "
+                         "fraction, on top of the measured noise")
+
+
+class BenchmarkSession:
+    """Baselines and results of all benchmarks of a pytest session.
+
+    Attributes:
+        path: JSON file of the baselines
+        max_regression: Allowed slowdown of the fastest round as a fraction,
+            on top of the noise
+        save: Whether the results replace the baselines
+        baselines: Stored statistics per benchmark name
+        results: Statistics measured in this session per benchmark name
+    """
+
+    def __init__(
+        self: "BenchmarkSession", path: str, max_regression: float, save: bool
+    ) -> None:
+        """Load the stored baselines.
+
+        Args:
+            path: JSON file of the baselines
+            max_regression: Allowed slowdown of the fastest round as a
+                fraction, on top of the noise
+            save: Whether the results replace the baselines
+        """
+        self.path = path
+        self.max_regression = max_regression
+        self.save = save
+        self.baselines: Dict[str, Stats] = {}
+        self.results: Dict[str, Stats] = {}
+        if os.path.exists(path):
+            with open(path) as file:
+                self.baselines = json.load(file)["benchmarks"]
+
+    def regression(self: "BenchmarkSession", name: str) -> Optional[float]:
+        """Get the slowdown of a benchmark relative to its baseline.
+
+        Args:
+            name: Name of the benchmark
+
+        Returns:
+            Optional[float]: Change of the fastest relative round as a
+                fraction, None without a baseline
+        """
+        if name not in self.baselines or name not in self.results:
+            return None
+        return self.results[name]["relative"] / self.baselines[name]["relative"] - 1
+
+    def allowed_regression(self: "BenchmarkSession", name: str) -> float:
+        """Get the slowdown a benchmark may show without failing.
+
+        Args:
+            name: Name of the benchmark
+
+        Returns:
+            float: max_regression plus NOISE_FACTOR times the larger spread
+                of the baseline and the result
+        """
+        spread = max(
+            self.baselines.get(name, {}).get("spread", 0.0),
+            self.results.get(name, {}).get("spread", 0.0),
+        )
+        return self.max_regression + NOISE_FACTOR * spread
+
+    def is_regression(self: "BenchmarkSession", name: str) -> bool:
+        """Check whether a benchmark is slower than allowed.
+
+        Args:
+            name: Name of the benchmark
+
+        Returns:
+            bool: True if the slowdown exceeds the allowed regression
+        """
+        change = self.regression(name)
+        return change is not None and change > self.allowed_regression(name)
+
+    def write(self: "BenchmarkSession") -> None:
+        """Merge the results into the baselines file."""
+        benchmarks = {**self.baselines, **self.results}
+        data = {
+            "machine": {
+                "python": platform.python_version(),
+                "processor": platform.processor() or platform.machine(),
+            },
+            "benchmarks": dict(sorted(benchmarks.items())),
+        }
+        with open(self.path, "w") as file:
+            json.dump(data, file, indent=2)
+            file.write("\n")
+
+    def report(self: "BenchmarkSession") -> List[str]:
+        """Render the comparison of the results with the baselines.
+
+        Returns:
+            List[str]: Lines of the comparison table
+        """
+        lines = [f"{'benchmark':<44} {'baseline':>10} {'min':>10} "
+                 f"{'change':>8} {'allowed':>8}"]
+        for name, stats in sorted(self.results.items()):
+            change = self.regression(name)
+            baseline = self.baselines.get(name, {}).get("min")
+            lines.append(
+                f"{name:<44} "
+                + (f"{baseline * 1000:>8.4f}ms " if baseline else f"{'-':>10} ")
+                + f"{stats['min'] * 1000:>8.4f}ms "
+                + (f"{change:>+8.1%}" if change is not None else f"{'new':>8}")
+                + f" {self.allowed_regression(name):>+8.1%}"
+                + (" REGRESSION" if self.is_regression(name) else "")
+            )
+        return lines
+
+
+class Benchmark:
+    """Timer handed to a benchmark by the ``benchmark`` fixture.
+
+    Attributes:
+        name: Name the results are stored under
+        session: Baselines and results of the session
+        rounds: Number of rounds of a call benchmark
+        min_round_time: Seconds each round runs at least
+    """
+
+    def __init__(
+        self: "Benchmark",
+        name: str,
+        session: BenchmarkSession,
+        rounds: int = 20,
+        min_round_time: float = MIN_ROUND_TIME,
+    ) -> None:
+        """Initialize the timer.
+
+        Args:
+            name: Name the results are stored under
+            session: Baselines and results of the session
+            rounds: Number of rounds of a call benchmark
+            min_round_time: Seconds each round runs at least
+        """
+        self.name = name
+        self.session = session
+        self.rounds = rounds
+        self.min_round_time = min_round_time
+
+    def _calls_per_round(self: "Benchmark", seconds: float) -> int:
+        """Get the number of calls filling a round.
+
+        Args:
+            seconds: Time of one call
+
+        Returns:
+            int: Calls that take at least min_round_time
+        """
+        return max(1, math.ceil(self.min_round_time / max(seconds, 1e-9)))
+
+    def __call__(self: "Benchmark", function: Callable, *args: object,
+                 **kwargs: object) -> object:
+        """Time a function in calibrated rounds.
+
+        Args:
+            function: Function to time
+            *args: Positional arguments of the function
+            **kwargs: Keyword arguments of the function
+
+        Returns:
+            object: Result of the last call
+        """
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        calls = self._calls_per_round(time.perf_counter() - start)
+        # A second estimate over several calls is not skewed by a cold start
+        start = time.perf_counter()
+        for _ in range(calls):
+            function(*args, **kwargs)
+        calls = self._calls_per_round((time.perf_counter() - start) / calls)
+
+        timings = []
+        references = []
+        for _ in range(self.rounds):
+            references.append(reference_time())
+            start = time.perf_counter()
+            for _ in range(calls):
+                result = function(*args, **kwargs)
+            timings.append((time.perf_counter() - start) / calls)
+        self._record(timings, references, calls)
+        return result
+
+    def pedantic(
+        self: "Benchmark",
+        function: Callable,
+        setup: Callable[[], Tuple[tuple, dict]],
+        rounds: int = 10,
+    ) -> object:
+        """Time a function on fresh arguments for a fixed number of rounds.
+
+        The arguments of all calls of a round are set up before the round,
+        so only the calls are timed.
+
+        Args:
+            function: Function to time
+            setup: Untimed function returning the arguments and keyword
+                arguments of one call
+            rounds: Number of rounds, defaults to 10
+
+        Returns:
+            object: Result of the last call
+        """
+        args, kwargs = setup()
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        calls = self._calls_per_round(time.perf_counter() - start)
+
+        timings = []
+        references = []
+        for _ in range(rounds):
+            arguments = [setup() for _ in range(calls)]
+            references.append(reference_time())
+            start = time.perf_counter()
+            for args, kwargs in arguments:
+                result = function(*args, **kwargs)
+            timings.append((time.perf_counter() - start) / calls)
+        self._record(timings, references, calls)
+        return result
+
+    def _record(
+        self: "Benchmark",
+        timings: List[float],
+        references: List[float],
+        calls: int,
+    ) -> None:
+        """Store the statistics and check them against the baseline.
+
+        Args:
+            timings: Seconds per call of each round
+            references: Seconds of the reference loop before each round
+            calls: Calls per round
+        """
+        relative = [
+            timing / reference for timing, reference in zip(timings, references)
+        ]
+        fastest = min(relative)
+        self.session.results[self.name] = {
+            "rounds": len(timings),
+            "calls": calls,
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "mean": statistics.mean(timings),
+            "relative": fastest,
+            "spread": statistics.median(relative) / fastest - 1,
+        }
+        if not self.session.save and self.session.is_regression(self.name):
+            pytest.fail(
+                f"{self.name} is {self.session.regression(self.name):.1%} slower "
+                f"than its baseline, allowed are "
+                f"{self.session.allowed_regression(self.name):.1%}"
+            )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create the benchmark session if benchmarks are run.
+
+    Args:
+        config: Configuration of the pytest session
+    """
+    config.addinivalue_line("markers", "benchmark: timing benchmark")
+    config.benchmark_session = None
+    if config.getoption("--benchmark"):
+        config.benchmark_session = BenchmarkSession(
+            config.getoption("--benchmark-baselines"),
+            config.getoption("--benchmark-max-regression"),
+            config.getoption("--benchmark-save"),
+        )
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    """Provide the timer, skipping the test unless benchmarks are run.
+
+    Args:
+        request: Request of the test using the fixture
+
+    Returns:
+        Benchmark: Timer storing its results under the test's node name
+    """
+    session = request.config.benchmark_session
+    if session is None:
+        pytest.skip("benchmarks run with --benchmark")
+    return Benchmark(request.node.name, session)
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter) -> None:
+    """Print the comparison and store new baselines if requested.
+
+    Args:
+        terminalreporter: Terminal reporter of pytest
+    """
+    session = terminalreporter.config.benchmark_session
+    if session is None or not session.results:
+        return
+    terminalreporter.section("benchmarks")
+    for line in session.report():
+        terminalreporter.write_line(line)
+    if session.save:
+        session.write()
+        terminalreporter.write_line(f"baselines saved to {session.path}")
@@ -0,0 +1,84 @@
+"""Test module for the benchmark harness."""
+
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from tests.benchmarks.harness import Benchmark, BenchmarkSession
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Test cases for BenchmarkSession and Benchmark."""
+
+    def setUp(self: "TestBenchmarkHarness") -> None:
+        """Set up a baselines file in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "baselines.json")
+        with open(self.path, "w") as file:
+            json.dump(
+                {"benchmarks": {"fast": {"min": 1.0, "relative": 1.0, "spread": 0.0}}},
+                file,
+            )
+
+    def tearDown(self: "TestBenchmarkHarness") -> None:
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_regression_against_baseline(self: "TestBenchmarkHarness") -> None:
+        """Test that the change of the fastest relative round is reported."""
+        session = BenchmarkSession(self.path, 0.5, save=False)
+        session.results["fast"] = {"min": 1.8, "relative": 1.2, "spread": 0.0}
+        session.results["other"] = {"min": 3.0, "relative": 3.0, "spread": 0.0}
+        self.assertAlmostEqual(session.regression("fast"), 0.2)
+        self.assertIsNone(session.regression("other"))
+        report = "\n".join(session.report())
+        self.assertIn("+20.0%", report)
+        self.assertIn("new", report)
+        self.assertNotIn("REGRESSION", report)
+
+    def test_noise_widens_allowed_regression(self: "TestBenchmarkHarness") -> None:
+        """Test that the spread of the rounds adds to the allowed slowdown."""
+        session = BenchmarkSession(self.path, 0.1, save=False)
+        session.results["fast"] = {"min": 1.5, "relative": 1.5, "spread": 0.05}
+        self.assertAlmostEqual(session.allowed_regression("fast"), 0.2)
+        self.assertTrue(session.is_regression("fast"))
+        session.baselines["fast"]["spread"] = 0.3
+        self.assertAlmostEqual(session.allowed_regression("fast"), 0.7)
+        self.assertFalse(session.is_regression("fast"))
+
+    def test_rounds_are_calibrated(self: "TestBenchmarkHarness") -> None:
+        """Test that fast functions are called many times per round."""
+        session = BenchmarkSession(self.path, 0.5, save=True)
+        Benchmark("new", session, rounds=3, min_round_time=0.005)(sum, [1, 2])
+        stats = session.results["new"]
+        self.assertEqual(stats["rounds"], 3)
+        self.assertGreater(stats["calls"], 100)
+        self.assertLessEqual(stats["min"], stats["median"])
+        self.assertGreater(stats["relative"], 0.0)
+        self.assertGreaterEqual(stats["spread"], 0.0)
+
+    def test_regression_fails_benchmark(self: "TestBenchmarkHarness") -> None:
+        """Test that a benchmark slower than allowed fails."""
+        session = BenchmarkSession(self.path, 0.5, save=False)
+        session.baselines["fast"]["relative"] = 1e-12
+        benchmark = Benchmark("fast", session, min_round_time=0.001)
+        with self.assertRaises(pytest.fail.Exception):
+            benchmark.pedantic(sum, lambda: (([1, 2],), {}), rounds=1)
+        self.assertEqual(session.results["fast"]["rounds"], 1)
+
+    def test_save_writes_results(self: "TestBenchmarkHarness") -> None:
+        """Test that saved results are merged into the baselines."""
+        session = BenchmarkSession(self.path, 0.5, save=True)
+        Benchmark("new", session, rounds=3, min_round_time=0.001)(sum, [1, 2])
+        session.write()
+        with open(self.path) as file:
+            benchmarks = json.load(file)["benchmarks"]
+        self.assertEqual(set(benchmarks), {"fast", "new"})
+        self.assertGreater(benchmarks["new"]["rounds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Benchmarks for saving, validating and rendering games."""
+
+import io
+import os
+from contextlib import redirect_stdout
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from src.business_logic.coder.computer_coder import ComputerCoder
+from src.business_logic.game_state import GameState
+from src.business_logic.game_turn import GameTurn
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.cli.game_renderer.game_renderer import GameRenderer
+from src.network.json_validator import JsonValidator
+from src.persistence.game_archive import GameArchive
+from src.persistence.persistence_manager import PersistenceManager
+from tests.benchmarks.harness import Benchmark # noqa
+
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "src", "util", "schema.json"
+)
+
+
+@pytest.fixture
+def game_state() -> GameState:
+    """Create the state of a game the computer guesser played for a while."""
+    positions, colors = 5, 8
+    guesser = ComputerGuesser(positions, colors)
+    coder = ComputerCoder(positions, colors)
+    coder.secret_code = guesser.code_space.decode(12345)
+    state = GameState(coder.secret_code, 12, positions, colors, "Benchmark",
+                      guesser)
+    for _ in range(3):
+        guess = guesser.make_guess()
+        feedback = coder.give_feedback(guess)
+        state.add_turn(GameTurn(guess, feedback))
+        guesser.process_feedback(feedback)
+    return state
+
+
+@pytest.fixture
+def persistence_manager(tmp_path: str) -> PersistenceManager:
+    """Create a persistence manager saving into a temporary directory."""
+    return PersistenceManager(str(tmp_path))
+
+
+def test_save_game_state(
+    benchmark: Benchmark, persistence_manager: PersistenceManager,
+    game_state: GameState
+) -> None:
+    """Benchmark saving a game in progress."""
+    benchmark(persistence_manager.save_game_state, game_state)
+
+
+def test_load_game_state(
+    benchmark: Benchmark, persistence_manager: PersistenceManager,
+    game_state: GameState
+) -> None:
+    """Benchmark loading a game in progress."""
+    persistence_manager.save_game_state(game_state)
+    loaded = benchmark(persistence_manager.load_game_state)
+    assert len(loaded.get_turns()) == len(game_state.get_turns())
+
+
+@pytest.fixture
+def archive(tmp_path: str, game_state: GameState) -> Iterator[GameArchive]:
+    """Create an archive of 2000 games of 200 guessing players."""
+    archive = GameArchive(os.path.join(str(tmp_path), "history.sqlite3"))
+    game_state.current_guesser = PlayerGuesser()
+    for number in range(2000):
+        game_state.player_name = f"player{number % 200}"
+        archive.record_game(game_state, "guesser", number % 3 == 0)
+    yield archive
+    archive.close()
+
+
+def test_archive_game(
+    benchmark: Benchmark, archive: GameArchive, game_state: GameState
+) -> None:
+    """Benchmark archiving a finished game."""
+    benchmark(archive.record_game, game_state, "guesser", True, [0.5] * 3)
+
+
+def test_archive_leaderboard(benchmark: Benchmark, archive: GameArchive) -> None:
+    """Benchmark ranking the players of a configuration."""
+    assert len(benchmark(archive.leaderboard, 5, 8)) == 10
+
+
+def test_validate_json(benchmark: Benchmark) -> None:
+    """Benchmark validating a server response."""
+    validator = JsonValidator(SCHEMA_PATH)
+    response = {"gameid": 42, "gamerid": "player1", "positions": 5,
+                "colors": 8, "value": "12345"}
+    assert benchmark(validator.validate, response)
+
+
+def test_render_game_state(benchmark: Benchmark, game_state: GameState) -> None:
+    """Benchmark rendering a game without clearing the terminal."""
+    renderer = GameRenderer()
+    with patch.object(GameRenderer, "clear_screen"), \
+            redirect_stdout(io.StringIO()):
+        benchmark(renderer.render_game_state, game_state)
@@ -0,0 +1,75 @@
+"""Benchmarks for the feedback and the computer guesser."""
+
+import random
+from typing import Tuple
+
+import pytest
+
+from src.business_logic.coder.computer_coder import ComputerCoder
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.solver.decision_cache import DecisionCache
+from src.business_logic.solver.opening_book import OpeningBook
+from src.util.color_code import ColorCode
+from tests.benchmarks.harness import Benchmark # noqa
+
+CONFIGURATIONS = [(4, 6), (5, 8), (6, 8), (7, 8)]
+SECRET_SEED = 0
+
+
+def _guesser(positions: int, colors: int) -> ComputerGuesser:
+    """Create a guesser that searches every move itself."""
+    return ComputerGuesser(positions, colors, opening_book=OpeningBook(None),
+                           decision_cache=DecisionCache())
+
+
+def _secret(positions: int, colors: int) -> int:
+    """Get the fixed secret code index of a configuration."""
+    return random.Random(SECRET_SEED).randrange(colors**positions)
+
+
+def _after_first_feedback(positions: int, colors: int) -> ComputerGuesser:
+    """Create a guesser that got the feedback on its first guess."""
+    guesser = _guesser(positions, colors)
+    coder = ComputerCoder(positions, colors)
+    coder.secret_code = guesser.code_space.decode(_secret(positions, colors))
+    guesser.process_feedback(coder.give_feedback(guesser.make_guess()))
+    return guesser
+
+
+@pytest.mark.parametrize("positions,colors", CONFIGURATIONS)
+def test_give_feedback(benchmark: Benchmark, positions: int, colors: int) -> None:
+    """Benchmark the feedback of the computer coder."""
+    rng = random.Random(SECRET_SEED)
+    coder = ComputerCoder(positions, colors)
+    coder.secret_code = [ColorCode(rng.randint(1, colors)) for _ in range(positions)]
+    guess = [ColorCode(rng.randint(1, colors)) for _ in range(positions)]
+    feedback = benchmark(coder.give_feedback, guess)
+    assert len(feedback) <= positions
+
+
+@pytest.mark.parametrize("positions,colors", CONFIGURATIONS)
+def test_process_first_feedback(
+    benchmark: Benchmark, positions: int, colors: int
+) -> None:
+    """Benchmark filtering the whole code space by the first feedback."""
+
+    def setup() -> Tuple[tuple, dict]:
+        """Create a guesser that made its first guess."""
+        guesser = _guesser(positions, colors)
+        coder = ComputerCoder(positions, colors)
+        coder.secret_code = guesser.code_space.decode(_secret(positions, colors))
+        return (guesser, coder.give_feedback(guesser.make_guess())), {}
+
+    benchmark.pedantic(ComputerGuesser.process_feedback, setup, rounds=10)
+
+
+@pytest.mark.parametrize("positions,colors", CONFIGURATIONS)
+def test_second_guess(benchmark: Benchmark, positions: int, colors: int) -> None:
+    """Benchmark the search for the guess after the first feedback."""
+
+    def setup() -> Tuple[tuple, dict]:
+        """Create a guesser that got the feedback on its first guess."""
+        return (_after_first_feedback(positions, colors),), {}
+
+    guess = benchmark.pedantic(ComputerGuesser.make_guess, setup, rounds=7)
+    assert len(guess) == positions
@@ -1,7 +1,10 @@
 """Test module for ComputerCoder."""
 
+import random
 import unittest
 from src.business_logic.coder.computer_coder import ComputerCoder
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
 from src.util.color_code import ColorCode
 from src.util.feedback_color_code import FeedbackColorCode
 
@@ -74,6 +77,7 @@ class TestComputerCoder(unittest.TestCase):
 
         feedback = self.coder.give_feedback(guess)
         self.assertEqual(len(feedback), 0)
+        self.assertIsNone(self.coder.give_feedback_score(guess))
 
     def test_secret_code_property(self: "TestComputerCoder") -> None:
         """Test secret code getter/setter."""
@@ -90,6 +94,45 @@ class TestComputerCoder(unittest.TestCase):
         # Test that we got some variety in the generated codes
         self.assertGreater(len(codes), 1)
 
+    def test_give_feedback_score(self: "TestComputerCoder") -> None:
+        """Test the integer feedback against the guesser's scorer."""
+        code_space = CodeSpace(self.positions, self.colors)
+        scorer = FeedbackScorer(code_space)
+        rng = random.Random(0)
+        for _ in range(200):
+            secret, guess = rng.randrange(code_space.size), rng.randrange(
+                code_space.size)
+            self.coder.secret_code = code_space.decode(secret)
+            score = self.coder.give_feedback_score(code_space.decode(guess))
+            self.assertEqual(score, scorer.score(guess, secret))
+            self.assertEqual(
+                self.coder.give_feedback(code_space.decode(guess)),
+                scorer.decode(score),
+            )
+
+    def test_give_feedback_returns_new_list(self: "TestComputerCoder") -> None:
+        """Test that changing a returned feedback does not affect others."""
+        self.coder.secret_code = [ColorCode(1)] * self.positions
+        feedback = self.coder.give_feedback([ColorCode(1)] * self.positions)
+        feedback.clear()
+        self.assertEqual(
+            len(self.coder.give_feedback([ColorCode(1)] * self.positions)),
+            self.positions,
+        )
+
+    def test_give_feedback_without_secret(self: "TestComputerCoder") -> None:
+        """Test that no feedback is given before a secret code is set."""
+        self.assertEqual(self.coder.give_feedback([ColorCode(1)] * 4), [])
+        self.assertIsNone(self.coder.give_feedback_score([ColorCode(1)] * 4))
+
+    def test_give_feedback_invalid_items(self: "TestComputerCoder") -> None:
+        """Test that invalid guess items match nothing, like before scoring."""
+        self.coder.secret_code = [ColorCode(1), ColorCode(2), ColorCode(1),
+                                  ColorCode(3)]
+        guess = [ColorCode(1), None, 3, ColorCode(2)]
+        self.assertEqual(self.coder.give_feedback(guess),
+                         [FeedbackColorCode.BLACK, FeedbackColorCode.WHITE])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,16 @@
 """Test module for ComputerGuesser."""
 
 import unittest
+
+import numpy as np
+
+from src.business_logic.coder.computer_coder import ComputerCoder
+from src.business_logic.game_turn import GameTurn
 from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.solver.consistent_codes import ConsistentCodes
+from src.business_logic.solver.decision_cache import DecisionCache
+from src.business_logic.solver.opening_book import OpeningBook
+from src.business_logic.solver.strategies import available_strategies
 from src.util.color_code import ColorCode
 from src.util.feedback_color_code import FeedbackColorCode
 
@@ -95,6 +104,23 @@ class TestComputerGuesser(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.guesser.make_guess()
 
+    def test_largest_configuration_starts(self: "TestComputerGuesser") -> None:
+        """Test that the guesser starts on 9 positions with 8 colors."""
+        guesser = ComputerGuesser(9, 8)
+        self.assertEqual(len(guesser.possible_codes), 8**9)
+        self.assertEqual(len(guesser.make_guess()), 9)
+
+    def test_process_feedback_keeps_consistent_codes(self: "TestComputerGuesser")\
+            -> None:
+        """Test that every remaining code matches the received feedback."""
+        self.guesser.make_guess()
+        feedback = [FeedbackColorCode.BLACK, FeedbackColorCode.WHITE]
+        self.guesser.process_feedback(feedback)
+
+        for index in self.guesser.possible_codes[:50]:
+            code = self.guesser.code_space.decode(int(index))
+            self.assertTrue(self.guesser._would_give_same_feedback(code, feedback))
+
     def test_process_feedback_no_last_guess(self: "TestComputerGuesser") -> None:
         """Test processing feedback without previous guess."""
         self.guesser.last_guess = None
@@ -102,6 +128,140 @@ class TestComputerGuesser(unittest.TestCase):
         self.guesser.process_feedback(feedback)
         # Should not raise any exception
 
+    def test_strategies_solve_the_game(self: "TestComputerGuesser") -> None:
+        """Test that every strategy finds the secret code."""
+        secret = [ColorCode(3), ColorCode(1), ColorCode(4), ColorCode(4)]
+        for strategy in available_strategies():
+            guesser = ComputerGuesser(4, 6, strategy=strategy)
+            for _ in range(10):
+                guess = guesser.make_guess()
+                if guess == secret:
+                    break
+                guesser.process_feedback(guesser._calculate_feedback(guess, secret))
+            self.assertEqual(guess, secret)
+
+            statistics = guesser.get_statistics()
+            self.assertEqual(statistics["strategy"], strategy)
+            self.assertEqual(statistics["guesses"], len(guesser.history) + 1)
+            self.assertGreaterEqual(statistics["max_move_time"],
+                                    statistics["mean_move_time"])
+
+    def test_unknown_strategy(self: "TestComputerGuesser") -> None:
+        """Test that an unknown strategy is rejected."""
+        with self.assertRaises(ValueError):
+            ComputerGuesser(4, 6, strategy="unknown")
+
+    def test_lazy_candidates(self: "TestComputerGuesser") -> None:
+        """Test that large configurations generate candidates lazily."""
+        secret = [ColorCode(3), ColorCode(1), ColorCode(4), ColorCode(4)]
+        self.guesser.LAZY_THRESHOLD = 100
+        self.guesser.LAZY_SAMPLE_SIZE = 64
+
+        guess = self.guesser.make_guess()
+        self.guesser.process_feedback(
+            self.guesser._calculate_feedback(guess, secret)
+        )
+        self.assertIsInstance(self.guesser.possible_codes, ConsistentCodes)
+
+        for _ in range(10):
+            guess = self.guesser.make_guess()
+            if guess == secret:
+                break
+            self.guesser.process_feedback(
+                self.guesser._calculate_feedback(guess, secret)
+            )
+        self.assertEqual(guess, secret)
+        self.assertIsInstance(self.guesser.possible_codes, np.ndarray)
+
+    def test_sampled_search_is_not_cached(self: "TestComputerGuesser") -> None:
+        """Test that guesses found on a candidate sample are not cached."""
+        cache = DecisionCache()
+        guesser = ComputerGuesser(4, 6, opening_book=OpeningBook(None),
+                                  decision_cache=cache)
+        guesser.LAZY_THRESHOLD = 100
+        guesser.LAZY_SAMPLE_SIZE = 64
+        guesser.make_guess()
+        guesser.process_feedback([FeedbackColorCode.WHITE])
+        self.assertIsInstance(guesser.possible_codes, ConsistentCodes)
+
+        guesser.make_guess()
+        self.assertEqual(guesser.move_coverages[-1], 1.0)
+        self.assertEqual(len(cache), 0)
+
+    def test_time_limit_reports_coverage(self: "TestComputerGuesser") -> None:
+        """Test that a deadline cuts the search short and reports coverage."""
+        guesser = ComputerGuesser(5, 8, time_limit=0,
+                                  opening_book=OpeningBook(None))
+        guesser.make_guess()
+        guesser.process_feedback([FeedbackColorCode.WHITE])
+        guesser.make_guess()
+
+        self.assertEqual(guesser.move_coverages[0], 1.0)
+        self.assertLess(guesser.move_coverages[1], 1.0)
+        self.assertEqual(guesser.get_statistics()["min_coverage"],
+                         guesser.move_coverages[1])
+
+    def test_symmetry_follows_history(self: "TestComputerGuesser") -> None:
+        """Test that processed guesses restrict the symmetry group."""
+        self.guesser.make_guess()
+        self.guesser.process_feedback([FeedbackColorCode.WHITE])
+
+        self.assertEqual(self.guesser.symmetry.free_colors, [2, 3, 4, 5])
+        self.assertEqual(self.guesser.symmetry.position_classes, [[0, 1], [2, 3]])
+
+    def test_feedback_uses_search_partition(self: "TestComputerGuesser") -> None:
+        """Test that feedback on a searched guess is looked up."""
+        guesser = ComputerGuesser(4, 6, opening_book=OpeningBook(None),
+                                  decision_cache=DecisionCache())
+        guesser.make_guess()
+        guesser.process_feedback([FeedbackColorCode.WHITE])
+        candidates = guesser.possible_codes
+        guesser.make_guess()
+        guess = guesser.last_partition[0]
+
+        feedback = [FeedbackColorCode.BLACK]
+        scores = guesser.scorer.score_many(guess, candidates)
+        guesser.process_feedback(feedback)
+
+        expected = candidates[scores == guesser.scorer.encode(feedback)]
+        self.assertEqual(guesser.possible_codes.tolist(), expected.tolist())
+        self.assertIsNone(guesser.last_partition)
+
+    def test_replay_restores_possible_codes(self: "TestComputerGuesser") -> None:
+        """Test that replaying the turns rebuilds the solver state."""
+        coder = ComputerCoder(self.positions, self.colors)
+        coder.secret_code = self.guesser.code_space.decode(1000)
+        turns = []
+        for _ in range(2):
+            guess = self.guesser.make_guess()
+            feedback = coder.give_feedback(guess)
+            self.guesser.process_feedback(feedback)
+            turns.append(GameTurn(guess, feedback))
+        turns.append(GameTurn(self.guesser.make_guess(), None))
+
+        restored = ComputerGuesser(self.positions, self.colors)
+        restored.replay(turns)
+        self.assertFalse(restored.first_guess)
+        self.assertEqual(restored.history, self.guesser.history)
+        self.assertEqual(restored.last_guess, self.guesser.last_guess)
+        np.testing.assert_array_equal(
+            restored.possible_codes, self.guesser.possible_codes
+        )
+
+    def test_replay_processes_feedback_without_pins(
+        self: "TestComputerGuesser",
+    ) -> None:
+        """Test that a last turn given no pins is not taken as pending."""
+        guess = self.guesser.make_guess()
+        self.guesser.process_feedback([])
+
+        restored = ComputerGuesser(self.positions, self.colors)
+        restored.replay([GameTurn(guess, [])])
+        self.assertEqual(restored.history, self.guesser.history)
+        np.testing.assert_array_equal(
+            restored.possible_codes, self.guesser.possible_codes
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
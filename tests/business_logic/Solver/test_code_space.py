@@ -0,0 +1,56 @@
+"""Test module for CodeSpace."""
+
+import unittest
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.util.color_code import ColorCode
+
+
+class TestCodeSpace(unittest.TestCase):
+    """Test cases for CodeSpace class."""
+
+    def setUp(self: "TestCodeSpace") -> None:
+        """Set up test fixtures before each test method."""
+        self.code_space = CodeSpace(4, 6)
+
+    def test_size(self: "TestCodeSpace") -> None:
+        """Test that the size matches colors to the power of positions."""
+        self.assertEqual(self.code_space.size, 6**4)
+        self.assertEqual(len(self.code_space.all_codes()), 6**4)
+
+    def test_encode_decode_roundtrip(self: "TestCodeSpace") -> None:
+        """Test that encoding and decoding are inverse operations."""
+        code = [ColorCode.GREEN, ColorCode.RED, ColorCode.BROWN, ColorCode.BLUE]
+        index = self.code_space.encode(code)
+        self.assertEqual(index, 1 * 216 + 0 * 36 + 5 * 6 + 3)
+        self.assertEqual(self.code_space.decode(index), code)
+
+    def test_to_digits_matrix(self: "TestCodeSpace") -> None:
+        """Test unpacking several indices into a digit matrix."""
+        digits = self.code_space.to_digits(np.array([0, 1, 1295]))
+        self.assertEqual(digits.shape, (3, 4))
+        self.assertEqual(digits.dtype, np.uint8)
+        self.assertEqual(digits.tolist(), [[0, 0, 0, 0], [0, 0, 0, 1], [5, 5, 5, 5]])
+
+    def test_chunks_cover_all_codes(self: "TestCodeSpace") -> None:
+        """Test that chunking a range yields every index exactly once."""
+        code_space = CodeSpace(7, 6)
+        chunks = list(code_space.chunks(code_space.all_codes()))
+        self.assertGreater(len(chunks), 1)
+        joined = np.concatenate(chunks)
+        self.assertEqual(len(joined), code_space.size)
+        self.assertEqual(joined[-1], code_space.size - 1)
+        self.assertEqual(joined.dtype, np.uint32)
+
+    def test_largest_configuration(self: "TestCodeSpace") -> None:
+        """Test that the largest configuration fits into 32 bit indices."""
+        code_space = CodeSpace(9, 8)
+        code = [ColorCode.BLACK] * 9
+        self.assertEqual(code_space.encode(code), code_space.size - 1)
+        self.assertEqual(code_space.decode(code_space.size - 1), code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Test module for ConsistentCodes."""
+
+import random
+import unittest
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.consistent_codes import ConsistentCodes
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+
+
+class TestConsistentCodes(unittest.TestCase):
+    """Test cases for ConsistentCodes class."""
+
+    def setUp(self: "TestConsistentCodes") -> None:
+        """Set up test fixtures before each test method."""
+        self.code_space = CodeSpace(4, 6)
+        self.scorer = FeedbackScorer(self.code_space)
+        secret = 1000
+        self.history = [(guess, self.scorer.score(guess, secret))
+                        for guess in (7, 500, 1200)]
+
+    def _brute_force(self: "TestConsistentCodes", history: list) -> list:
+        """Filter the whole code space by the history."""
+        codes = np.arange(self.code_space.size, dtype=np.uint32)
+        mask = np.ones(len(codes), dtype=bool)
+        for guess, score in history:
+            mask &= self.scorer.score_many(guess, codes) == score
+        return np.flatnonzero(mask).tolist()
+
+    def test_matches_brute_force(self: "TestConsistentCodes") -> None:
+        """Test that exactly the consistent codes are generated, in order."""
+        for length in range(len(self.history) + 1):
+            history = self.history[:length]
+            self.assertEqual(list(ConsistentCodes(self.code_space, history)),
+                             self._brute_force(history))
+
+    def test_empty_history_yields_code_space(self: "TestConsistentCodes") -> None:
+        """Test that without history every code is consistent."""
+        codes = ConsistentCodes(CodeSpace(3, 2), [])
+        self.assertEqual(list(codes), list(range(8)))
+
+    def test_first(self: "TestConsistentCodes") -> None:
+        """Test that first returns the smallest consistent codes."""
+        expected = self._brute_force(self.history[:1])
+        codes = ConsistentCodes(self.code_space, self.history[:1])
+        self.assertEqual(codes.first(10).tolist(), expected[:10])
+        self.assertEqual(codes.first(10**6).tolist(), expected)
+
+    def test_search_from_start(self: "TestConsistentCodes") -> None:
+        """Test that the search can continue from any code."""
+        expected = self._brute_force(self.history[:2])
+        codes = ConsistentCodes(self.code_space, self.history[:2])
+        self.assertEqual(list(codes._search(600)),
+                         [code for code in expected if code >= 600])
+
+    def test_sample(self: "TestConsistentCodes") -> None:
+        """Test that samples only hold consistent codes."""
+        expected = set(self._brute_force(self.history[:1]))
+        codes = ConsistentCodes(self.code_space, self.history[:1])
+        sample = codes.sample(64, random.Random(0))
+
+        self.assertEqual(len(sample), 64)
+        self.assertEqual(sample.tolist(), sorted(set(sample.tolist())))
+        self.assertTrue(set(sample.tolist()) <= expected)
+
+    def test_sample_time_limit(self: "TestConsistentCodes") -> None:
+        """Test that an exhausted time limit stops after the first run."""
+        codes = ConsistentCodes(self.code_space, self.history[:1])
+        sample = codes.sample(64, random.Random(0), time_limit=0)
+        self.assertEqual(len(sample), ConsistentCodes.RUN_LENGTH)
+
+    def test_inconsistent_history(self: "TestConsistentCodes") -> None:
+        """Test that contradicting feedback leaves no codes."""
+        winning = self.scorer.winning_score
+        codes = ConsistentCodes(self.code_space, [(7, winning), (8, winning)])
+        self.assertEqual(list(codes), [])
+        self.assertEqual(len(codes.sample(8, random.Random(0))), 0)
+
+    def test_large_configuration(self: "TestConsistentCodes") -> None:
+        """Test that codes of 9 positions are found without enumeration."""
+        code_space = CodeSpace(9, 8)
+        scorer = FeedbackScorer(code_space)
+        guess = code_space.size // 3
+        history = [(guess, scorer.score(guess, 12345678))]
+        codes = ConsistentCodes(code_space, history).first(100)
+
+        self.assertEqual(len(codes), 100)
+        self.assertTrue((scorer.score_many(guess, codes) == history[0][1]).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
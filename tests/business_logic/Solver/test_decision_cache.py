@@ -0,0 +1,90 @@
+"""Test module for DecisionCache."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.solver.decision_cache import DecisionCache
+from src.business_logic.solver.opening_book import OpeningBook
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+class TestDecisionCache(unittest.TestCase):
+    """Test cases for DecisionCache class."""
+
+    def setUp(self: "TestDecisionCache") -> None:
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "decisions.bin")
+        self.cache = DecisionCache(capacity=2, file_path=self.path)
+
+    def tearDown(self: "TestDecisionCache") -> None:
+        """Clean up after each test method."""
+        self.temp_dir.cleanup()
+
+    def test_get_and_put(self: "TestDecisionCache") -> None:
+        """Test that decisions are keyed by configuration and history."""
+        self.cache.put(4, 6, [(7, 3)], 42)
+        self.assertEqual(self.cache.get(4, 6, [(7, 3)]), 42)
+        self.assertIsNone(self.cache.get(4, 6, [(7, 4)]))
+        self.assertIsNone(self.cache.get(5, 6, [(7, 3)]))
+        self.assertIsNone(self.cache.get(4, 6, [(7, 3)], "entropy"))
+
+    def test_least_recently_used_is_evicted(self: "TestDecisionCache") -> None:
+        """Test that the capacity bounds the cache in LRU order."""
+        self.cache.put(4, 6, [], 1)
+        self.cache.put(4, 6, [(1, 0)], 2)
+        self.cache.get(4, 6, [])
+        self.cache.put(4, 6, [(1, 1)], 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get(4, 6, []), 1)
+        self.assertIsNone(self.cache.get(4, 6, [(1, 0)]))
+
+    def test_save_and_load(self: "TestDecisionCache") -> None:
+        """Test that a saved cache is restored from its file."""
+        self.cache.put(4, 6, [(7, 3), (100, 12)], 42)
+        self.cache.put(4, 6, [], 9, "entropy")
+        self.cache.save()
+
+        restored = DecisionCache(file_path=self.path)
+        self.assertEqual(restored.get(4, 6, [(7, 3), (100, 12)]), 42)
+        self.assertEqual(restored.get(4, 6, [], "entropy"), 9)
+
+    def test_save_without_file_path(self: "TestDecisionCache") -> None:
+        """Test that an in-memory cache cannot be saved."""
+        with self.assertRaises(ValueError):
+            DecisionCache().save()
+
+    def test_corrupted_file_is_ignored(self: "TestDecisionCache") -> None:
+        """Test that an unreadable file leaves the cache empty."""
+        with open(self.path, "wb") as file:
+            file.write(b"garbage")
+
+        with self.assertLogs(level="ERROR"):
+            cache = DecisionCache(file_path=self.path)
+        self.assertEqual(len(cache), 0)
+
+    def test_guesser_reuses_decision(self: "TestDecisionCache") -> None:
+        """Test that a repeated game history is answered without searching."""
+        book = OpeningBook(self.temp_dir.name)
+        cache = DecisionCache()
+        feedback = [FeedbackColorCode.BLACK, FeedbackColorCode.WHITE]
+
+        first = ComputerGuesser(4, 6, opening_book=book, decision_cache=cache)
+        first.make_guess()
+        first.process_feedback(feedback)
+        expected = first.make_guess()
+
+        second = ComputerGuesser(4, 6, opening_book=book, decision_cache=cache)
+        second.make_guess()
+        second.process_feedback(feedback)
+        with patch.object(second.strategy, "choose") as best_guess:
+            self.assertEqual(second.make_guess(), expected)
+        best_guess.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Test module for FeedbackScorer."""
+
+import unittest
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import (
+    FeedbackScorer,
+    color_histogram,
+    decode_score,
+    score_pair,
+)
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+class TestFeedbackScorer(unittest.TestCase):
+    """Test cases for FeedbackScorer class."""
+
+    def setUp(self: "TestFeedbackScorer") -> None:
+        """Set up test fixtures before each test method."""
+        self.code_space = CodeSpace(4, 6)
+        self.scorer = FeedbackScorer(self.code_space)
+
+    def _score(self: "TestFeedbackScorer", guess: list, code: list) -> int:
+        """Score two codes given as lists of color values."""
+        return self.scorer.score(
+            self.code_space.encode([ColorCode(value) for value in guess]),
+            self.code_space.encode([ColorCode(value) for value in code]),
+        )
+
+    def test_score_encoding(self: "TestFeedbackScorer") -> None:
+        """Test that scores are encoded as black * (positions + 1) + white."""
+        self.assertEqual(self._score([1, 2, 3, 4], [1, 2, 4, 3]), 2 * 5 + 2)
+        self.assertEqual(self._score([1, 1, 2, 2], [3, 4, 5, 6]), 0)
+        self.assertEqual(self._score([1, 1, 2, 2], [1, 1, 2, 2]),
+                         self.scorer.winning_score)
+
+    def test_duplicate_colors(self: "TestFeedbackScorer") -> None:
+        """Test that duplicate colors are only counted once per match."""
+        self.assertEqual(self._score([1, 1, 1, 2], [2, 1, 3, 3]), 1 * 5 + 1)
+        self.assertEqual(self._score([1, 1, 2, 2], [2, 2, 1, 1]), 4)
+
+    def test_encode_decode_feedback(self: "TestFeedbackScorer") -> None:
+        """Test conversion between pins and scores."""
+        feedback = [FeedbackColorCode.WHITE, FeedbackColorCode.BLACK,
+                    FeedbackColorCode.WHITE]
+        score = self.scorer.encode(feedback)
+        self.assertEqual(score, 1 * 5 + 2)
+        self.assertEqual(
+            self.scorer.decode(score),
+            [FeedbackColorCode.BLACK, FeedbackColorCode.WHITE,
+             FeedbackColorCode.WHITE],
+        )
+
+    def test_score_many_matches_single_scores(self: "TestFeedbackScorer") -> None:
+        """Test batch scoring against pairwise scoring."""
+        codes = np.arange(0, self.code_space.size, 37, dtype=np.uint32)
+        scores = self.scorer.score_many(123, codes)
+        self.assertEqual(scores.dtype, np.uint8)
+        self.assertEqual(
+            scores.tolist(), [self.scorer.score(123, int(code)) for code in codes]
+        )
+
+    def test_score_batch_on_candidate_matrix(self: "TestFeedbackScorer") -> None:
+        """Test vectorized scoring of a guess against a digit matrix."""
+        guess = self.code_space.to_digits(self.code_space.encode(
+            [ColorCode(1), ColorCode(1), ColorCode(2), ColorCode(3)]))
+        digits = np.array([[0, 0, 1, 2], [1, 2, 0, 0], [3, 4, 5, 5], [0, 1, 1, 1]],
+                          dtype=np.uint8)
+        scores = self.scorer.score_batch(guess, digits)
+        self.assertEqual(scores.tolist(), [4 * 5, 4, 0, 2 * 5])
+
+    def test_matrix_cache(self: "TestFeedbackScorer") -> None:
+        """Test that matrix rows are cached for small code spaces only."""
+        self.scorer.score_many(5, np.arange(10))
+        self.assertIn(5, self.scorer._rows)
+        uncached = FeedbackScorer(self.code_space, cache_matrix=False)
+        self.assertEqual(
+            uncached.score_many(5, np.arange(10)).tolist(),
+            self.scorer.score_many(5, np.arange(10)).tolist(),
+        )
+        self.assertFalse(FeedbackScorer(CodeSpace(6, 8)).cache_matrix)
+
+    def test_without_precomputed_tables(self: "TestFeedbackScorer") -> None:
+        """Test scoring in code spaces too large for precomputed histograms."""
+        code_space = CodeSpace(9, 8)
+        scorer = FeedbackScorer(code_space)
+        guess = code_space.encode([ColorCode(1)] * 4 + [ColorCode(2)] * 5)
+        code = code_space.encode([ColorCode(2)] * 5 + [ColorCode(1)] * 4)
+        self.assertEqual(scorer.score(guess, code), 1 * 10 + 8)
+
+    def test_score_pair(self: "TestFeedbackScorer") -> None:
+        """Test the scoring core on color values with duplicates."""
+        guess, code = [1, 1, 2, 3], [1, 2, 1, 1]
+        score = score_pair(guess, code, color_histogram(code, 9), 4)
+        # One black pin, two white pins
+        self.assertEqual(score, 1 * 5 + 2)
+        self.assertEqual(decode_score(score, 4),
+                         [FeedbackColorCode.BLACK] + [FeedbackColorCode.WHITE] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
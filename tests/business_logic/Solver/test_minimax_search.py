@@ -0,0 +1,244 @@
+"""Test module for MinimaxSearch."""
+
+import pickle
+import unittest
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+from src.business_logic.solver.minimax_search import (
+    OBJECTIVES,
+    MinimaxSearch,
+    is_member,
+    partition_value,
+    split_candidates,
+)
+from src.business_logic.solver.sampling_budget import SamplingBudget
+from src.business_logic.solver.symmetry_group import SymmetryGroup
+
+
+class TestMinimaxSearch(unittest.TestCase):
+    """Test cases for MinimaxSearch class."""
+
+    def setUp(self: "TestMinimaxSearch") -> None:
+        """Set up test fixtures before each test method."""
+        self.code_space = CodeSpace(4, 6)
+        self.scorer = FeedbackScorer(self.code_space)
+        scores = self.scorer.score_many(7, np.arange(self.code_space.size))
+        self.candidates = np.flatnonzero(scores == 5).astype(np.uint32)
+
+    def _worst_case(self: "TestMinimaxSearch", guess: int) -> int:
+        """Compute the largest partition of a guess by brute force."""
+        counts = {}
+        for code in self.candidates.tolist():
+            score = self.scorer.score(guess, code)
+            counts[score] = counts.get(score, 0) + 1
+        return max(counts.values())
+
+    def test_best_guess_is_optimal(self: "TestMinimaxSearch") -> None:
+        """Test that no candidate has a smaller worst case than the result."""
+        search = MinimaxSearch(self.scorer)
+        best = search.best_guess(self.candidates)
+        self.assertIn(best, self.candidates)
+        best_worst = self._worst_case(best)
+        for guess in self.candidates.tolist():
+            self.assertGreaterEqual(self._worst_case(guess), best_worst)
+
+    def test_prefers_candidates_on_ties(self: "TestMinimaxSearch") -> None:
+        """Test that a candidate wins a tie against a non-candidate guess."""
+        search = MinimaxSearch(self.scorer)
+        guesses = np.arange(self.code_space.size, dtype=np.uint32)
+        best = search.best_guess(self.candidates, guesses)
+        worst = self._worst_case(best)
+        if best not in self.candidates:
+            for guess in self.candidates.tolist():
+                self.assertGreater(self._worst_case(guess), worst)
+
+    def test_parallel_matches_sequential(self: "TestMinimaxSearch") -> None:
+        """Test that the process pool returns the sequential result."""
+        sequential = MinimaxSearch(self.scorer).best_guess(self.candidates)
+        parallel_search = MinimaxSearch(self.scorer, workers=2)
+        parallel_search.PARALLEL_THRESHOLD = 1
+        try:
+            self.assertEqual(parallel_search.best_guess(self.candidates), sequential)
+            restored = pickle.loads(pickle.dumps(parallel_search))
+            self.assertIsNone(restored._executor)
+        finally:
+            parallel_search.close()
+
+    def test_lower_bound(self: "TestMinimaxSearch") -> None:
+        """Test the lower bound of the worst case."""
+        search = MinimaxSearch(self.scorer)
+        self.assertEqual(search.lower_bound(1), 1)
+        self.assertEqual(search.lower_bound(14), 1)
+        self.assertEqual(search.lower_bound(15), 2)
+
+    def test_score_budget_limits_guesses(self: "TestMinimaxSearch") -> None:
+        """Test that only the first guesses are tried beyond the budget."""
+        search = MinimaxSearch(self.scorer)
+        search.score_budget = len(self.candidates)
+        first = search.order_guesses(self.candidates, self.candidates)[0]
+        self.assertEqual(search.best_guess(self.candidates), first)
+        self.assertAlmostEqual(search.coverage, 1 / len(self.candidates))
+
+    def test_lower_bound_covers_skipped_guesses(
+        self: "TestMinimaxSearch",
+    ) -> None:
+        """Test that guesses beyond the budget count as ruled out by the bound."""
+        candidates = self.candidates[:2]
+        sequential = MinimaxSearch(self.scorer)
+        sequential.score_budget = len(candidates)
+        parallel = MinimaxSearch(self.scorer, workers=2)
+        parallel.score_budget = len(candidates)
+        parallel.PARALLEL_THRESHOLD = 1
+        try:
+            self.assertEqual(sequential.best_guess(candidates),
+                             parallel.best_guess(candidates))
+        finally:
+            parallel.close()
+        self.assertEqual(sequential.coverage, 1.0)
+        self.assertEqual(parallel.coverage, 1.0)
+
+    def test_partition_value(self: "TestMinimaxSearch") -> None:
+        """Test the rating of partition sizes under each objective."""
+        counts = np.array([4, 0, 2, 1, 1])
+        self.assertEqual(partition_value(counts, "worst_case"), 4)
+        self.assertEqual(partition_value(counts, "expected_size"), 22)
+        self.assertEqual(partition_value(counts, "most_parts"), -4)
+        self.assertAlmostEqual(partition_value(counts, "entropy"), 10.0)
+
+    def test_objectives_find_optimal_guess(self: "TestMinimaxSearch") -> None:
+        """Test that every objective returns a guess with the best value."""
+        guesses = np.arange(self.code_space.size, dtype=np.uint32)
+        for objective in OBJECTIVES:
+            search = MinimaxSearch(self.scorer, objective=objective)
+            values = [
+                partition_value(
+                    np.bincount(self.scorer.score_many(guess, self.candidates),
+                                minlength=self.scorer.num_scores),
+                    objective,
+                )
+                for guess in guesses.tolist()
+            ]
+            best = search.best_guess(self.candidates, guesses)
+            self.assertAlmostEqual(values[best], min(values))
+
+    def test_unknown_objective(self: "TestMinimaxSearch") -> None:
+        """Test that an unknown objective is rejected."""
+        with self.assertRaises(ValueError):
+            MinimaxSearch(self.scorer, objective="unknown")
+
+    def test_is_member(self: "TestMinimaxSearch") -> None:
+        """Test the membership check against a sorted array."""
+        values = np.array([0, 3, 5, 9], dtype=np.uint32)
+        sorted_set = np.array([3, 4, 9], dtype=np.uint32)
+        self.assertEqual(is_member(values, sorted_set).tolist(),
+                         [False, True, False, True])
+
+    def test_time_limit_returns_best_so_far(self: "TestMinimaxSearch") -> None:
+        """Test that an exhausted time limit stops after the first guess."""
+        search = MinimaxSearch(self.scorer,
+                               sampling=SamplingBudget(threshold=0, time_limit=0))
+        first = search.order_guesses(self.candidates, self.candidates)[0]
+        self.assertEqual(search.best_guess(self.candidates), first)
+        self.assertLess(search.coverage, 1.0)
+
+    def test_sampling_above_threshold(self: "TestMinimaxSearch") -> None:
+        """Test that large candidate sets are searched on samples."""
+        scorer = FeedbackScorer(CodeSpace(8, 8))
+        candidates = np.unique(
+            np.random.default_rng(0).integers(0, 8**8, 50000)
+        ).astype(np.uint32)
+        budget = SamplingBudget(threshold=1000, guesses=16, candidates=256, seed=0)
+        search = MinimaxSearch(scorer, sampling=budget)
+
+        sampled_candidates, guesses = search._sample(candidates, candidates)
+        self.assertEqual(len(guesses), 16)
+        self.assertTrue(np.isin(guesses, sampled_candidates).all())
+        self.assertLessEqual(len(sampled_candidates), 256 + 16)
+
+        self.assertIn(search.best_guess(candidates), candidates)
+
+    def test_sampling_below_threshold_is_exact(self: "TestMinimaxSearch") -> None:
+        """Test that small candidate sets are searched exactly."""
+        exact = MinimaxSearch(self.scorer).best_guess(self.candidates)
+        sampled = MinimaxSearch(self.scorer, sampling=SamplingBudget())
+        self.assertEqual(sampled.best_guess(self.candidates), exact)
+
+    def test_time_limit_spares_exact_search(self: "TestMinimaxSearch") -> None:
+        """Test that the sampling time limit never cuts off an exact search."""
+        exact = MinimaxSearch(self.scorer).best_guess(self.candidates)
+        search = MinimaxSearch(self.scorer, sampling=SamplingBudget(time_limit=0))
+        self.assertEqual(search.best_guess(self.candidates), exact)
+        self.assertEqual(search.coverage, 1.0)
+
+    def test_order_guesses(self: "TestMinimaxSearch") -> None:
+        """Test that guesses splitting the candidate sample well come first."""
+        scorer = FeedbackScorer(CodeSpace(5, 8))
+        candidates = np.arange(0, scorer.code_space.size, 7, dtype=np.uint32)
+        search = MinimaxSearch(scorer)
+        ordered = search.order_guesses(candidates, candidates[:500])
+
+        self.assertEqual(sorted(ordered.tolist()), candidates[:500].tolist())
+        sample = candidates[:: len(candidates) // search.ORDER_SAMPLES][:64]
+        values = [
+            np.bincount(scorer.score_many(int(guess), sample),
+                        minlength=scorer.num_scores).max()
+            for guess in ordered.tolist()
+        ]
+        self.assertEqual(values, sorted(values))
+
+    def test_complete_search_coverage(self: "TestMinimaxSearch") -> None:
+        """Test that a complete search reports full coverage."""
+        search = MinimaxSearch(self.scorer)
+        search.best_guess(self.candidates)
+        self.assertEqual(search.coverage, 1.0)
+
+    def test_deadline_overrides_sampling(self: "TestMinimaxSearch") -> None:
+        """Test that an explicit deadline cuts off an exact search."""
+        search = MinimaxSearch(self.scorer)
+        search.best_guess(self.candidates, deadline=0)
+        self.assertEqual(search.coverage, 1 / len(self.candidates))
+
+    def test_symmetry_keeps_best_guess(self: "TestMinimaxSearch") -> None:
+        """Test that searching one guess per class finds the same guess."""
+        symmetry = SymmetryGroup(self.code_space)
+        symmetry.add_guess(7)
+        search = MinimaxSearch(self.scorer)
+        for objective in OBJECTIVES:
+            search.objective = objective
+            self.assertEqual(
+                search.best_guess(self.candidates, symmetry=symmetry),
+                search.best_guess(self.candidates),
+            )
+        self.assertEqual(search.coverage, 1.0)
+
+    def test_split_candidates(self: "TestMinimaxSearch") -> None:
+        """Test that candidates are grouped by score in sorted order."""
+        candidates = np.array([3, 5, 8, 13, 21], dtype=np.uint32)
+        scores = np.array([2, 0, 2, 1, 0], dtype=np.uint8)
+        partition = split_candidates(candidates, scores)
+        self.assertEqual({score: group.tolist() for score, group in partition.items()},
+                         {0: [5, 21], 1: [13], 2: [3, 8]})
+        self.assertEqual(split_candidates(candidates[:0], scores[:0]), {})
+
+    def test_search_keeps_partition(self: "TestMinimaxSearch") -> None:
+        """Test that the exact search groups the candidates by its guess."""
+        search = MinimaxSearch(self.scorer)
+        best = search.best_guess(self.candidates)
+        scores = self.scorer.score_many(best, self.candidates)
+        for score, group in search.partition.items():
+            self.assertEqual(group.tolist(),
+                             self.candidates[scores == score].tolist())
+
+    def test_sampled_search_has_no_partition(self: "TestMinimaxSearch") -> None:
+        """Test that no partition is kept for a candidate sample."""
+        search = MinimaxSearch(self.scorer, sampling=SamplingBudget(
+            threshold=10, guesses=20, candidates=30, seed=0))
+        search.best_guess(self.candidates)
+        self.assertIsNone(search.partition)
+
+
+if __name__ == "__main__":
+    unittest.main()
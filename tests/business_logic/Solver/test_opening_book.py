@@ -0,0 +1,100 @@
+"""Test module for OpeningBook."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.opening_book import OpeningBook, build_tree
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+class TestOpeningBook(unittest.TestCase):
+    """Test cases for OpeningBook class."""
+
+    def setUp(self: "TestOpeningBook") -> None:
+        """Set up test fixtures before each test method."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.book = OpeningBook(self.temp_dir.name)
+        self.code_space = CodeSpace(3, 3)
+        self.tree = build_tree(self.code_space, plies=2)
+
+    def tearDown(self: "TestOpeningBook") -> None:
+        """Clean up after each test method."""
+        self.temp_dir.cleanup()
+
+    def test_first_guess(self: "TestOpeningBook") -> None:
+        """Test that the first guess splits positions between two colors."""
+        code_space = CodeSpace(5, 8)
+        self.assertEqual(
+            code_space.decode(OpeningBook.first_guess(code_space)),
+            [ColorCode(1)] * 2 + [ColorCode(2)] * 3,
+        )
+        self.assertEqual(OpeningBook.first_guess(CodeSpace(4, 1)), 0)
+
+    def test_build_tree(self: "TestOpeningBook") -> None:
+        """Test that the tree covers the first guess and every answer to it."""
+        self.assertEqual(self.tree[()], OpeningBook.first_guess(self.code_space))
+        self.assertTrue(all(len(node) <= 1 for node in self.tree))
+        self.assertGreater(len(self.tree), 1)
+
+    def test_save_and_load(self: "TestOpeningBook") -> None:
+        """Test that a stored tree is read back unchanged."""
+        self.book.save(3, 3, self.tree)
+        self.assertTrue(os.path.exists(self.book.path(3, 3)))
+        self.assertEqual(OpeningBook(self.temp_dir.name).get_tree(3, 3), self.tree)
+
+    def test_missing_or_foreign_book(self: "TestOpeningBook") -> None:
+        """Test that missing and mismatching files give an empty tree."""
+        self.assertEqual(self.book.get_tree(4, 4), {})
+        self.book.save(3, 3, self.tree)
+        os.rename(self.book.path(3, 3), self.book.path(3, 4))
+        self.assertEqual(OpeningBook(self.temp_dir.name).get_tree(3, 4), {})
+
+    def test_book_without_directory(self: "TestOpeningBook") -> None:
+        """Test that a book without directory is empty and not saved."""
+        book = OpeningBook(None)
+        with patch("src.business_logic.solver.opening_book.logging.error") as error:
+            self.assertEqual(book.get_tree(4, 6), {})
+        error.assert_not_called()
+        self.assertIsNone(book.lookup(4, 6, []))
+        with self.assertRaises(ValueError):
+            book.save(3, 3, self.tree)
+
+    def test_lookup_follows_history(self: "TestOpeningBook") -> None:
+        """Test lookups along and off the book's guesses."""
+        self.book.save(3, 3, self.tree)
+        first = self.tree[()]
+        score = next(node[0] for node in self.tree if node)
+        self.assertEqual(self.book.lookup(3, 3, []), first)
+        self.assertEqual(self.book.lookup(3, 3, [(first, score)]), self.tree[(score,)])
+        self.assertIsNone(self.book.lookup(3, 3, [(first + 1, score)]))
+
+    def test_guesser_uses_book(self: "TestOpeningBook") -> None:
+        """Test that the computer guesser plays the book's second guess."""
+        self.book.save(3, 3, {(): OpeningBook.first_guess(self.code_space),
+                              (0,): 26})
+        guesser = ComputerGuesser(3, 3, opening_book=self.book)
+        guesser.make_guess()
+        guesser.process_feedback([])
+        self.assertEqual(guesser.make_guess(), [ColorCode(3)] * 3)
+
+    def test_shipped_book_is_consistent(self: "TestOpeningBook") -> None:
+        """Test that the shipped 4x6 book only plays consistent codes."""
+        guesser = ComputerGuesser(4, 6)
+        guesser.make_guess()
+        feedback = [FeedbackColorCode.WHITE]
+        guesser.process_feedback(feedback)
+        second = guesser.make_guess()
+        self.assertEqual(
+            guesser.code_space.encode(second),
+            OpeningBook.default().lookup(4, 6, guesser.history),
+        )
+        self.assertIn(guesser.code_space.encode(second), guesser.possible_codes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Test module for the solver strategies."""
+
+import unittest
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+from src.business_logic.solver.strategies import (
+    STRATEGIES,
+    PartitionStrategy,
+    RandomConsistentStrategy,
+    available_strategies,
+    create_strategy,
+)
+from src.business_logic.solver.strategy_benchmark import benchmark_strategy
+
+
+class TestStrategies(unittest.TestCase):
+    """Test cases for the strategy registry and strategies."""
+
+    def setUp(self: "TestStrategies") -> None:
+        """Set up test fixtures before each test method."""
+        self.scorer = FeedbackScorer(CodeSpace(4, 6))
+        scores = self.scorer.score_many(7, np.arange(self.scorer.code_space.size))
+        self.candidates = np.flatnonzero(scores == 5).astype(np.uint32)
+
+    def test_registry(self: "TestStrategies") -> None:
+        """Test that all strategies are registered by name."""
+        self.assertEqual(
+            available_strategies(),
+            ["minimax", "expected_size", "entropy", "most_parts", "random"],
+        )
+        for name, strategy in STRATEGIES.items():
+            self.assertEqual(strategy.name, name)
+
+    def test_create_strategy(self: "TestStrategies") -> None:
+        """Test that partition strategies search with their objective."""
+        strategy = create_strategy("most_parts", self.scorer, workers=2)
+        self.assertIsInstance(strategy, PartitionStrategy)
+        self.assertEqual(strategy.search.objective, "most_parts")
+        self.assertEqual(strategy.search.workers, 2)
+        with self.assertRaises(ValueError):
+            create_strategy("unknown", self.scorer)
+
+    def test_only_minimax_uses_opening_book(self: "TestStrategies") -> None:
+        """Test that the opening book is limited to the strategy it was built for."""
+        self.assertEqual(
+            [name for name, strategy in STRATEGIES.items()
+             if strategy.uses_opening_book],
+            ["minimax"],
+        )
+
+    def test_random_strategy_picks_candidate(self: "TestStrategies") -> None:
+        """Test that the random strategy guesses a possible code."""
+        strategy = RandomConsistentStrategy(self.scorer, seed=1)
+        self.assertFalse(strategy.deterministic)
+        for _ in range(20):
+            self.assertIn(strategy.choose(self.candidates), self.candidates)
+
+    def test_benchmark_strategy(self: "TestStrategies") -> None:
+        """Test that the benchmark reports guesses and move times."""
+        result = benchmark_strategy("minimax", 3, 3, games=5)
+        self.assertEqual(result["games"], 5)
+        self.assertLessEqual(result["mean_guesses"], result["max_guesses"])
+        self.assertLessEqual(result["mean_move_time"], result["max_move_time"])
+
+
+if __name__ == "__main__":
+    unittest.main()
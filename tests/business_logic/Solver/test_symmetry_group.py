@@ -0,0 +1,97 @@
+"""Test module for SymmetryGroup."""
+
+import random
+import unittest
+
+import numpy as np
+
+from src.business_logic.solver.code_space import CodeSpace
+from src.business_logic.solver.feedback_scorer import FeedbackScorer
+from src.business_logic.solver.symmetry_group import SymmetryGroup
+
+
+class TestSymmetryGroup(unittest.TestCase):
+    """Test cases for SymmetryGroup class."""
+
+    def setUp(self: "TestSymmetryGroup") -> None:
+        """Set up test fixtures before each test method."""
+        self.code_space = CodeSpace(4, 6)
+        self.scorer = FeedbackScorer(self.code_space)
+        self.codes = np.arange(self.code_space.size, dtype=np.uint32)
+        # Digits 0, 0, 1, 1
+        self.guess = 7
+        self.group = SymmetryGroup(self.code_space)
+        self.group.add_guess(self.guess)
+
+    def _apply(self: "TestSymmetryGroup", code: int, rng: random.Random) -> int:
+        """Apply a random permutation of the group to a code."""
+        digits = self.code_space.to_digits(code).tolist()
+        shuffled = self.group.free_colors[:]
+        rng.shuffle(shuffled)
+        colors = dict(zip(self.group.free_colors, shuffled))
+        digits = [colors.get(digit, digit) for digit in digits]
+        for positions in self.group.position_classes:
+            values = [digits[position] for position in positions]
+            rng.shuffle(values)
+            for position, value in zip(positions, values):
+                digits[position] = value
+        index = 0
+        for digit in digits:
+            index = index * self.code_space.colors + digit
+        return index
+
+    def test_add_guess_restricts_group(self: "TestSymmetryGroup") -> None:
+        """Test that a guess fixes its colors and splits the positions."""
+        self.assertEqual(self.group.free_colors, [2, 3, 4, 5])
+        self.assertEqual(self.group.position_classes, [[0, 1], [2, 3]])
+        # Digits 0, 0, 1, 2
+        self.group.add_guess(8)
+        self.assertEqual(self.group.free_colors, [3, 4, 5])
+        self.assertEqual(self.group.position_classes, [[0, 1], [2], [3]])
+
+    def test_is_trivial(self: "TestSymmetryGroup") -> None:
+        """Test that only a group without permutations is trivial."""
+        self.assertFalse(self.group.is_trivial())
+        self.group.add_guess(int(self.code_space.size - 1))
+        self.group.add_guess(2 * 216 + 3 * 36 + 4 * 6 + 5)
+        self.assertTrue(self.group.is_trivial())
+
+    def test_canonical_is_invariant(self: "TestSymmetryGroup") -> None:
+        """Test that equivalent codes share their canonical code."""
+        rng = random.Random(0)
+        canonical = self.group.canonical(self.codes)
+        for code in rng.sample(range(self.code_space.size), 200):
+            self.assertEqual(canonical[code], canonical[self._apply(code, rng)])
+
+    def test_equivalent_guesses_split_alike(self: "TestSymmetryGroup") -> None:
+        """Test that guesses with one canonical code have equal partitions."""
+        scores = self.scorer.score_many(self.guess, self.codes)
+        candidates = self.codes[scores == scores[500]]
+        canonical = self.group.canonical(candidates)
+        partitions = {}
+        for code, key in zip(candidates.tolist(), canonical.tolist()):
+            counts = np.bincount(self.scorer.score_many(code, candidates))
+            partition = tuple(sorted(counts[counts > 0]))
+            self.assertEqual(partitions.setdefault(key, partition), partition)
+
+    def test_representatives(self: "TestSymmetryGroup") -> None:
+        """Test that the first guess of every class is kept in order."""
+        guesses = self.codes[::-1]
+        representatives = self.group.representatives(guesses)
+        canonical = self.group.canonical(representatives)
+        self.assertEqual(len(set(canonical.tolist())), len(representatives))
+        self.assertEqual(
+            len(representatives), len(set(self.group.canonical(guesses).tolist()))
+        )
+        self.assertTrue(np.all(np.diff(representatives.astype(np.int64)) < 0))
+        self.assertLess(len(representatives), len(guesses) // 10)
+
+    def test_trivial_group_keeps_guesses(self: "TestSymmetryGroup") -> None:
+        """Test that the identity alone keeps every guess."""
+        group = SymmetryGroup(CodeSpace(1, 1))
+        guesses = np.array([0], dtype=np.uint32)
+        self.assertIs(group.representatives(guesses), guesses)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import Mock, patch
 
 from src.business_logic.business_logic import BusinessLogic
+from src.business_logic.game_state import GameState
 from src.business_logic.guesser.computer_guesser import ComputerGuesser
 from src.business_logic.guesser.player_guesser import PlayerGuesser
 from src.persistence.i_persistence_manager import IPersistenceManager
@@ -34,6 +35,37 @@ class TestBusinessLogic(unittest.TestCase):
         self.assertEqual(len(self.game_logic.game_state.secret_code),
                          self.game_logic.positions)
 
+    def test_guesser_game_is_journaled(self: "TestBusinessLogic") -> None:
+        """Test that an offline guesser game is journaled until reset."""
+        persistence_manager = self.game_logic.persistence_manager
+        self.game_logic.startgame("guesser")
+        persistence_manager.start_journal.assert_called_once_with(
+            self.game_logic.game_state
+        )
+        self.game_logic.reset_game_state()
+        persistence_manager.end_journal.assert_called_once_with()
+
+    def test_finished_game_is_archived(self: "TestBusinessLogic") -> None:
+        """Test that a finished game is archived with its move times."""
+        persistence_manager = self.game_logic.persistence_manager
+        self.game_logic.startgame("guesser")
+        secret_code = self.game_logic.game_state.secret_code
+        self.assertEqual(self.game_logic.make_guess(secret_code), "game_won")
+        game_state = self.game_logic.game_state
+        self.game_logic.reset_game_state()
+
+        persistence_manager.archive_game.assert_called_once()
+        args = persistence_manager.archive_game.call_args[0]
+        self.assertEqual(args[:3], (game_state, "guesser", True))
+        self.assertEqual(len(args[3]), 1)
+        self.assertIsNone(self.game_logic.game_result)
+
+    def test_unfinished_game_is_not_archived(self: "TestBusinessLogic") -> None:
+        """Test that a game left before its end is not archived."""
+        self.game_logic.startgame("guesser")
+        self.game_logic.reset_game_state()
+        self.game_logic.persistence_manager.archive_game.assert_not_called()
+
     def test_startgame_as_coder(self: "TestBusinessLogic") -> None:
         """Test game initialization when player is coder."""
         # Start game as coder
@@ -48,6 +80,45 @@ class TestBusinessLogic(unittest.TestCase):
         self.assertIsNotNone(self.game_logic.game_state)
         self.assertIsNotNone(self.game_logic.computer_guesser)
 
+    def test_configure_solver(self: "TestBusinessLogic") -> None:
+        """Test that the worker setting reaches the computer guesser."""
+        self.game_logic.configure_solver(3)
+        self.game_logic.startgame("coder")
+        self.assertEqual(
+            self.game_logic.computer_guesser.strategy.search.workers, 3
+        )
+
+        self.game_logic.configure_solver(0)
+        self.assertEqual(self.game_logic.solver_workers, 1)
+
+    def test_startgame_with_strategy(self: "TestBusinessLogic") -> None:
+        """Test that the strategy is selectable per game."""
+        self.game_logic.configure_solver(1, "entropy")
+        self.game_logic.startgame("coder")
+        self.assertEqual(self.game_logic.computer_guesser.strategy.name, "entropy")
+
+        self.game_logic.startgame("coder", "random")
+        self.assertEqual(self.game_logic.computer_guesser.strategy.name, "random")
+
+        self.assertEqual(
+            self.game_logic.startgame("coder", "unknown"), "invalid_strategy"
+        )
+        with self.assertRaises(ValueError):
+            self.game_logic.configure_solver(1, "unknown")
+
+    def test_startgame_with_time_limit(self: "TestBusinessLogic") -> None:
+        """Test that the time limit is selectable per game."""
+        self.assertEqual(self.game_logic.get_solver_statistics(), {})
+        self.game_logic.solver_time_limit = 2.0
+        self.game_logic.startgame("coder")
+        self.assertEqual(self.game_logic.computer_guesser.time_limit, 2.0)
+
+        self.game_logic.startgame("coder", time_limit=0.5)
+        self.assertEqual(self.game_logic.computer_guesser.time_limit, 0.5)
+        self.assertEqual(
+            self.game_logic.get_solver_statistics()["guesses"], 0
+        )
+
     def test_make_guess_valid(self: "TestBusinessLogic") -> None:
         """Test making a valid guess."""
         self.game_logic.startgame("guesser")
@@ -166,8 +237,8 @@ class TestBusinessLogic(unittest.TestCase):
         self.assertEqual(result, "need_feedback_input")
 
         # Test ValueError case
-        self.game_logic.game_state.get_turns = Mock(side_effect=ValueError)
-        result = self.game_logic.set_feedback([FeedbackColorCode.BLACK])
+        with patch.object(GameState, "get_turns", side_effect=ValueError):
+            result = self.game_logic.set_feedback([FeedbackColorCode.BLACK])
         self.assertEqual(result, "need_feedback_input")
 
     def test_set_secret_code_exception(self: "TestBusinessLogic") -> None:
@@ -215,6 +286,7 @@ class TestBusinessLogic(unittest.TestCase):
         mock_game_state.secret_code = [ColorCode(1)] * 4
         mock_game_state.get_turns.return_value = []  # Leere Liste für iterierbare Turns
 
+        self.game_logic.persistence_manager.list_saved_games.return_value = []
         self.game_logic.persistence_manager.load_game_state.return_value = (
             mock_game_state)
         result = self.game_logic.load_game_state()
@@ -225,6 +297,47 @@ class TestBusinessLogic(unittest.TestCase):
         result = self.game_logic.load_game_state()
         self.assertEqual(result, "error")
 
+    def test_load_game_state_keeps_stored_feedback(
+        self: "TestBusinessLogic"
+    ) -> None:
+        """Test that loading trusts the saved feedback instead of replaying it."""
+        game_state = GameState([ColorCode(1)] * 4, 10, 4, 6, "TestPlayer",
+                               PlayerGuesser())
+        stored = [FeedbackColorCode.WHITE]
+        game_state.add_turn(GameTurn([ColorCode(2)] * 4, stored))
+        self.game_logic.persistence_manager.load_game_state.return_value = (
+            game_state)
+
+        with patch("src.business_logic.business_logic.ComputerCoder"
+                   ".give_feedback") as give_feedback:
+            self.assertEqual(
+                self.game_logic.load_game_state("TestPlayer_1.sav"), "game_loaded"
+            )
+        give_feedback.assert_not_called()
+        self.assertEqual(game_state.turns[0].feedback, stored)
+        self.assertEqual(self.game_logic.player_guesser.make_guess(),
+                         [ColorCode(2)] * 4)
+
+    def test_save_game_state_slot(self: "TestBusinessLogic") -> None:
+        """Test that a game keeps its save slot across saves."""
+        persistence = self.game_logic.persistence_manager
+        persistence.new_save_slot.return_value = "TestPlayer_1.sav"
+        self.game_logic.configure_game("TestPlayer", 4, 6, 10)
+        self.game_logic.startgame("guesser")
+
+        self.assertIsNone(self.game_logic.get_save_slot())
+        self.game_logic.save_game_state()
+        self.game_logic.save_game_state()
+        self.assertEqual(self.game_logic.get_save_slot(), "TestPlayer_1.sav")
+        persistence.new_save_slot.assert_called_once_with("TestPlayer")
+        persistence.save_game_state.assert_called_with(
+            self.game_logic.game_state, "TestPlayer_1.sav"
+        )
+
+        # A new game gets a new slot
+        self.game_logic.startgame("guesser")
+        self.assertIsNone(self.game_logic.get_save_slot())
+
     def test_has_saved_game(self: "TestBusinessLogic") -> None:
         """Test checking for saved game existence."""
         # Test when no save exists
@@ -1,9 +1,12 @@
 """Test module for GameState class."""
 
+import pickle
 import unittest
+from unittest.mock import Mock, call
 from src.business_logic.game_state import GameState
 from src.business_logic.game_turn import GameTurn
 from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
 from src.business_logic.guesser.player_guesser import PlayerGuesser
 from src.business_logic.guesser.computer_guesser import ComputerGuesser
 
@@ -118,6 +121,80 @@ class TestGameState(unittest.TestCase):
         )
         self.assertEqual(repr(self.game_state), expected)
 
+    def test_secret_code_packed(self: "TestGameState") -> None:
+        """Test that the secret code is stored as one value byte per position."""
+        self.assertEqual(self.game_state._secret_code, bytes([1, 4, 2, 3]))
+        self.assertFalse(hasattr(self.game_state, "__dict__"))
+
+    def test_secret_code_none(self: "TestGameState") -> None:
+        """Test a game whose secret code is unknown."""
+        self.game_state.secret_code = None
+        self.assertIsNone(self.game_state.get_secret_code())
+
+    def test_pickle(self: "TestGameState") -> None:
+        """Test that a pickled state is restored."""
+        self.game_state.add_turn(GameTurn(self.secret_code, []))
+        restored = pickle.loads(pickle.dumps(self.game_state))
+        self.assertEqual(restored.secret_code, self.secret_code)
+        self.assertEqual(restored.turns, self.game_state.turns)
+        self.assertEqual(restored.player_name, self.player_name)
+
+    def test_setstate_legacy(self: "TestGameState") -> None:
+        """Test restoring a state pickled with its attribute dictionary."""
+        state = GameState.__new__(GameState)
+        state.__setstate__({
+            "secret_code": self.secret_code,
+            "turns": [],
+            "max_rounds": self.max_rounds,
+            "current_guesser": None,
+            "positions": self.positions,
+            "colors": self.colors,
+            "player_name": self.player_name,
+        })
+        self.assertEqual(state.secret_code, self.secret_code)
+        self.assertEqual(state.max_rounds, self.max_rounds)
+
+    def test_pickle_restores_computer_guesser(self: "TestGameState") -> None:
+        """Test that a computer guesser is saved as descriptor and replayed."""
+        guesser = ComputerGuesser(self.positions, self.colors, strategy="entropy")
+        self.game_state.current_guesser = guesser
+        guess = guesser.make_guess()
+        feedback = [FeedbackColorCode.BLACK, FeedbackColorCode.WHITE]
+        guesser.process_feedback(feedback)
+        self.game_state.add_turn(GameTurn(guess, feedback))
+
+        data = pickle.dumps(self.game_state)
+        self.assertNotIn(b"possible_codes", data)
+        restored = pickle.loads(data).current_guesser
+        self.assertIsInstance(restored, ComputerGuesser)
+        self.assertEqual(restored.strategy.name, "entropy")
+        self.assertEqual(restored.history, guesser.history)
+        self.assertEqual(list(restored.possible_codes), list(guesser.possible_codes))
+
+    def test_pickle_restores_player_guesser(self: "TestGameState") -> None:
+        """Test that a player guesser is saved as descriptor."""
+        restored = pickle.loads(pickle.dumps(self.game_state))
+        self.assertIsInstance(restored.current_guesser, PlayerGuesser)
+
+    def test_journal_records_turns(self: "TestGameState") -> None:
+        """Test that added turns and their feedback reach the journal."""
+        journal = Mock()
+        self.game_state.journal = journal
+        turn = GameTurn(self.secret_code, [])
+        self.game_state.add_turn(turn)
+        feedback = [FeedbackColorCode.BLACK] * self.positions
+        self.game_state.set_feedback(feedback)
+
+        self.assertEqual(turn.feedback, feedback)
+        journal.record_turn.assert_has_calls([call(0, turn), call(0, turn)])
+        restored = pickle.loads(pickle.dumps(self.game_state))
+        self.assertIsNone(restored.journal)
+
+    def test_set_feedback_without_turn(self: "TestGameState") -> None:
+        """Test that feedback needs a turn."""
+        with self.assertRaises(IndexError):
+            self.game_state.set_feedback([FeedbackColorCode.BLACK])
+
 
 if __name__ == "__main__":
     unittest.main()
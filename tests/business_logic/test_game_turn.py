@@ -1,4 +1,5 @@
 """Tests/business_logic/test_game_turn.py."""
+import pickle
 import unittest
 from src.business_logic.game_turn import GameTurn
 from src.util.color_code import ColorCode
@@ -29,6 +30,49 @@ class test_game_turn(unittest.TestCase):
         expected_repr = f"GameTurn(guesses={self.guesses}, feedback={self.feedback})"
         self.assertEqual(repr(self.game_turn), expected_repr)
 
+    def test_packed(self: "test_game_turn") -> None:
+        """Test that the turn is stored as one value byte per pin."""
+        self.assertEqual(self.game_turn.packed_guesses, bytes([1, 4, 2, 3]))
+        self.assertEqual(self.game_turn.packed_feedback, bytes([8, 7]))
+        self.assertFalse(hasattr(self.game_turn, "__dict__"))
+
+    def test_set_feedback(self: "test_game_turn") -> None:
+        """Test replacing the feedback of the turn."""
+        self.game_turn.feedback = [FeedbackColorCode.BLACK]
+        self.assertEqual(self.game_turn.feedback, [FeedbackColorCode.BLACK])
+
+    def test_feedback_pending(self: "test_game_turn") -> None:
+        """Test that pending feedback differs from feedback without pins."""
+        turn = GameTurn(self.guesses, None)
+        self.assertTrue(turn.feedback_pending)
+        self.assertEqual(turn.feedback, [])
+        self.assertEqual(turn.packed_feedback, b"")
+        self.assertNotEqual(turn, GameTurn(self.guesses, []))
+        self.assertEqual(pickle.loads(pickle.dumps(turn)), turn)
+        turn.feedback = []
+        self.assertFalse(turn.feedback_pending)
+
+    def test_invalid_guesses(self: "test_game_turn") -> None:
+        """Test that guesses which are no colors are rejected."""
+        with self.assertRaises(ValueError):
+            GameTurn(guesses=[[1], [2]], feedback=[])
+
+    def test_equality(self: "test_game_turn") -> None:
+        """Test that turns with equal pins are equal."""
+        self.assertEqual(self.game_turn, GameTurn(self.guesses, self.feedback))
+        self.assertNotEqual(self.game_turn, GameTurn(self.guesses, []))
+
+    def test_pickle(self: "test_game_turn") -> None:
+        """Test that a pickled turn is restored."""
+        restored = pickle.loads(pickle.dumps(self.game_turn))
+        self.assertEqual(restored, self.game_turn)
+
+    def test_setstate_legacy(self: "test_game_turn") -> None:
+        """Test restoring a turn pickled with lists of colors."""
+        turn = GameTurn.__new__(GameTurn)
+        turn.__setstate__({"guesses": self.guesses, "feedback": self.feedback})
+        self.assertEqual(turn, self.game_turn)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+"""Test module for the computer versus computer simulation."""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from src.business_logic.coder.computer_coder import ComputerCoder
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.simulation import (
+    LATENCY_BUCKETS,
+    SimulationReport,
+    main,
+    play_game,
+    simulate,
+)
+
+
+class TestSimulation(unittest.TestCase):
+    """Test cases for the simulation module."""
+
+    def test_play_game_solves_code(self: "TestSimulation") -> None:
+        """Test that a game ends once the secret code is guessed."""
+        guesser = ComputerGuesser(4, 6)
+        coder = ComputerCoder(4, 6)
+        coder.secret_code = guesser.code_space.decode(1000)
+        guesses, solved, move_times = play_game(guesser, coder)
+
+        self.assertTrue(solved)
+        self.assertEqual(guesses, len(move_times))
+        self.assertEqual(guesser.last_guess, coder.secret_code)
+
+    def test_play_game_guess_limit(self: "TestSimulation") -> None:
+        """Test that a game is lost after the maximum number of guesses."""
+        guesser = ComputerGuesser(4, 6)
+        coder = ComputerCoder(4, 6)
+        coder.secret_code = guesser.code_space.decode(1000)
+        self.assertEqual(play_game(guesser, coder, max_guesses=1)[:2], (1, False))
+
+    def test_simulate_every_code(self: "TestSimulation") -> None:
+        """Test that every secret code is played and solved."""
+        report = simulate(3, 3)
+        self.assertEqual(report.games, 27)
+        self.assertEqual(sum(report.guess_counts.values()), 27)
+        self.assertEqual(report.failures, 0)
+        self.assertEqual(sum(report.latency_counts), report.total_moves)
+        self.assertEqual(report.total_moves,
+                         sum(g * n for g, n in report.guess_counts.items()))
+
+    def test_simulate_sample_in_processes(self: "TestSimulation") -> None:
+        """Test that a process pool plays the sample like a single process."""
+        sequential = simulate(4, 6, sample=20, seed=1)
+        parallel = simulate(4, 6, sample=20, seed=1, processes=2)
+        self.assertEqual(parallel.games, 20)
+        self.assertEqual(parallel.guess_counts, sequential.guess_counts)
+
+    def test_simulate_every_code_in_processes(self: "TestSimulation") -> None:
+        """Test that chunks of the code space are played in processes."""
+        sequential = simulate(3, 3)
+        parallel = simulate(3, 3, processes=2)
+        self.assertEqual(parallel.games, 27)
+        self.assertEqual(parallel.guess_counts, sequential.guess_counts)
+
+    def test_simulate_unknown_strategy(self: "TestSimulation") -> None:
+        """Test that an unknown strategy is rejected."""
+        with self.assertRaises(ValueError):
+            simulate(3, 3, strategy="unknown")
+
+    def test_report_statistics(self: "TestSimulation") -> None:
+        """Test the derived statistics and the latency buckets."""
+        report = SimulationReport(4, 6, "minimax")
+        report.add_game((2, True, [0.0005, 0.003]))
+        report.add_game((4, True, [0.001, 0.001, 0.001, 10.0]))
+        report.add_game((12, False, [0.001] * 12))
+
+        self.assertEqual(report.mean_guesses, 3.0)
+        self.assertEqual(report.max_guesses, 4)
+        self.assertEqual(report.failures, 1)
+        self.assertEqual(report.max_move_time, 10.0)
+        self.assertEqual(report.latency_counts[0], 16)
+        self.assertEqual(report.latency_counts[LATENCY_BUCKETS.index(5)], 1)
+        self.assertEqual(report.latency_counts[-1], 1)
+
+    def test_main_prints_report(self: "TestSimulation") -> None:
+        """Test that the command line prints the guess distribution."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["3", "3", "--sample", "5", "--strategy", "random"])
+        self.assertIn("strategy random: 5 games", output.getvalue())
+        self.assertIn("guesses", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from io import StringIO
 import sys
 
 from src.cli.menu_renderer.menu_renderer import MenuRenderer
+from src.business_logic.save_info import SaveInfo
 from src.util.color_code import ColorCode
 
 
@@ -101,6 +102,17 @@ class TestMenuRenderer(unittest.TestCase):
         output = self.held_output.getvalue().strip()
         self.assertIn("loads resumed game", output)
 
+    def test_display_saved_games(self: "TestMenuRenderer") -> None:
+        """Test the display_saved_games method."""
+        self.renderer.display_saved_games([
+            SaveInfo("a.sav", "Anna", 4, 6, 10, 3, 0.0),
+            SaveInfo("b.sav", "Ben", 5, 8, 12, 0, 0.0),
+        ])
+        output = self.held_output.getvalue()
+        self.assertIn("Saved games:", output)
+        self.assertIn("1. Anna (4/6) Round 3/10", output)
+        self.assertIn("2. Ben (5/8) Round 0/12", output)
+
     def test_display_start_game(self: "TestMenuRenderer") -> None:
         """Test the display_start_game method."""
         self.renderer.display_start_game()
@@ -461,6 +461,28 @@ class TestConsole(unittest.TestCase):
 
         self.assertEqual(config["colors"], [])
 
+    @patch("src.cli.menu_renderer.menu_renderer.MenuRenderer.display_saved_games")
+    @patch("src.cli.input_handler.input_handler.InputHandler.handle_menu_input")
+    def test_choose_saved_game(self: "TestConsole", mock_input: MagicMock,
+                               mock_display: MagicMock) -> None:
+        """Test that the user chooses among several saved games."""
+        saves = [MagicMock(), MagicMock()]
+        self.mock_logic.get_saved_games.return_value = saves
+        self.mock_logic.load_game.return_value = "need_guess_input"
+        mock_input.return_value = "2"
+
+        self.assertEqual(self.console.choose_saved_game(), "need_guess_input")
+        mock_display.assert_called_once_with(saves)
+        self.mock_logic.load_game.assert_called_once_with("2")
+
+    def test_choose_saved_game_single(self: "TestConsole") -> None:
+        """Test that a single saved game is loaded without asking."""
+        self.mock_logic.get_saved_games.return_value = [MagicMock()]
+        self.mock_logic.load_game.return_value = "need_guess_input"
+
+        self.assertEqual(self.console.choose_saved_game(), "need_guess_input")
+        self.mock_logic.load_game.assert_called_once_with()
+
     @patch("src.cli.game_renderer.game_renderer.GameRenderer.clear_screen")
     @patch("src.cli.menu_renderer.menu_renderer.MenuRenderer.display_main_menu")
     @patch("src.cli.input_handler.input_handler.InputHandler.handle_menu_input")
@@ -0,0 +1,3 @@
+"""Shared pytest configuration of the test suite."""
+
+pytest_plugins = ["tests.benchmarks.harness"]
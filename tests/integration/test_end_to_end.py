@@ -1,9 +1,9 @@
 """End-to-end tests for the mastermind game."""
+import tempfile
 import unittest
-import os
 from unittest.mock import Mock
 
-from src.persistence.persistence_manager import PersistenceManager
+from src.persistence.persistence_manager import PersistenceManager # noqa
 from src.business_logic.business_logic import BusinessLogic
 from src.application_logic.application_logic import ApplicationLogic
 from src.cli.console import Console
@@ -12,10 +12,25 @@ from src.cli.console import Console
 class TestEndToEnd(unittest.TestCase):
     """End-to-end test suite."""
 
+    def setUp(self: "TestEndToEnd") -> None:
+        """Create a temporary save directory, removed after the test."""
+        self.save_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.save_dir.cleanup)
+
+    def _persistence_manager(self: "TestEndToEnd") -> PersistenceManager:
+        """Create a persistence manager that is closed before cleanup.
+
+        Returns:
+            PersistenceManager: Manager saving into the temporary directory
+        """
+        persistence_manager = PersistenceManager(self.save_dir.name)
+        self.addCleanup(persistence_manager.close)
+        return persistence_manager
+
     def test_complete_game_flow_as_guesser(self: "TestEndToEnd") -> None:
         """Test complete game flow from start to finish as guesser."""
         # Setup real components
-        persistence_manager = PersistenceManager()
+        persistence_manager = self._persistence_manager()
         business_logic = BusinessLogic(persistence_manager)
         app_logic = ApplicationLogic(business_logic)
         console = Console(app_logic)
@@ -40,14 +55,10 @@ class TestEndToEnd(unittest.TestCase):
         # Run game flow
         console.handle_game_mode_choice()  # This starts the game loop internally
 
-        # Cleanup
-        if os.path.exists(os.path.join(persistence_manager.save_dir, "game_state.pkl")):
-            os.remove(os.path.join(persistence_manager.save_dir, "game_state.pkl"))
-
     def test_complete_game_flow_as_coder(self: "TestEndToEnd") -> None:
         """Test complete game flow from start to finish as coder."""
         # Setup real components
-        persistence_manager = PersistenceManager()
+        persistence_manager = self._persistence_manager()
         business_logic = BusinessLogic(persistence_manager)
         app_logic = ApplicationLogic(business_logic)
         console = Console(app_logic)
@@ -67,13 +78,9 @@ class TestEndToEnd(unittest.TestCase):
         # Run game flow
         console.handle_game_mode_choice()  # This starts the game loop internally
 
-        # Cleanup
-        if os.path.exists(os.path.join(persistence_manager.save_dir, "game_state.pkl")):
-            os.remove(os.path.join(persistence_manager.save_dir, "game_state.pkl"))
-
     def test_complete_game_flow_with_win(self: "TestEndToEnd") -> None:
         """Test complete game flow ending with player win."""
-        persistence_manager = PersistenceManager()
+        persistence_manager = self._persistence_manager()
         business_logic = BusinessLogic(persistence_manager)
         app_logic = ApplicationLogic(business_logic)
         console = Console(app_logic)
@@ -94,7 +101,7 @@ class TestEndToEnd(unittest.TestCase):
 
     def test_complete_game_flow_with_save_and_load(self: "TestEndToEnd") -> None:
         """Test game flow with save/load functionality."""
-        persistence_manager = PersistenceManager()
+        persistence_manager = self._persistence_manager()
         business_logic = BusinessLogic(persistence_manager)
         app_logic = ApplicationLogic(business_logic)
         console = Console(app_logic)
@@ -120,6 +127,3 @@ class TestEndToEnd(unittest.TestCase):
         ]
 
         console.handle_game_mode_choice()
-
-        if os.path.exists(os.path.join(persistence_manager.save_dir, "game_state.pkl")):
-            os.remove(os.path.join(persistence_manager.save_dir, "game_state.pkl"))
@@ -1,5 +1,5 @@
 """Integration tests for the mastermind game."""
-import os
+import tempfile
 import unittest
 from unittest.mock import Mock
 
@@ -42,7 +42,11 @@ class TestIntegration(unittest.TestCase):
 
     def test_persistence_business_integration(self: "TestIntegration") -> None:
         """Test PersistenceManager and BusinessLogic integration."""
-        persistence_manager = PersistenceManager()  # Real persistence manager
+        save_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(save_dir.cleanup)
+        # Real persistence manager
+        persistence_manager = PersistenceManager(save_dir.name)
+        self.addCleanup(persistence_manager.close)
         business_logic = BusinessLogic(persistence_manager)
 
         # Setup initial game
@@ -74,10 +78,6 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(len(loaded_state.get_turns()), len(initial_state.get_turns()))
         self.assertEqual(loaded_state.get_turns()[0].guesses, guess)
 
-        # Cleanup
-        if os.path.exists(os.path.join(persistence_manager.save_dir, "game_state.pkl")):
-            os.remove(os.path.join(persistence_manager.save_dir, "game_state.pkl"))
-
     def test_cli_application_integration(self: "TestIntegration") -> None:
         """Test basic CLI and ApplicationLogic integration."""
         # Setup
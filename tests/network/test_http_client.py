@@ -21,6 +21,25 @@ class TestHttpClient(unittest.TestCase):
         self.assertEqual(self.client.base_url, self.base_url)
         self.assertIsNotNone(self.client.session)
 
+    def test_connection_pool(self: "TestHttpClient") -> None:
+        """Test that the session keeps pool_size connections alive."""
+        adapter = self.client.session.get_adapter(self.base_url)
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertEqual(self.client.session.headers["Connection"], "keep-alive")
+
+        client = HttpClient(self.base_url, pool_size=1, keep_alive=False)
+        self.assertEqual(client.session.get_adapter(self.base_url)._pool_maxsize, 1)
+        self.assertEqual(client.session.headers["Connection"], "close")
+        client.close()
+
+    @patch("requests.Session.post")
+    def test_post_updates_last_used(self: "TestHttpClient",
+                                    mock_post: MagicMock) -> None:
+        """Test that a request marks the client as used."""
+        self.client.last_used = 0.0
+        self.client.post(self.test_url, self.test_data)
+        self.assertGreater(self.client.last_used, 0.0)
+
     @patch("requests.Session.post")
     def test_post_success(self: "TestHttpClient", mock_post: MagicMock) -> None:
         """Test successful POST request."""
@@ -0,0 +1,60 @@
+"""Test module for HttpClientPool."""
+
+import unittest
+from unittest.mock import patch
+
+from src.network.http_client_pool import HttpClientPool
+
+
+class TestHttpClientPool(unittest.TestCase):
+    """Test cases for HttpClientPool class."""
+
+    def setUp(self: "TestHttpClientPool") -> None:
+        """Create a pool with a short idle timeout."""
+        self.pool = HttpClientPool(pool_size=2, keep_alive=False, idle_timeout=30)
+
+    def tearDown(self: "TestHttpClientPool") -> None:
+        """Close the pooled clients."""
+        self.pool.close()
+
+    def test_client_per_base_url(self: "TestHttpClientPool") -> None:
+        """Test that each server gets one client, reused on every get."""
+        client = self.pool.get("http://a:1")
+        self.assertIs(self.pool.get("http://a:1"), client)
+        self.assertIsNot(self.pool.get("http://b:1"), client)
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(client.session.headers["Connection"], "close")
+        self.assertEqual(client.session.get_adapter("http://a:1")._pool_maxsize, 2)
+
+    def test_idle_clients_are_evicted(self: "TestHttpClientPool") -> None:
+        """Test that a client unused for idle_timeout seconds is replaced."""
+        client = self.pool.get("http://a:1")
+        client.last_used -= 31
+        with patch.object(client, "close") as close:
+            replacement = self.pool.get("http://a:1")
+        close.assert_called_once_with()
+        self.assertIsNot(replacement, client)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_no_idle_timeout(self: "TestHttpClientPool") -> None:
+        """Test that clients are kept without an idle timeout."""
+        self.pool.idle_timeout = None
+        client = self.pool.get("http://a:1")
+        client.last_used -= 3600
+        self.assertIs(self.pool.get("http://a:1"), client)
+
+    def test_close(self: "TestHttpClientPool") -> None:
+        """Test that closing the pool closes and drops its clients."""
+        client = self.pool.get("http://a:1")
+        with patch.object(client, "close") as close:
+            self.pool.close()
+        close.assert_called_once_with()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_default_pool_is_shared(self: "TestHttpClientPool") -> None:
+        """Test that the default pool is created once per process."""
+        self.assertIs(HttpClientPool.default(), HttpClientPool.default())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,10 @@
 import unittest
 from unittest.mock import patch
 import requests
+from src.network.http_client import HttpClient # noqa
+from src.network.http_client_pool import HttpClientPool
 from src.network.http_handler import HttpHandler
-from src.network.http_handler import JsonValidator, HttpClient
+from src.network.http_handler import JsonValidator
 
 
 class TestHTTPHandler(unittest.TestCase):
@@ -26,7 +28,23 @@ class TestHTTPHandler(unittest.TestCase):
         self.assertIsNotNone(self.handler.http_client)
         self.assertIsNotNone(self.handler.validate)
 
-    @patch("src.network.http_handler.HttpClient.post")
+    def test_handlers_share_client_and_validator(self: "TestHTTPHandler") -> None:
+        """Test that handlers for one server reuse its client and schema."""
+        other = HttpHandler("127.0.0.1", 8000)
+        self.assertIs(other.http_client, self.handler.http_client)
+        self.assertIs(other.validate, self.handler.validate)
+        self.assertIsNot(HttpHandler("127.0.0.1", 8001).http_client,
+                         self.handler.http_client)
+
+    def test_client_pool(self: "TestHTTPHandler") -> None:
+        """Test that a handler takes its client from the given pool."""
+        pool = HttpClientPool(pool_size=2)
+        handler = HttpHandler("127.0.0.1", 8000, pool)
+        self.assertIs(handler.http_client, pool.get("http://127.0.0.1:8000"))
+        self.assertIsNot(handler.http_client, self.handler.http_client)
+        pool.close()
+
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_send_json_via_post_success(self: "TestHTTPHandler",
                                         mock_validator: JsonValidator,
@@ -40,7 +58,7 @@ class TestHTTPHandler(unittest.TestCase):
         self.assertEqual(response, self.valid_json)
         mock_post.assert_called_once_with("", self.valid_json)
 
-    @patch("src.network.http_handler.HttpClient.post")
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_send_json_via_post_invalid_json(self: "TestHTTPHandler",
                                              mock_validator: JsonValidator,
@@ -53,7 +71,7 @@ class TestHTTPHandler(unittest.TestCase):
 
         mock_post.assert_not_called()
 
-    @patch("src.network.http_handler.HttpClient.post")
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_send_json_via_post_http_error(self: "TestHTTPHandler",
                                            mock_validator: JsonValidator,
@@ -65,7 +83,7 @@ class TestHTTPHandler(unittest.TestCase):
         with self.assertRaises(requests.exceptions.HTTPError):
             self.handler.send_json_via_post(self.valid_json)
 
-    @patch("src.network.http_handler.HttpClient.post")
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_start_new_game_success(self: "TestHTTPHandler",
                                     mock_validator: JsonValidator,
@@ -93,7 +111,7 @@ class TestHTTPHandler(unittest.TestCase):
         }
         mock_post.assert_called_once_with("", expected_request)
 
-    @patch("src.network.http_handler.HttpClient.post")
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_start_new_game_error(self: "TestHTTPHandler",
                                   mock_validator: JsonValidator,
@@ -105,7 +123,7 @@ class TestHTTPHandler(unittest.TestCase):
         with self.assertRaises(requests.exceptions.HTTPError):
             self.handler.start_new_game("player1", 5, 8)
 
-    @patch("src.network.http_handler.HttpClient.post")
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_make_move_success(self: "TestHTTPHandler", mock_validator: JsonValidator,
                                mock_post: HttpClient) -> None:
@@ -118,7 +136,7 @@ class TestHTTPHandler(unittest.TestCase):
         self.assertEqual(response, "7788")
         self.assertTrue(mock_post.called)
 
-    @patch("src.network.http_handler.HttpClient.post")
+    @patch("src.network.http_client.HttpClient.post")
     @patch("src.network.http_handler.JsonValidator")
     def test_make_move_error(self: "TestHTTPHandler", mock_validator: JsonValidator,
                              mock_post: HttpClient) -> None:
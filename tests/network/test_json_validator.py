@@ -46,6 +46,15 @@ class TestJsonValidator(unittest.TestCase):
 
         os.remove(invalid_schema_path)
 
+    def test_for_schema_loads_once(self: "TestJsonValidator") -> None:
+        """Test that the shared validator of a schema reads the file once."""
+        with patch.object(JsonValidator, "_loaded", {}), \
+                patch.object(JsonValidator, "_load_schema",
+                             return_value={}) as load:
+            validator = JsonValidator.for_schema(self.schema_path)
+            self.assertIs(JsonValidator.for_schema(self.schema_path), validator)
+        load.assert_called_once_with(self.schema_path)
+
     def test_validate_valid_json(self: "TestJsonValidator") -> None:
         """Test validation with valid JSON data."""
         valid_json = {
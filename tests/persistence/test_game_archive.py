@@ -0,0 +1,139 @@
+"""Test module for the archive of finished games."""
+
+import os
+import tempfile
+import unittest
+
+from src.business_logic.game_state import GameState
+from src.business_logic.game_turn import GameTurn
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.persistence.game_archive import GameArchive, LeaderboardEntry
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+SOLVED = [FeedbackColorCode.BLACK] * 4
+
+
+class TestGameArchive(unittest.TestCase):
+    """Test cases for GameArchive."""
+
+    def setUp(self: "TestGameArchive") -> None:
+        """Create an archive in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive = GameArchive(os.path.join(self.temp_dir.name, "history.db"))
+
+    def tearDown(self: "TestGameArchive") -> None:
+        """Close the archive and remove the temporary directory."""
+        self.archive.close()
+        self.temp_dir.cleanup()
+
+    def _record(
+        self: "TestGameArchive",
+        player_name: str,
+        guesses: int,
+        solved: bool,
+        colors: int = 6,
+        computer: bool = False,
+    ) -> int:
+        """Archive a game of a guessing player.
+
+        Args:
+            player_name: Name of the player
+            guesses: Number of turns of the game
+            solved: True if the last guess matches the code
+            colors: Number of colors
+            computer: True if the computer guessed
+
+        Returns:
+            int: Number of the game in the archive
+        """
+        guesser = ComputerGuesser(4, colors) if computer else PlayerGuesser()
+        game_state = GameState([ColorCode.RED] * 4, 10, 4, colors, player_name,
+                               guesser)
+        for number in range(guesses):
+            last = number == guesses - 1
+            game_state.add_turn(GameTurn(
+                [ColorCode.RED if last and solved else ColorCode.BLUE] * 4,
+                SOLVED if last and solved else [],
+            ))
+        won = solved != computer
+        return self.archive.record_game(game_state, "guesser", won,
+                                        [1.0] * guesses)
+
+    def test_statistics_on_empty_archive(self: "TestGameArchive") -> None:
+        """Test that an empty archive has no statistics."""
+        self.assertIsNone(self.archive.win_rate())
+        self.assertIsNone(self.archive.average_guesses())
+        self.assertEqual(self.archive.leaderboard(4, 6), [])
+        self.assertEqual(self.archive.recent_games(), [])
+
+    def test_record_game(self: "TestGameArchive") -> None:
+        """Test that a game is archived with its moves."""
+        game_id = self._record("Alice", 3, True)
+        games = self.archive.recent_games("Alice")
+        self.assertEqual(len(games), 1)
+        game = games[0]
+        self.assertEqual(game.game_id, game_id)
+        self.assertEqual((game.guesser, game.guesses), ("player", 3))
+        self.assertTrue(game.solved)
+        self.assertTrue(game.won)
+        self.assertEqual(game.duration, 3.0)
+
+        moves = self.archive.connection.execute(
+            "SELECT turn, guess, feedback, seconds FROM moves WHERE game_id = ?",
+            (game_id,),
+        ).fetchall()
+        self.assertEqual(len(moves), 3)
+        self.assertEqual(moves[-1], (2, bytes([1] * 4), bytes([8] * 4), 1.0))
+
+    def test_win_rate_and_average_guesses(self: "TestGameArchive") -> None:
+        """Test the aggregates per player and configuration."""
+        self._record("Alice", 4, True)
+        self._record("Alice", 6, True)
+        self._record("Alice", 10, False)
+        self._record("Alice", 2, True, colors=8)
+        self._record("Bob", 5, False)
+
+        self.assertAlmostEqual(self.archive.win_rate("Alice"), 0.75)
+        self.assertAlmostEqual(self.archive.win_rate("Alice", 4, 6), 2 / 3)
+        self.assertAlmostEqual(self.archive.win_rate(), 0.6)
+        self.assertAlmostEqual(self.archive.average_guesses("Alice", 4, 6), 5.0)
+        self.assertAlmostEqual(self.archive.average_guesses("Alice"), 4.0)
+        self.assertIsNone(self.archive.average_guesses("Bob"))
+        self.assertIsNone(self.archive.win_rate("Carol"))
+
+    def test_computer_games(self: "TestGameArchive") -> None:
+        """Test that games guessed by the computer are counted apart."""
+        self._record("Alice", 5, True, computer=True)
+        self.assertIsNone(self.archive.average_guesses("Alice"))
+        self.assertEqual(
+            self.archive.average_guesses("Alice", guesser="computer"), 5.0
+        )
+        self.assertEqual(self.archive.win_rate("Alice"), 0.0)
+        self.assertEqual(self.archive.leaderboard(4, 6), [])
+
+    def test_leaderboard(self: "TestGameArchive") -> None:
+        """Test that players are ranked by wins, then by fewer guesses."""
+        self._record("Alice", 6, True)
+        self._record("Bob", 3, True)
+        self._record("Carol", 4, True)
+        self._record("Carol", 8, True)
+        self._record("Dave", 10, False)
+
+        board = self.archive.leaderboard(4, 6, limit=3)
+        self.assertEqual(board[0], LeaderboardEntry("Carol", 2, 2, 1.0, 6.0))
+        self.assertEqual([entry.player_name for entry in board],
+                         ["Carol", "Bob", "Alice"])
+        self.assertIsNone(self.archive.leaderboard(4, 6)[-1].average_guesses)
+
+    def test_archive_is_persistent(self: "TestGameArchive") -> None:
+        """Test that archived games survive reopening the archive."""
+        self._record("Alice", 4, True)
+        self.archive.close()
+        self.archive = GameArchive(self.archive.path)
+        self.assertEqual(self.archive.win_rate("Alice"), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+"""Test module for the journal of a game in progress."""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.business_logic.game_state import GameState
+from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.business_logic.game_turn import GameTurn
+from src.persistence import game_journal
+from src.persistence.game_journal import GameJournal
+from src.persistence.save_format import SaveFormatError
+from src.persistence.save_writer import SaveWriter
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+class TestGameJournal(unittest.TestCase):
+    """Test cases for GameJournal and replay."""
+
+    def setUp(self: "TestGameJournal") -> None:
+        """Create a game, a writer and a temporary directory for its journal."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "game.journal")
+        self.writer = SaveWriter()
+        self.game_state = GameState(
+            [ColorCode.RED] * 4, 12, 4, 6, "Test", PlayerGuesser()
+        )
+
+    def tearDown(self: "TestGameJournal") -> None:
+        """Close the journal and remove the temporary directory."""
+        if self.game_state.journal is not None:
+            self.game_state.journal.close()
+        self.temp_dir.cleanup()
+
+    def _replay(self: "TestGameJournal") -> tuple:
+        """Replay the journal file once it is written.
+
+        Returns:
+            tuple: The recovered game and its save slot
+        """
+        self.writer.flush()
+        with open(self.path, "rb") as file:
+            return game_journal.replay(file.read())
+
+    def _play(self: "TestGameJournal", count: int) -> None:
+        """Add complete turns to the game.
+
+        Args:
+            count: Number of turns
+        """
+        for _ in range(count):
+            self.game_state.add_turn(GameTurn([ColorCode.BLUE] * 4,
+                                              [FeedbackColorCode.WHITE]))
+
+    def test_turns_are_recovered(self: "TestGameJournal") -> None:
+        """Test that turns recorded after the snapshot are replayed."""
+        journal = GameJournal(self.path, self.game_state, compact_every=0,
+                              writer=self.writer)
+        self._play(2)
+        self.game_state.add_turn(GameTurn([ColorCode.GREEN] * 4, []))
+        self.game_state.set_feedback([FeedbackColorCode.BLACK])
+        self.assertEqual(journal.records, 4)
+
+        recovered, save_slot = self._replay()
+        self.assertIsNone(save_slot)
+        self.assertEqual(recovered.secret_code, self.game_state.secret_code)
+        self.assertEqual(recovered.turns, self.game_state.turns)
+        self.assertIsInstance(recovered.current_guesser, PlayerGuesser)
+
+    def test_feedback_pending_is_recovered(self: "TestGameJournal") -> None:
+        """Test that a turn awaiting feedback is recovered as pending."""
+        GameJournal(self.path, self.game_state, compact_every=0,
+                    writer=self.writer)
+        self.game_state.add_turn(GameTurn([ColorCode.GREEN] * 4, []))
+        self.game_state.add_turn(GameTurn([ColorCode.BLUE] * 4, None))
+        recovered, _ = self._replay()
+        self.assertEqual(recovered.turns, self.game_state.turns)
+        self.assertTrue(recovered.turns[-1].feedback_pending)
+
+    def test_torn_record_is_ignored(self: "TestGameJournal") -> None:
+        """Test that a record cut off by a crash is dropped."""
+        GameJournal(self.path, self.game_state, compact_every=0,
+                    writer=self.writer)
+        self._play(2)
+        self.writer.flush()
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+
+        recovered, _ = self._replay()
+        self.assertEqual(recovered.turns, self.game_state.turns[:1])
+
+    def test_compaction(self: "TestGameJournal") -> None:
+        """Test that the journal is replaced by a snapshot periodically."""
+        journal = GameJournal(self.path, self.game_state, compact_every=3,
+                              writer=self.writer)
+        self._play(2)
+        self.writer.flush()
+        size = os.path.getsize(self.path)
+        self._play(1)
+        self.assertEqual(journal.records, 0)
+
+        recovered, _ = self._replay()
+        self.assertEqual(len(recovered.turns), 3)
+        self._play(1)
+        self.writer.flush()
+        self.assertGreater(os.path.getsize(self.path), size)
+        self.assertEqual(len(self._replay()[0].turns), 4)
+
+    def test_compact_records_save_slot(self: "TestGameJournal") -> None:
+        """Test that a snapshot keeps the save slot of the game."""
+        journal = GameJournal(self.path, self.game_state, "Test_1.sav",
+                              writer=self.writer)
+        journal.compact("Test_2.sav")
+        self.assertEqual(self._replay()[1], "Test_2.sav")
+
+    def test_sync_batching(self: "TestGameJournal") -> None:
+        """Test that records are synced every sync_every records."""
+        journal = GameJournal(self.path, self.game_state, sync_every=2,
+                              compact_every=0, writer=self.writer)
+        self._play(1)
+        self.assertEqual(journal.unsynced, 1)
+        self._play(1)
+        self.assertEqual(journal.unsynced, 0)
+        self._play(1)
+        journal.sync()
+        self.assertEqual(journal.unsynced, 0)
+
+    def test_disk_is_written_by_the_writer(self: "TestGameJournal") -> None:
+        """Test that the journal is synced by the writer thread only."""
+        threads = []
+
+        def fsync(descriptor: int) -> None:
+            """Record the thread syncing a file.
+
+            Args:
+                descriptor: File descriptor of the file
+            """
+            threads.append(threading.current_thread())
+
+        with patch("src.persistence.save_writer.os.fsync", fsync):
+            GameJournal(self.path, self.game_state, compact_every=2,
+                        writer=self.writer)
+            self._play(3)
+            self.writer.flush()
+        self.assertTrue(threads)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(len(self._replay()[0].turns), 3)
+
+    def test_close_and_discard(self: "TestGameJournal") -> None:
+        """Test that closing detaches the journal and discarding deletes it."""
+        journal = GameJournal(self.path, self.game_state, writer=self.writer)
+        self.assertIs(self.game_state.journal, journal)
+        journal.close()
+        self.assertIsNone(self.game_state.journal)
+        self._play(1)
+        self.assertEqual(self._replay()[0].turns, [])
+
+        journal.discard()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_turn_index_beyond_a_byte(self: "TestGameJournal") -> None:
+        """Test that games of more than 256 turns are journaled."""
+        self.game_state.max_rounds = 300
+        GameJournal(self.path, self.game_state, compact_every=0,
+                    writer=self.writer)
+        self._play(260)
+        self.assertEqual(len(self._replay()[0].turns), 260)
+
+    def test_replay_invalid_data(self: "TestGameJournal") -> None:
+        """Test that data without a snapshot is rejected."""
+        with self.assertRaises(SaveFormatError):
+            game_journal.replay(b"SHSV")
+        with self.assertRaises(SaveFormatError):
+            game_journal.replay(b"SHJL\x01")
+        with self.assertRaises(SaveFormatError):
+            game_journal.replay(b"SHJL\x02")
+
+
+if __name__ == "__main__":
+    unittest.main()
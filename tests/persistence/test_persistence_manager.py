@@ -3,7 +3,12 @@
 import unittest
 import os
 import pickle
+import tempfile
+import threading
+from unittest.mock import patch
 from src.persistence.persistence_manager import PersistenceManager
+from src.persistence.save_format import SaveFormatError
+from src.persistence.save_writer import write_atomic
 from src.business_logic.game_state import GameState
 from src.business_logic.game_turn import GameTurn
 from src.util.color_code import ColorCode
@@ -15,8 +20,9 @@ class TestPersistenceManager(unittest.TestCase):
 
     def setUp(self: 'TestPersistenceManager') -> None:
         """Set up test fixtures before each test method."""
-        self.persistence_manager = PersistenceManager()
-        self.test_file = "test_save.pkl"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.persistence_manager = PersistenceManager(self.temp_dir.name)
+        self.test_file = "test_save.sav"
 
         # Create test game state with required secret_code
         self.game_state = GameState(
@@ -38,8 +44,8 @@ class TestPersistenceManager(unittest.TestCase):
 
     def tearDown(self: 'TestPersistenceManager') -> None:
         """Clean up after each test method."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        self.persistence_manager.close()
+        self.temp_dir.cleanup()
 
     def test_save_and_load_game_state(self: 'TestPersistenceManager') -> None:
         """Test saving and loading game state."""
@@ -51,6 +57,7 @@ class TestPersistenceManager(unittest.TestCase):
 
         # Save game state
         self.persistence_manager.save_game_state(self.game_state, self.test_file)
+        self.persistence_manager.flush()
         self.assertTrue(os.path.exists(file_path))  # Check correct path
 
         # Load and verify
@@ -68,7 +75,7 @@ class TestPersistenceManager(unittest.TestCase):
     def test_has_saved_game(self: 'TestPersistenceManager') -> None:
         """Test checking for saved game existence."""
         # Get full path to default save file
-        default_save = os.path.join(self.persistence_manager.save_dir, "game_state.pkl")
+        default_save = os.path.join(self.persistence_manager.save_dir, "game_state.sav")
 
         # Initially no save should exist
         if os.path.exists(default_save):
@@ -86,7 +93,7 @@ class TestPersistenceManager(unittest.TestCase):
     def test_load_non_existent_file(self: 'TestPersistenceManager') -> None:
         """Test loading from non-existent file."""
         with self.assertRaises(FileNotFoundError):
-            self.persistence_manager.load_game_state("non_existent.pkl")
+            self.persistence_manager.load_game_state("non_existent.sav")
 
     def test_save_invalid_game_state(self: 'TestPersistenceManager') -> None:
         """Test saving invalid game state."""
@@ -106,13 +113,145 @@ class TestPersistenceManager(unittest.TestCase):
             file.write(b"corrupted data")
 
         # Test loading corrupted file
-        with self.assertRaises(pickle.UnpicklingError):
+        with self.assertRaises(SaveFormatError):
             self.persistence_manager.load_game_state(self.test_file)
 
         # Cleanup
         if os.path.exists(file_path):
             os.remove(file_path)
 
+    def test_save_is_not_pickle(self: 'TestPersistenceManager') -> None:
+        """Test that games are saved in the binary save format."""
+        self.persistence_manager.save_game_state(self.game_state, self.test_file)
+        self.persistence_manager.flush()
+        file_path = os.path.join(self.persistence_manager.save_dir, self.test_file)
+        with open(file_path, "rb") as file:
+            self.assertEqual(file.read(4), b"SHSV")
+
+    def test_load_migrates_legacy_save(self: 'TestPersistenceManager') -> None:
+        """Test that a legacy pickle save is migrated on start."""
+        legacy_path = os.path.join(self.persistence_manager.save_dir,
+                                   "game_state.pkl")
+        with open(legacy_path, "wb") as file:
+            pickle.dump(self.game_state, file)
+        self.persistence_manager = PersistenceManager(self.temp_dir.name)
+        self.assertTrue(self.persistence_manager.has_saved_game())
+
+        loaded_state = self.persistence_manager.load_game_state()
+        self.assertEqual(loaded_state.secret_code, self.game_state.secret_code)
+        self.assertFalse(os.path.exists(legacy_path))
+        self.assertEqual(
+            self.persistence_manager.load_game_state().turns,
+            self.game_state.turns,
+        )
+
+    def test_slots(self: 'TestPersistenceManager') -> None:
+        """Test that every game is saved in its own slot."""
+        first = self.persistence_manager.new_save_slot("TestPlayer")
+        self.persistence_manager.save_game_state(self.game_state, first)
+        second = self.persistence_manager.new_save_slot("TestPlayer")
+        self.assertNotEqual(first, second)
+        self.game_state.add_turn(self.game_state.turns[0])
+        self.persistence_manager.save_game_state(self.game_state, second)
+
+        saves = self.persistence_manager.list_saved_games()
+        self.assertEqual({save.file_name for save in saves}, {first, second})
+        loaded_state = self.persistence_manager.load_game_state(first)
+        self.assertEqual(len(loaded_state.turns), 1)
+
+    def test_index_answers_without_files(self: 'TestPersistenceManager') -> None:
+        """Test that listing saves reads the index, not the save files."""
+        self.persistence_manager.save_game_state(self.game_state, self.test_file)
+        self.persistence_manager.flush()
+        os.remove(os.path.join(self.persistence_manager.save_dir, self.test_file))
+        self.assertTrue(self.persistence_manager.has_saved_game())
+
+        # Loading the vanished save drops it from the index
+        with self.assertRaises(FileNotFoundError):
+            self.persistence_manager.load_game_state(self.test_file)
+        self.assertFalse(self.persistence_manager.has_saved_game())
+
+    def test_journal_is_recovered(self: 'TestPersistenceManager') -> None:
+        """Test that the journal of a crashed game is saved on start."""
+        self.persistence_manager.start_journal(self.game_state)
+        journal_path = self.persistence_manager.journal.path
+        self.game_state.add_turn(GameTurn([ColorCode.BLUE] * 4,
+                                          [FeedbackColorCode.WHITE]))
+        self.assertFalse(self.persistence_manager.has_saved_game())
+
+        # A crash leaves the journal behind
+        self.persistence_manager.journal.close()
+        self.persistence_manager = PersistenceManager(self.temp_dir.name)
+        self.assertFalse(os.path.exists(journal_path))
+        saves = self.persistence_manager.list_saved_games()
+        self.assertEqual(len(saves), 1)
+        loaded_state = self.persistence_manager.load_game_state()
+        self.assertEqual(loaded_state.turns, self.game_state.turns)
+
+    def test_journal_recovers_into_save_slot(
+        self: 'TestPersistenceManager'
+    ) -> None:
+        """Test that a saved game is recovered into its own slot."""
+        self.persistence_manager.start_journal(self.game_state)
+        self.persistence_manager.save_game_state(self.game_state, self.test_file)
+        self.game_state.add_turn(GameTurn([ColorCode.BLUE] * 4, []))
+        self.persistence_manager.journal.close()
+        self.persistence_manager.flush()
+
+        self.persistence_manager = PersistenceManager(self.temp_dir.name)
+        saves = self.persistence_manager.list_saved_games()
+        self.assertEqual([save.file_name for save in saves], [self.test_file])
+        self.assertEqual(saves[0].turns, 2)
+
+    def test_end_journal(self: 'TestPersistenceManager') -> None:
+        """Test that ending the journal deletes it."""
+        self.persistence_manager.start_journal(self.game_state)
+        journal_path = self.persistence_manager.journal.path
+        self.persistence_manager.end_journal()
+        self.assertIsNone(self.persistence_manager.journal)
+        self.assertIsNone(self.game_state.journal)
+        self.assertFalse(os.path.exists(journal_path))
+
+    def test_saves_are_written_in_background(
+        self: 'TestPersistenceManager'
+    ) -> None:
+        """Test that saving returns before the save is written."""
+        file_path = os.path.join(self.persistence_manager.save_dir, self.test_file)
+        written = threading.Event()
+        release = threading.Event()
+
+        def slow_write(path: str, data: bytes) -> None:
+            """Write a file once the test allows it.
+
+            Args:
+                path: Path of the file
+                data: New content of the file
+            """
+            release.wait(5)
+            write_atomic(path, data)
+            written.set()
+
+        with patch("src.persistence.save_writer.write_atomic", slow_write):
+            self.persistence_manager.save_game_state(self.game_state,
+                                                     self.test_file)
+            self.assertFalse(os.path.exists(file_path))
+            self.assertFalse(self.persistence_manager.flush(0.01))
+            release.set()
+            self.assertTrue(self.persistence_manager.flush())
+        self.assertTrue(written.is_set())
+        loaded_state = self.persistence_manager.load_game_state(self.test_file)
+        self.assertEqual(loaded_state.turns, self.game_state.turns)
+
+    def test_archive_game(self: 'TestPersistenceManager') -> None:
+        """Test that finished games are recorded in the archive."""
+        self.persistence_manager.archive_game(self.game_state, "guesser", False,
+                                              [2.5])
+        archive = self.persistence_manager.get_archive()
+        self.assertEqual(archive.win_rate("TestPlayer"), 0.0)
+        self.assertEqual(archive.recent_games()[0].duration, 2.5)
+        self.persistence_manager.close()
+        self.assertEqual(archive.win_rate("TestPlayer"), 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
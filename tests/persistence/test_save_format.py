@@ -0,0 +1,139 @@
+"""Test module for the binary save format."""
+
+import io
+import struct
+import unittest
+import zlib
+
+from src.business_logic.game_state import MAX_ROUNDS, MAX_STRING_LENGTH, GameState
+from src.business_logic.game_turn import GameTurn
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.persistence import save_format
+from src.persistence.save_format import SaveFormatError, SaveMetadata
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+class TestSaveFormat(unittest.TestCase):
+    """Test cases for encoding and decoding saves."""
+
+    def setUp(self: "TestSaveFormat") -> None:
+        """Create a game state with two turns."""
+        self.secret_code = [ColorCode.RED, ColorCode.BLUE,
+                            ColorCode.GREEN, ColorCode.YELLOW]
+        self.game_state = GameState(self.secret_code, 10, 4, 6, "Spielerin Ä",
+                                    PlayerGuesser())
+        self.game_state.add_turn(GameTurn(
+            [ColorCode.RED] * 4, [FeedbackColorCode.BLACK]
+        ))
+        self.game_state.add_turn(GameTurn(
+            [ColorCode.BLUE, ColorCode.RED, ColorCode.RED, ColorCode.RED],
+            [FeedbackColorCode.WHITE, FeedbackColorCode.WHITE],
+        ))
+
+    def test_round_trip(self: "TestSaveFormat") -> None:
+        """Test that a decoded save equals the saved game state."""
+        restored = save_format.decode(save_format.encode(self.game_state))
+        self.assertEqual(restored.secret_code, self.secret_code)
+        self.assertEqual(restored.turns, self.game_state.turns)
+        self.assertEqual(restored.max_rounds, 10)
+        self.assertEqual(restored.positions, 4)
+        self.assertEqual(restored.colors, 6)
+        self.assertEqual(restored.player_name, "Spielerin Ä")
+        self.assertIsInstance(restored.current_guesser, PlayerGuesser)
+
+    def test_round_trip_computer_guesser(self: "TestSaveFormat") -> None:
+        """Test that a computer guesser is rebuilt from the turns."""
+        guesser = ComputerGuesser(4, 6, strategy="entropy", time_limit=2.5)
+        game_state = GameState(None, 10, 4, 6, "Test", guesser)
+        guess = guesser.make_guess()
+        feedback = [FeedbackColorCode.WHITE]
+        guesser.process_feedback(feedback)
+        game_state.add_turn(GameTurn(guess, feedback))
+
+        restored = save_format.decode(save_format.encode(game_state))
+        self.assertIsNone(restored.secret_code)
+        self.assertEqual(restored.current_guesser.strategy.name, "entropy")
+        self.assertEqual(restored.current_guesser.time_limit, 2.5)
+        self.assertEqual(list(restored.current_guesser.possible_codes),
+                         list(guesser.possible_codes))
+
+    def test_round_trip_feedback_pending(self: "TestSaveFormat") -> None:
+        """Test that pending feedback is told apart from no pins."""
+        self.game_state.add_turn(GameTurn([ColorCode.GREEN] * 4, []))
+        self.game_state.add_turn(GameTurn([ColorCode.YELLOW] * 4, None))
+        restored = save_format.decode(save_format.encode(self.game_state))
+        self.assertEqual(restored.turns, self.game_state.turns)
+        self.assertFalse(restored.turns[2].feedback_pending)
+        self.assertTrue(restored.turns[3].feedback_pending)
+
+    def test_size(self: "TestSaveFormat") -> None:
+        """Test that a save is a few bytes per turn."""
+        data = save_format.encode(self.game_state)
+        self.game_state.add_turn(GameTurn([ColorCode.RED] * 4, []))
+        self.assertEqual(len(save_format.encode(self.game_state)), len(data) + 5)
+
+    def test_encode_out_of_range(self: "TestSaveFormat") -> None:
+        """Test that games the header cannot hold are rejected."""
+        self.game_state.max_rounds = MAX_ROUNDS + 1
+        with self.assertRaises(SaveFormatError):
+            save_format.encode(self.game_state)
+        self.game_state.max_rounds = 10
+        self.game_state.player_name = "P" * (MAX_STRING_LENGTH + 1)
+        with self.assertRaises(SaveFormatError):
+            save_format.encode(self.game_state)
+
+    def test_checksum_mismatch(self: "TestSaveFormat") -> None:
+        """Test that a corrupted save is rejected."""
+        data = bytearray(save_format.encode(self.game_state))
+        data[save_format.HEADER.size] ^= 1
+        with self.assertRaises(SaveFormatError):
+            save_format.decode(bytes(data))
+
+    def test_truncated(self: "TestSaveFormat") -> None:
+        """Test that a truncated save is rejected."""
+        data = save_format.encode(self.game_state)
+        with self.assertRaises(SaveFormatError):
+            save_format.decode(data[:5])
+        # A valid checksum over a cut off body still fails to parse
+        body = data[:-save_format.CHECKSUM.size - 3]
+        with self.assertRaises(SaveFormatError):
+            save_format.decode(body + save_format.CHECKSUM.pack(zlib.crc32(body)))
+
+    def test_wrong_magic_and_version(self: "TestSaveFormat") -> None:
+        """Test that other files and future versions are rejected."""
+        data = save_format.encode(self.game_state)
+        with self.assertRaises(SaveFormatError):
+            save_format.decode(b"XXXX" + data[4:])
+        with self.assertRaises(SaveFormatError):
+            save_format.decode(data[:4] + struct.pack("<B", 99) + data[5:])
+
+    def test_read_metadata(self: "TestSaveFormat") -> None:
+        """Test that the metadata is read from the start of a save only."""
+        data = save_format.encode(self.game_state)
+        end = save_format.HEADER.size + 2 + len("Spielerin Ä".encode("utf-8"))
+        file = io.BytesIO(data[:end] + b"damaged body")
+        self.assertEqual(
+            save_format.read_metadata(file),
+            SaveMetadata("Spielerin Ä", 4, 6, 10, 2, "player"),
+        )
+        self.assertEqual(file.tell(), end)
+
+        self.game_state.current_guesser = None
+        metadata = save_format.read_metadata(
+            io.BytesIO(save_format.encode(self.game_state))
+        )
+        self.assertIsNone(metadata.guesser)
+
+    def test_read_metadata_invalid(self: "TestSaveFormat") -> None:
+        """Test that files without a save header have no metadata."""
+        data = save_format.encode(self.game_state)
+        for invalid in (data[:5], b"XXXX" + data[4:],
+                        data[:save_format.HEADER.size + 4]):
+            with self.assertRaises(SaveFormatError):
+                save_format.read_metadata(io.BytesIO(invalid))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Test module for the index of saved games."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from src.business_logic.game_state import GameState
+from src.business_logic.game_turn import GameTurn
+from src.persistence import save_format
+from src.persistence.save_format import SaveMetadata # noqa
+from src.persistence.save_index import INDEX_FILE, SaveIndex
+from src.util.color_code import ColorCode
+
+
+def read_metadata(path: str) -> SaveMetadata:
+    """Read the metadata of a save file.
+
+    Args:
+        path: Path of the save file
+
+    Returns:
+        SaveMetadata: Metadata of the save
+    """
+    with open(path, "rb") as file:
+        return save_format.read_metadata(file)
+
+
+class TestSaveIndex(unittest.TestCase):
+    """Test cases for SaveIndex."""
+
+    def setUp(self: "TestSaveIndex") -> None:
+        """Create an empty save directory and a game state."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.save_dir = self.temp_dir.name
+        self.game_state = GameState([ColorCode.RED] * 4, 10, 4, 6, "Anna Lena")
+        self.game_state.add_turn(GameTurn([ColorCode.BLUE] * 4, []))
+
+    def tearDown(self: "TestSaveIndex") -> None:
+        """Remove the save directory."""
+        self.temp_dir.cleanup()
+
+    def test_put_and_list(self: "TestSaveIndex") -> None:
+        """Test that saves are listed with metadata, most recent first."""
+        index = SaveIndex(self.save_dir, read_metadata)
+        index.put("a.sav", self.game_state, saved_at=1.0)
+        index.put("b.sav", self.game_state, saved_at=2.0)
+        saves = index.saves()
+        self.assertEqual([save.file_name for save in saves], ["b.sav", "a.sav"])
+        self.assertEqual(saves[0].player_name, "Anna Lena")
+        self.assertEqual(saves[0].turns, 1)
+        self.assertEqual((saves[0].positions, saves[0].colors), (4, 6))
+
+    def test_index_is_read_back(self: "TestSaveIndex") -> None:
+        """Test that a new index reads the stored entries."""
+        SaveIndex(self.save_dir, read_metadata).put("a.sav", self.game_state)
+        index = SaveIndex(self.save_dir, read_metadata)
+        self.assertEqual(list(index.entries), ["a.sav"])
+
+    def test_rebuild_from_saves(self: "TestSaveIndex") -> None:
+        """Test that a missing or corrupt index is rebuilt from the saves."""
+        with open(os.path.join(self.save_dir, "a.sav"), "wb") as file:
+            file.write(save_format.encode(self.game_state))
+        with open(os.path.join(self.save_dir, "broken.sav"), "wb") as file:
+            file.write(b"broken")
+        with open(os.path.join(self.save_dir, INDEX_FILE), "w") as file:
+            file.write("{not json")
+
+        index = SaveIndex(self.save_dir, read_metadata)
+        self.assertEqual(list(index.entries), ["a.sav"])
+        self.assertEqual(index.entries["a.sav"].player_name, "Anna Lena")
+        self.assertEqual(index.entries["a.sav"].turns, 1)
+        with open(os.path.join(self.save_dir, INDEX_FILE)) as file:
+            self.assertIn("a.sav", json.load(file)["saves"])
+
+    def test_remove(self: "TestSaveIndex") -> None:
+        """Test that a removed save is no longer listed."""
+        index = SaveIndex(self.save_dir, read_metadata)
+        index.put("a.sav", self.game_state)
+        index.remove("a.sav")
+        self.assertEqual(index.saves(), [])
+
+    def test_new_file_name(self: "TestSaveIndex") -> None:
+        """Test that new file names are unused and derived from the player."""
+        index = SaveIndex(self.save_dir, read_metadata)
+        self.assertEqual(index.new_file_name("Anna Lena"), "Anna_Lena_1.sav")
+        index.put("Anna_Lena_1.sav", self.game_state)
+        self.assertEqual(index.new_file_name("Anna Lena"), "Anna_Lena_2.sav")
+        self.assertEqual(index.new_file_name("???"), "game_1.sav")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Test module for the legacy save migration."""
+
+import copyreg
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.business_logic.game_state import GameState
+from src.business_logic.game_turn import GameTurn
+from src.business_logic.guesser.computer_guesser import ComputerGuesser
+from src.business_logic.guesser.player_guesser import PlayerGuesser
+from src.business_logic.solver.strategies import DEFAULT_STRATEGY
+from src.persistence.persistence_manager import PersistenceManager
+from src.persistence import save_format
+from src.persistence.save_migrator import MIGRATED_SUFFIX, migrate_legacy_save
+from src.util.color_code import ColorCode
+from src.util.feedback_color_code import FeedbackColorCode
+
+
+class _Legacy:
+    """Object pickled like an instance of a class before the binary saves.
+
+    Unpickling creates an instance of the class and fills its __dict__, or
+    calls its __setstate__, with the attributes as they were named then.
+    """
+
+    def __init__(self: "_Legacy", cls: type, attributes: dict) -> None:
+        """Initialize the stand-in.
+
+        Args:
+            cls: Class of the unpickled object
+            attributes: Attributes of the object in the old layout
+        """
+        self.cls = cls
+        self.attributes = attributes
+
+    def __reduce__(self: "_Legacy") -> tuple:
+        """Pickle the object the way the old class was pickled.
+
+        Returns:
+            tuple: Constructor, its arguments and the state
+        """
+        return copyreg._reconstructor, (self.cls, object, None), self.attributes
+
+
+def _legacy_game(guesser: object) -> _Legacy:
+    """Build a game state in the layout of the pickle saves.
+
+    Args:
+        guesser: The pickled guesser of the game
+
+    Returns:
+        _Legacy: The game state with two turns
+    """
+    turns = [
+        _Legacy(GameTurn, {"guesses": [ColorCode.RED, ColorCode.RED,
+                                       ColorCode.BLUE, ColorCode.BLUE],
+                           "feedback": [FeedbackColorCode.WHITE]}),
+        _Legacy(GameTurn, {"guesses": [ColorCode.GREEN] * 4,
+                           "feedback": []}),
+    ]
+    return _Legacy(GameState, {
+        "secret_code": [ColorCode.YELLOW] * 4,
+        "turns": turns,
+        "max_rounds": 10,
+        "current_guesser": guesser,
+        "positions": 4,
+        "colors": 6,
+        "player_name": "Legacy",
+    })
+
+
+def _legacy_computer_guesser() -> _Legacy:
+    """Build a computer guesser in the layout of the pickle saves.
+
+    Returns:
+        _Legacy: The guesser after its first guess
+    """
+    return _Legacy(ComputerGuesser, {
+        "positions": 4,
+        "colors": 6,
+        "possible_codes": {(ColorCode.YELLOW,) * 4},
+        "last_guess": [ColorCode.GREEN] * 4,
+        "first_guess": False,
+    })
+
+
+class TestSaveMigrator(unittest.TestCase):
+    """Test cases for migrate_legacy_save."""
+
+    def setUp(self: "TestSaveMigrator") -> None:
+        """Create a temporary directory for the saves."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.legacy_path = os.path.join(self.temp_dir.name, "game_state.pkl")
+        self.save_path = os.path.join(self.temp_dir.name, "game_state.sav")
+
+    def tearDown(self: "TestSaveMigrator") -> None:
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_migrate(self: "TestSaveMigrator") -> None:
+        """Test that a pickle save is converted and renamed."""
+        game_state = GameState([ColorCode.RED] * 4, 10, 4, 6, "Test")
+        game_state.add_turn(GameTurn([ColorCode.BLUE] * 4,
+                                     [FeedbackColorCode.WHITE]))
+        with open(self.legacy_path, "wb") as file:
+            pickle.dump(game_state, file)
+
+        migrated = migrate_legacy_save(self.legacy_path, self.save_path)
+        self.assertEqual(migrated.turns, game_state.turns)
+        self.assertTrue(os.path.exists(self.legacy_path + MIGRATED_SUFFIX))
+        with open(self.save_path, "rb") as file:
+            restored = save_format.decode(file.read())
+        self.assertEqual(restored.secret_code, game_state.secret_code)
+        self.assertEqual(restored.turns, game_state.turns)
+
+    def test_migrate_legacy_computer_guesser(self: "TestSaveMigrator") -> None:
+        """Test that the guesser of a legacy save is rebuilt."""
+        with open(self.legacy_path, "wb") as file:
+            pickle.dump(_legacy_game(_legacy_computer_guesser()), file)
+
+        migrated = migrate_legacy_save(self.legacy_path, self.save_path)
+        self.assertEqual(migrated.secret_code, [ColorCode.YELLOW] * 4)
+        self.assertEqual(len(migrated.turns), 2)
+        self.assertEqual(migrated.describe_guesser(), {
+            "type": "computer", "strategy": DEFAULT_STRATEGY, "time_limit": None,
+        })
+        with open(self.save_path, "rb") as file:
+            restored = save_format.decode(file.read())
+        self.assertIsInstance(restored.current_guesser, ComputerGuesser)
+        self.assertEqual(restored.turns, migrated.turns)
+
+    def test_migrate_legacy_player_guesser(self: "TestSaveMigrator") -> None:
+        """Test that a legacy player guesser stays a player guesser."""
+        with open(self.legacy_path, "wb") as file:
+            pickle.dump(_legacy_game(_Legacy(PlayerGuesser, {})), file)
+        migrated = migrate_legacy_save(self.legacy_path, self.save_path)
+        self.assertIsInstance(migrated.current_guesser, PlayerGuesser)
+
+    def test_unreadable_legacy_save_does_not_block_startup(
+        self: "TestSaveMigrator"
+    ) -> None:
+        """Test that the manager starts even if migration fails."""
+        with open(self.legacy_path, "wb") as file:
+            pickle.dump(_Legacy(GameState, {"secret_code": None}), file)
+        manager = PersistenceManager(self.temp_dir.name)
+        self.assertFalse(manager.has_saved_game())
+        self.assertTrue(os.path.exists(self.legacy_path))
+        manager.close()
+
+    def test_migrate_rejects_other_objects(self: "TestSaveMigrator") -> None:
+        """Test that a pickle without a game state is not migrated."""
+        with open(self.legacy_path, "wb") as file:
+            pickle.dump({"not": "a game"}, file)
+        with self.assertRaises(TypeError):
+            migrate_legacy_save(self.legacy_path, self.save_path)
+        self.assertFalse(os.path.exists(self.save_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
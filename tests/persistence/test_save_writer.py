@@ -0,0 +1,194 @@
+"""Test module for the background save writer."""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.persistence.save_writer import SaveWriter, write_atomic
+
+
+class TestSaveWriter(unittest.TestCase):
+    """Test cases for write_atomic and SaveWriter."""
+
+    def setUp(self: "TestSaveWriter") -> None:
+        """Create a temporary directory for the files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "game.sav")
+        self.writer = SaveWriter()
+
+    def tearDown(self: "TestSaveWriter") -> None:
+        """Wait for the writer and remove the temporary directory."""
+        self.writer.flush()
+        self.temp_dir.cleanup()
+
+    def _read(self: "TestSaveWriter") -> bytes:
+        """Read the written file.
+
+        Returns:
+            bytes: Content of the file
+        """
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def test_write_atomic(self: "TestSaveWriter") -> None:
+        """Test that a file is replaced without leaving temporary files."""
+        write_atomic(self.path, b"old")
+        write_atomic(self.path, b"new")
+        self.assertEqual(self._read(), b"new")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["game.sav"])
+
+    def test_interrupted_write_keeps_file(self: "TestSaveWriter") -> None:
+        """Test that a failed write leaves the previous content intact."""
+        write_atomic(self.path, b"old")
+        with patch("src.persistence.save_writer.os.replace",
+                   side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, b"new")
+        self.assertEqual(self._read(), b"old")
+        self.assertEqual(os.listdir(self.temp_dir.name), ["game.sav"])
+
+    def test_submit_and_flush(self: "TestSaveWriter") -> None:
+        """Test that submitted files are written by flush."""
+        self.writer.submit(self.path, b"data")
+        self.assertTrue(self.writer.flush())
+        self.assertEqual(self._read(), b"data")
+        self.assertTrue(self.writer.flush())
+
+    def test_coalescing(self: "TestSaveWriter") -> None:
+        """Test that saves queued during a write are written once."""
+        started = threading.Event()
+        release = threading.Event()
+        writes = []
+
+        def blocking_write(path: str, data: bytes) -> None:
+            """Record a write once the test allows it.
+
+            Args:
+                path: Path of the file
+                data: New content of the file
+            """
+            started.set()
+            release.wait(5)
+            writes.append(data)
+
+        with patch("src.persistence.save_writer.write_atomic", blocking_write):
+            self.writer.submit(self.path, b"1")
+            started.wait(5)
+            for data in (b"2", b"3", b"4"):
+                self.writer.submit(self.path, data)
+            release.set()
+            self.writer.flush()
+        self.assertEqual(writes, [b"1", b"4"])
+        self.assertEqual(self.writer.writes, 2)
+
+    def test_append(self: "TestSaveWriter") -> None:
+        """Test that appends follow the content submitted before them."""
+        self.writer.submit(self.path, b"head")
+        self.writer.append(self.path, b"1")
+        self.writer.append(self.path, b"2", sync=False)
+        self.writer.flush()
+        self.writer.append(self.path, b"3")
+        self.writer.flush()
+        self.assertEqual(self._read(), b"head123")
+        self.writer.submit(self.path, b"new")
+        self.writer.flush()
+        self.assertEqual(self._read(), b"new")
+
+    def test_appends_are_batched(self: "TestSaveWriter") -> None:
+        """Test that appends queued during a write are synced together."""
+        started = threading.Event()
+        release = threading.Event()
+        appends = []
+
+        def blocking_append(path: str, data: bytes, sync: bool) -> None:
+            """Record an append once the test allows it.
+
+            Args:
+                path: Path of the file
+                data: Data to append
+                sync: True to sync the file afterwards
+            """
+            started.set()
+            release.wait(5)
+            appends.append((data, sync))
+
+        with patch("src.persistence.save_writer.append_file", blocking_append):
+            self.writer.append(self.path, b"1", sync=False)
+            started.wait(5)
+            self.writer.append(self.path, b"2")
+            self.writer.append(self.path, b"3", sync=False)
+            release.set()
+            self.writer.flush()
+        self.assertEqual(appends, [(b"1", False), (b"23", True)])
+
+    def test_remove(self: "TestSaveWriter") -> None:
+        """Test that removing a file drops its pending writes."""
+        write_atomic(self.path, b"old")
+        release = threading.Event()
+
+        def blocking_write(path: str, data: bytes) -> None:
+            """Hold the worker until the test allows it.
+
+            Args:
+                path: Path of the file
+                data: New content of the file
+            """
+            release.wait(5)
+
+        other = os.path.join(self.temp_dir.name, "other.sav")
+        with patch("src.persistence.save_writer.write_atomic", blocking_write):
+            self.writer.submit(other, b"other")
+            self.writer.append(self.path, b"new")
+            self.writer.remove(self.path)
+            release.set()
+            self.writer.flush()
+        self.assertFalse(os.path.exists(self.path))
+        self.writer.remove(self.path)
+
+    def test_flush_raises_write_error(self: "TestSaveWriter") -> None:
+        """Test that a failed background write is reported by flush."""
+        self.writer.submit(os.path.join(self.path, "missing", "x"), b"data")
+        with self.assertRaises(OSError):
+            self.writer.flush()
+        self.assertTrue(self.writer.flush())
+        self.assertEqual((self.writer.writes, self.writer.failures), (0, 1))
+
+    def test_flush_raises_any_write_error(self: "TestSaveWriter") -> None:
+        """Test that errors other than OSError are reported by flush."""
+        with patch("src.persistence.save_writer.write_atomic",
+                   side_effect=RuntimeError("broken")):
+            self.writer.submit(self.path, b"data")
+            with self.assertRaises(RuntimeError):
+                self.writer.flush(timeout=5)
+        self.writer.submit(self.path, b"again")
+        self.assertTrue(self.writer.flush(timeout=5))
+        self.assertEqual(self._read(), b"again")
+
+    def test_failing_worker_wakes_flush(self: "TestSaveWriter") -> None:
+        """Test that flush returns even if the worker itself fails."""
+
+        class BrokenQueue(dict):
+            """Queue failing when the worker takes a file from it."""
+
+            def pop(self: "BrokenQueue", key: str) -> bytes:
+                """Fail instead of taking the file.
+
+                Args:
+                    key: Path of the file
+
+                Raises:
+                    RuntimeError: Always
+                """
+                raise RuntimeError("broken queue")
+
+        self.writer._pending = BrokenQueue()
+        with patch("threading.excepthook"):
+            self.writer.submit(self.path, b"data")
+            self.assertTrue(self.writer.flush(timeout=5))
+        self.writer._pending = {}
+
+
+if __name__ == "__main__":
+    unittest.main()
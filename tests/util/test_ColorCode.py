@@ -51,6 +51,19 @@ class TestColorCode(unittest.TestCase):
         self.assertNotEqual(ColorCode.RED, ColorCode.GREEN)
         self.assertNotEqual(ColorCode.RED, ColorCode.BLUE)
 
+    def test_from_value(self: "TestColorCode") -> None:
+        """Test the fast lookup of a color by its value."""
+        for color in ColorCode:
+            self.assertIs(ColorCode.from_value(color.value), color)
+        for value in (0, 9, None):
+            with self.assertRaises(ValueError):
+                ColorCode.from_value(value)
+
+    def test_get_colored_value(self: "TestColorCode") -> None:
+        """Test the colored pin of a color."""
+        self.assertEqual(ColorCode.RED.get_colored_value(), "\033[31m1\033[0m")
+        self.assertEqual(ColorCode.BLACK.get_colored_value(), "\033[90m8\033[0m")
+
 
 if __name__ == "__main__":
     unittest.main()
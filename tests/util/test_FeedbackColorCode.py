@@ -33,6 +33,18 @@ class TestFeedbackColorCode(unittest.TestCase):
         self.assertEqual(FeedbackColorCode.BLACK, FeedbackColorCode.BLACK)
         self.assertNotEqual(FeedbackColorCode.WHITE, FeedbackColorCode.BLACK)
 
+    def test_from_value(self: "TestFeedbackColorCode") -> None:
+        """Test the fast lookup of a feedback color by its value."""
+        self.assertIs(FeedbackColorCode.from_value(7), FeedbackColorCode.WHITE)
+        self.assertIs(FeedbackColorCode.from_value(8), FeedbackColorCode.BLACK)
+        with self.assertRaises(ValueError):
+            FeedbackColorCode.from_value(1)
+
+    def test_get_colored_value(self: "TestFeedbackColorCode") -> None:
+        """Test the colored pin of a feedback color."""
+        self.assertEqual(FeedbackColorCode.WHITE.get_colored_value(),
+                         "\033[97m7\033[0m")
+
 
 if __name__ == "__main__":
     unittest.main()